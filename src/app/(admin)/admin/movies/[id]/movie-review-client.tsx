@@ -2,7 +2,6 @@
 
 import { useState } from "react";
 import { useRouter } from "next/navigation";
-import { createClient } from "@/lib/supabase/client";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
@@ -45,7 +44,6 @@ interface MovieReviewClientProps {
 
 export default function MovieReviewClient({ movie, embedUrl, thumbnailUrl }: MovieReviewClientProps) {
     const router = useRouter();
-    const supabase = createClient();
 
     const [isLoading, setIsLoading] = useState(false);
     const [isSyncing, setIsSyncing] = useState(false);
@@ -82,15 +80,13 @@ export default function MovieReviewClient({ movie, embedUrl, thumbnailUrl }: Mov
     const handleApprove = async () => {
         setIsLoading(true);
         try {
-            const { error } = await supabase
-                .from("movies")
-                .update({
-                    status: "approved",
-                    reviewed_at: new Date().toISOString(),
-                })
-                .eq("id", movie.id);
+            const res = await fetch(`/api/movies/${movie.id}/review`, {
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ action: "approve" }),
+            });
 
-            if (error) throw error;
+            if (!res.ok) throw new Error((await res.json()).error);
 
             router.push("/admin/movies");
             router.refresh();
@@ -110,16 +106,13 @@ export default function MovieReviewClient({ movie, embedUrl, thumbnailUrl }: Mov
 
         setIsLoading(true);
         try {
-            const { error } = await supabase
-                .from("movies")
-                .update({
-                    status: "rejected",
-                    rejection_reason: rejectReason,
-                    reviewed_at: new Date().toISOString(),
-                })
-                .eq("id", movie.id);
+            const res = await fetch(`/api/movies/${movie.id}/review`, {
+                method: "POST",
+                headers: { "Content-Type": "application/json" },
+                body: JSON.stringify({ action: "reject", reason: rejectReason }),
+            });
 
-            if (error) throw error;
+            if (!res.ok) throw new Error((await res.json()).error);
 
             router.push("/admin/movies");
             router.refresh();
@@ -330,6 +323,7 @@ export default function MovieReviewClient({ movie, embedUrl, thumbnailUrl }: Mov
                             </CardHeader>
                             <CardContent className="space-y-3">
                                 <Button
+                                    data-testid="review-approve"
                                     onClick={handleApprove}
                                     isLoading={isLoading}
                                     className="w-full bg-green-600 hover:bg-green-700"
@@ -338,6 +332,7 @@ export default function MovieReviewClient({ movie, embedUrl, thumbnailUrl }: Mov
                                     Onayla
                                 </Button>
                                 <Button
+                                    data-testid="review-reject"
                                     onClick={() => setShowRejectModal(true)}
                                     variant="outline"
                                     className="w-full border-red-500/30 text-red-400 hover:bg-red-500/10"
@@ -386,6 +381,7 @@ export default function MovieReviewClient({ movie, embedUrl, thumbnailUrl }: Mov
                                 İptal
                             </Button>
                             <Button
+                                data-testid="review-reject-confirm"
                                 onClick={handleReject}
                                 isLoading={isLoading}
                                 className="flex-1 bg-red-600 hover:bg-red-700"
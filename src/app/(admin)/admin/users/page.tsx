@@ -1,15 +1,44 @@
+import Link from "next/link";
 import { createClient } from "@/lib/supabase/server";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
-import { User, Shield, Film as FilmIcon, Calendar } from "lucide-react";
+import { User, Shield, Film as FilmIcon, Calendar, ChevronRight } from "lucide-react";
+import { DEFAULT_PAGE_SIZE, InvalidCursorError, afterCursor, decodeCursor, toPage } from "@/lib/pagination";
 
-export default async function AdminUsersPage() {
+const PAGE_SIZE = DEFAULT_PAGE_SIZE * 2;
+
+interface PageProps {
+    searchParams: Promise<{ cursor?: string }>;
+}
+
+function readCursor(cursor: string | undefined) {
+    try {
+        return decodeCursor(cursor);
+    } catch (error) {
+        // A mangled link shows the first page
+        if (error instanceof InvalidCursorError) return null;
+        throw error;
+    }
+}
+
+export default async function AdminUsersPage({ searchParams }: PageProps) {
+    const { cursor } = await searchParams;
+    const after = readCursor(cursor);
     const supabase = await createClient();
 
-    const { data: users } = await supabase
+    // One page, newest first, keyset-paginated on (created_at, id). The
+    // total is the planner's estimate on large tables, so it costs no scan.
+    let query = supabase
         .from("profiles")
-        .select("*")
-        .order("created_at", { ascending: false });
+        .select("id, email, full_name, role, created_at", { count: "estimated" });
+    if (after) query = query.or(afterCursor("created_at", after));
+
+    const { data, count } = await query
+        .order("created_at", { ascending: false })
+        .order("id", { ascending: false })
+        .limit(PAGE_SIZE + 1);
+
+    const { items: users, nextCursor } = toPage(data || [], PAGE_SIZE, (user) => user.created_at);
 
     const roleColors: Record<string, string> = {
         viewer: "bg-blue-500/10 text-blue-400",
@@ -27,10 +56,10 @@ export default async function AdminUsersPage() {
 
             <Card variant="glass">
                 <CardHeader>
-                    <CardTitle className="text-lg">Tüm Kullanıcılar ({users?.length || 0})</CardTitle>
+                    <CardTitle className="text-lg">Tüm Kullanıcılar ({count ?? users.length})</CardTitle>
                 </CardHeader>
                 <CardContent>
-                    {users && users.length > 0 ? (
+                    {users.length > 0 ? (
                         <div className="space-y-3">
                             {users.map((user) => (
                                 <div
@@ -39,11 +68,11 @@ export default async function AdminUsersPage() {
                                 >
                                     <div className="flex items-center gap-4">
                                         <div className="w-10 h-10 rounded-full bg-gradient-to-br from-violet-500 to-purple-600 flex items-center justify-center text-white font-bold">
-                                            {user.display_name?.[0]?.toUpperCase() || user.email?.[0]?.toUpperCase() || "?"}
+                                            {user.full_name?.[0]?.toUpperCase() || user.email?.[0]?.toUpperCase() || "?"}
                                         </div>
                                         <div>
                                             <p className="font-medium text-white">
-                                                {user.display_name || user.full_name || "İsimsiz"}
+                                                {user.full_name || "İsimsiz"}
                                             </p>
                                             <p className="text-sm text-slate-500">{user.email}</p>
                                         </div>
@@ -68,6 +97,25 @@ export default async function AdminUsersPage() {
                             <p className="text-slate-400">Henüz kullanıcı yok</p>
                         </div>
                     )}
+                    {(after || nextCursor) && (
+                        <div className="flex items-center justify-between mt-6 text-sm">
+                            {after ? (
+                                <Link href="/admin/users" className="text-slate-400 hover:text-white transition-colors">
+                                    İlk sayfa
+                                </Link>
+                            ) : <span />}
+                            {nextCursor && (
+                                <Link
+                                    data-testid="admin-users-next"
+                                    href={`/admin/users?cursor=${encodeURIComponent(nextCursor)}`}
+                                    className="flex items-center gap-1 text-violet-400 hover:text-violet-300 transition-colors"
+                                >
+                                    Sonraki sayfa
+                                    <ChevronRight className="w-4 h-4" />
+                                </Link>
+                            )}
+                        </div>
+                    )}
                 </CardContent>
             </Card>
         </div>
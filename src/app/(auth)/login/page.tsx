@@ -162,6 +162,7 @@ function LoginContent() {
                                     type="email"
                                     placeholder="ornek@email.com"
                                     value={email}
+                                    data-testid="login-email"
                                     onChange={(e) => setEmail(e.target.value)}
                                     className="w-full h-13 pl-12 pr-4 rounded-xl text-[#F5F3FF] placeholder:text-[#6B5F7C] transition-all duration-300 focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50"
                                     style={{
@@ -187,6 +188,7 @@ function LoginContent() {
                                     type={showPassword ? "text" : "password"}
                                     placeholder="••••••••"
                                     value={password}
+                                    data-testid="login-password"
                                     onChange={(e) => setPassword(e.target.value)}
                                     className="w-full h-13 pl-12 pr-12 rounded-xl text-[#F5F3FF] placeholder:text-[#6B5F7C] transition-all duration-300 focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50"
                                     style={{
@@ -197,6 +199,7 @@ function LoginContent() {
                                 />
                                 <button
                                     type="button"
+                                    data-testid="login-toggle-password"
                                     onClick={() => setShowPassword(!showPassword)}
                                     className="absolute right-4 top-1/2 -translate-y-1/2 text-[#6B5F7C] hover:text-[#A855F7] transition-colors"
                                 >
@@ -222,6 +225,7 @@ function LoginContent() {
 
                         {/* Submit Button */}
                         <motion.button
+                            data-testid="login-submit"
                             type="submit"
                             disabled={isLoading}
                             className="relative w-full h-13 rounded-xl font-semibold text-white overflow-hidden group disabled:opacity-50 disabled:cursor-not-allowed"
@@ -130,6 +130,7 @@ export default function SignupPage() {
                         >
                             <Link href="/login">
                                 <button
+                                    data-testid="signup-back-to-login"
                                     className="w-full h-12 rounded-xl font-medium transition-all duration-300"
                                     style={{
                                         background: "rgba(139, 92, 246, 0.1)",
@@ -232,6 +233,7 @@ export default function SignupPage() {
                                 <input
                                     type="text"
                                     placeholder="Adınız ve soyadınız"
+                                    data-testid="signup-full-name"
                                     value={fullName}
                                     onChange={(e) => setFullName(e.target.value)}
                                     className="w-full h-13 pl-12 pr-4 rounded-xl text-[#F5F3FF] placeholder:text-[#6B5F7C] transition-all duration-300 focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50"
@@ -257,6 +259,7 @@ export default function SignupPage() {
                                 <input
                                     type="email"
                                     placeholder="ornek@email.com"
+                                    data-testid="signup-email"
                                     value={email}
                                     onChange={(e) => setEmail(e.target.value)}
                                     className="w-full h-13 pl-12 pr-4 rounded-xl text-[#F5F3FF] placeholder:text-[#6B5F7C] transition-all duration-300 focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50"
@@ -282,6 +285,7 @@ export default function SignupPage() {
                                 <input
                                     type={showPassword ? "text" : "password"}
                                     placeholder="••••••••"
+                                    data-testid="signup-password"
                                     value={password}
                                     onChange={(e) => setPassword(e.target.value)}
                                     className="w-full h-13 pl-12 pr-12 rounded-xl text-[#F5F3FF] placeholder:text-[#6B5F7C] transition-all duration-300 focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50"
@@ -340,6 +344,7 @@ export default function SignupPage() {
                                 <input
                                     type={showPassword ? "text" : "password"}
                                     placeholder="••••••••"
+                                    data-testid="signup-confirm-password"
                                     value={confirmPassword}
                                     onChange={(e) => setConfirmPassword(e.target.value)}
                                     className="w-full h-13 pl-12 pr-4 rounded-xl text-[#F5F3FF] placeholder:text-[#6B5F7C] transition-all duration-300 focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50"
@@ -363,6 +368,7 @@ export default function SignupPage() {
 
                         {/* Submit Button */}
                         <motion.button
+                            data-testid="signup-submit"
                             type="submit"
                             disabled={isLoading}
                             className="relative w-full h-13 rounded-xl font-semibold text-white overflow-hidden group disabled:opacity-50 disabled:cursor-not-allowed mt-6"
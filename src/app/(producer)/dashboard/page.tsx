@@ -1,5 +1,5 @@
 import Link from "next/link";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { getProducerAnalytics } from "@/lib/analytics/analytics-service";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent, CardHeader, CardTitle } from "@/components/ui/card";
@@ -21,7 +21,7 @@ import { ViewsChart } from "@/components/producer/views-chart";
 export default async function DashboardPage() {
     const supabase = await createClient();
 
-    const { data: { user } } = await supabase.auth.getUser();
+    const user = await getVerifiedUser();
 
     if (!user) {
         return null;
@@ -195,7 +195,7 @@ export default async function DashboardPage() {
                 <Card variant="glass">
                     <CardHeader className="flex flex-row items-center justify-between">
                         <CardTitle className="text-lg">Son Filmlerim</CardTitle>
-                        <Link href="/movies" className="text-sm text-violet-400 hover:text-violet-300">
+                        <Link href="/movies" data-testid="dashboard-recent-movies-all" className="text-sm text-violet-400 hover:text-violet-300">
                             Tümünü Gör →
                         </Link>
                     </CardHeader>
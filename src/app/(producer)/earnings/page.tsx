@@ -1,4 +1,4 @@
-import { createClient } from "@/lib/supabase/server";
+import { getVerifiedUser } from "@/lib/supabase/server";
 import { getProducerAnalytics } from "@/lib/analytics/analytics-service";
 import { Card, CardContent, CardHeader, CardTitle, CardDescription } from "@/components/ui/card";
 import {
@@ -14,8 +14,7 @@ import {
 } from "lucide-react";
 
 export default async function EarningsPage() {
-    const supabase = await createClient();
-    const { data: { user } } = await supabase.auth.getUser();
+    const user = await getVerifiedUser();
 
     if (!user) {
         return null;
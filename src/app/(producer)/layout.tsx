@@ -1,7 +1,7 @@
 import { ReactNode } from "react";
 import Link from "next/link";
 import { redirect } from "next/navigation";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import {
     Film,
     LayoutDashboard,
@@ -23,7 +23,7 @@ const navItems = [
 export default async function ProducerLayout({ children }: { children: ReactNode }) {
     const supabase = await createClient();
 
-    const { data: { user } } = await supabase.auth.getUser();
+    const user = await getVerifiedUser();
 
     if (!user) {
         redirect("/login");
@@ -46,7 +46,7 @@ export default async function ProducerLayout({ children }: { children: ReactNode
             <aside className="hidden lg:flex w-72 flex-col border-r border-[#7C3AED]/10" style={{ background: "rgba(21, 10, 36, 0.8)" }}>
                 {/* Logo */}
                 <div className="p-6 border-b border-[#7C3AED]/10">
-                    <Link href="/" className="inline-flex items-center gap-3 text-xl font-bold text-white">
+                    <Link href="/" data-testid="producer-sidebar-logo" className="inline-flex items-center gap-3 text-xl font-bold text-white">
                         <Film className="w-8 h-8 text-[#A855F7]" />
                         <span className="text-gradient headline-serif text-2xl">
                             Mafilu
@@ -61,6 +61,7 @@ export default async function ProducerLayout({ children }: { children: ReactNode
                         <Link
                             key={item.href}
                             href={item.href}
+                            data-testid={`producer-nav${item.href.replace("/", "-")}`}
                             className="group flex items-center gap-3 px-4 py-3.5 rounded-xl text-[#A197B0] hover:text-white transition-all duration-300 relative overflow-hidden"
                             style={{
                                 background: "transparent",
@@ -661,6 +661,7 @@ export default function EditMoviePage() {
                             <Button
                                 variant="outline"
                                 className="w-full"
+                                data-testid="movie-edit-save"
                                 onClick={handleSave}
                                 isLoading={isSaving}
                             >
@@ -671,6 +672,7 @@ export default function EditMoviePage() {
                             {movie?.status === "draft" && (
                                 <Button
                                     className="w-full"
+                                    data-testid="movie-edit-submit-review"
                                     onClick={handleSubmitForReview}
                                     isLoading={isSaving}
                                 >
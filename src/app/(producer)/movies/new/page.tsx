@@ -121,6 +121,7 @@ export default function NewMoviePage() {
                             </CardHeader>
                             <CardContent className="space-y-4">
                                 <Input
+                                    data-testid="movie-form-title"
                                     label="Film Adı"
                                     placeholder="Örn: Kayıp Şehir"
                                     value={title}
@@ -131,6 +132,7 @@ export default function NewMoviePage() {
                                 <div className="space-y-2">
                                     <label className="text-sm font-medium text-slate-300">Açıklama</label>
                                     <textarea
+                                        data-testid="movie-form-description"
                                         className="flex w-full rounded-lg border border-slate-700 bg-slate-900/50 px-4 py-3 text-sm text-slate-100 placeholder:text-slate-500 focus:outline-none focus:ring-2 focus:ring-violet-500 focus:border-transparent transition-all duration-200 min-h-[120px] resize-none"
                                         placeholder="Filminizin konusu ve hikayesi hakkında kısa bir açıklama yazın..."
                                         value={description}
@@ -157,6 +159,7 @@ export default function NewMoviePage() {
                                     </div>
 
                                     <Input
+                                        data-testid="movie-form-year"
                                         label="Yapım Yılı"
                                         type="number"
                                         min="1900"
@@ -167,6 +170,7 @@ export default function NewMoviePage() {
                                 </div>
 
                                 <Input
+                                    data-testid="movie-form-tags"
                                     label="Etiketler"
                                     placeholder="bağımsız, ödüllü, gerilim (virgülle ayırın)"
                                     value={tags}
@@ -185,6 +189,7 @@ export default function NewMoviePage() {
                             </CardHeader>
                             <CardContent className="space-y-3">
                                 <Button
+                                    data-testid="movie-form-save-draft"
                                     type="submit"
                                     variant="outline"
                                     className="w-full"
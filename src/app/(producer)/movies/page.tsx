@@ -1,6 +1,6 @@
 import Link from "next/link";
 import Image from "next/image";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { Button } from "@/components/ui/button";
 import { Card, CardContent } from "@/components/ui/card";
 import {
@@ -17,7 +17,7 @@ import {
 export default async function MoviesPage() {
     const supabase = await createClient();
 
-    const { data: { user } } = await supabase.auth.getUser();
+    const user = await getVerifiedUser();
 
     const { data: movies } = await supabase
         .from("movies")
@@ -96,12 +96,14 @@ export default async function MoviesPage() {
                                     {/* Hover overlay */}
                                     <div className="absolute inset-0 bg-black/60 opacity-0 group-hover:opacity-100 transition-opacity flex items-center justify-center gap-3">
                                         <Link
+                                            data-testid="movies-card-view"
                                             href={`/movies/${movie.id}`}
                                             className="p-2 rounded-full bg-white/10 hover:bg-white/20 text-white transition-colors"
                                         >
                                             <Eye className="w-5 h-5" />
                                         </Link>
                                         <Link
+                                            data-testid="movies-card-edit"
                                             href={`/movies/${movie.id}/edit`}
                                             className="p-2 rounded-full bg-white/10 hover:bg-white/20 text-white transition-colors"
                                         >
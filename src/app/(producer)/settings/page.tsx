@@ -187,12 +187,14 @@ export default function SettingsPage() {
                 <CardContent className="space-y-4">
                     <div className="grid sm:grid-cols-2 gap-4">
                         <Input
+                            data-testid="settings-full-name"
                             label="Ad Soyad"
                             placeholder="Adınız ve soyadınız"
                             value={fullName}
                             onChange={(e) => setFullName(e.target.value)}
                         />
                         <Input
+                            data-testid="settings-username"
                             label="Görünen Ad"
                             placeholder="@kullaniciadi"
                             value={displayName}
@@ -202,6 +204,7 @@ export default function SettingsPage() {
                     <div className="space-y-2">
                         <label className="text-sm font-medium text-[#C4B5FD]">Biyografi</label>
                         <textarea
+                            data-testid="settings-bio"
                             className="flex w-full rounded-xl px-4 py-3 text-sm text-[#F5F3FF] placeholder:text-[#6B5F7C] focus:outline-none focus:ring-2 focus:ring-[#7C3AED]/50 transition-all duration-200 min-h-[100px] resize-none"
                             style={{
                                 background: "rgba(21, 10, 36, 0.6)",
@@ -213,13 +216,14 @@ export default function SettingsPage() {
                         />
                     </div>
                     <Input
+                        data-testid="settings-website"
                         label="Website"
                         placeholder="https://yourwebsite.com"
                         value={website}
                         onChange={(e) => setWebsite(e.target.value)}
                     />
                     <div className="pt-4 flex justify-end">
-                        <Button onClick={handleSaveProfile} isLoading={isLoading}>
+                        <Button data-testid="settings-profile-save" onClick={handleSaveProfile} isLoading={isLoading}>
                             <Save className="w-4 h-4" />
                             Kaydet
                         </Button>
@@ -244,6 +248,7 @@ export default function SettingsPage() {
                     <div className="grid sm:grid-cols-2 gap-4">
                         <div className="relative">
                             <Input
+                                data-testid="settings-bank-name"
                                 label="Banka Adı"
                                 placeholder="Örn: Garanti BBVA"
                                 value={bankName}
@@ -251,6 +256,7 @@ export default function SettingsPage() {
                             />
                         </div>
                         <Input
+                            data-testid="settings-tax-id"
                             label="Vergi Kimlik No"
                             placeholder="Vergi kimlik numaranız"
                             value={taxId}
@@ -258,6 +264,7 @@ export default function SettingsPage() {
                         />
                     </div>
                     <Input
+                        data-testid="settings-iban"
                         label="IBAN"
                         placeholder="TR00 0000 0000 0000 0000 0000 00"
                         value={iban}
@@ -273,7 +280,7 @@ export default function SettingsPage() {
                         </p>
                     </div>
                     <div className="pt-4 flex justify-end">
-                        <Button onClick={handleSavePayment} isLoading={isLoading}>
+                        <Button data-testid="settings-payment-save" onClick={handleSavePayment} isLoading={isLoading}>
                             <Save className="w-4 h-4" />
                             Kaydet
                         </Button>
@@ -328,6 +335,7 @@ export default function SettingsPage() {
                                 <p className="text-sm text-[#6B5F7C]">{item.description}</p>
                             </div>
                             <button
+                                data-testid={`settings-notification-${item.id}`}
                                 onClick={() => item.onChange(!item.checked)}
                                 className={`w-12 h-7 rounded-full transition-all duration-300 relative ${item.checked ? "bg-[#7C3AED]" : "bg-[#2B0F3F]"
                                     }`}
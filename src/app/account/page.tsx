@@ -1,14 +1,14 @@
 import { redirect } from "next/navigation";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { AccountClient } from "./account-client";
 
 export default async function AccountPage() {
   const supabase = await createClient();
   
   // Server-side auth check
-  const { data: { user }, error: authError } = await supabase.auth.getUser();
+  const user = await getVerifiedUser();
 
-  if (!user || authError) {
+  if (!user) {
     redirect("/login");
   }
 
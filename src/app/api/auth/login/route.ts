@@ -1,5 +1,6 @@
 import { NextResponse } from "next/server";
 import { createClient } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
 
 /**
  * POST /api/auth/login
@@ -7,7 +8,7 @@ import { createClient } from "@/lib/supabase/server";
  * Login endpoint for API authentication
  * Note: This is a convenience endpoint. The main auth flow uses Supabase directly.
  */
-export async function POST(request: Request) {
+export const POST = withServerTiming(async function POST(request: Request) {
     try {
         const { email, password } = await request.json();
 
@@ -43,5 +44,5 @@ export async function POST(request: Request) {
             { status: 500 }
         );
     }
-}
+});
 
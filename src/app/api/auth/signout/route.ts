@@ -1,12 +1,18 @@
 import { NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { revokeSession } from "@/lib/supabase/verify";
+import { withServerTiming } from "@/lib/server-timing";
 
-export async function POST() {
+export const POST = withServerTiming(async function POST() {
     const supabase = await createClient();
+    const user = await getVerifiedUser();
 
     await supabase.auth.signOut();
+    // Tokens of this session still verify locally until they expire. This
+    // only reaches handlers; the middleware finds out at its next recheck.
+    revokeSession(user?.session_id);
 
     return NextResponse.redirect(new URL("/", process.env.NEXT_PUBLIC_APP_URL || "http://localhost:3000"), {
         status: 302,
     });
-}
+});
@@ -1,14 +1,15 @@
 import { NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { createCheckoutSession, getAvailableProviders } from "@/lib/payment";
 import type { PaymentProvider } from "@/lib/payment";
+import { withServerTiming } from "@/lib/server-timing";
 
-export async function POST(request: Request) {
+export const POST = withServerTiming(async function POST(request: Request) {
     try {
         const supabase = await createClient();
 
         // Check auth
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -90,9 +91,9 @@ export async function POST(request: Request) {
             { status: 500 }
         );
     }
-}
+});
 
-export async function GET() {
+export const GET = withServerTiming(async function GET() {
     // Return available providers and plans
     const providers = getAvailableProviders();
 
@@ -100,4 +101,4 @@ export async function GET() {
         providers,
         configured: providers.length > 0,
     });
-}
+});
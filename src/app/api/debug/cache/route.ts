@@ -0,0 +1,16 @@
+import { NextResponse } from "next/server";
+import { serverTimingEnabled } from "@/lib/server-timing";
+import { catalogCache } from "@/lib/catalog-cache";
+
+/**
+ * GET /api/debug/cache
+ * Entries and hit/miss counters of the catalog cache.
+ * Only available where Server-Timing is enabled (dev and test builds).
+ */
+export async function GET() {
+    if (!serverTimingEnabled()) {
+        return NextResponse.json({ error: "Not Found" }, { status: 404 });
+    }
+
+    return NextResponse.json(catalogCache.snapshot());
+}
@@ -0,0 +1,25 @@
+import { NextRequest, NextResponse } from "next/server";
+import { readQueryLog, serverTimingEnabled } from "@/lib/server-timing";
+
+interface RouteParams {
+    params: Promise<{ id: string }>;
+}
+
+/**
+ * GET /api/debug/queries/[id]
+ * Supabase calls made by the request sent with `x-mafilu-query-log: <id>`.
+ * Only available where Server-Timing is enabled (dev and test builds).
+ */
+export async function GET(request: NextRequest, { params }: RouteParams) {
+    if (!serverTimingEnabled()) {
+        return NextResponse.json({ error: "Not Found" }, { status: 404 });
+    }
+
+    const { id } = await params;
+    const log = readQueryLog(id);
+    if (!log) {
+        return NextResponse.json({ roundTrips: 0, calls: {}, durationsMs: {} });
+    }
+
+    return NextResponse.json(log);
+}
@@ -0,0 +1,29 @@
+import { NextResponse } from "next/server";
+import { serverTimingEnabled } from "@/lib/server-timing";
+import { viewBuffer } from "@/lib/view-buffer";
+
+/**
+ * GET /api/debug/views
+ * Counters of the in-memory view buffer.
+ * Only available where Server-Timing is enabled (dev and test builds).
+ */
+export async function GET() {
+    if (!serverTimingEnabled()) {
+        return NextResponse.json({ error: "Not Found" }, { status: 404 });
+    }
+
+    return NextResponse.json(viewBuffer.stats());
+}
+
+/**
+ * POST /api/debug/views
+ * Flush the buffered views now, so tests can read exact counts.
+ */
+export async function POST() {
+    if (!serverTimingEnabled()) {
+        return NextResponse.json({ error: "Not Found" }, { status: 404 });
+    }
+
+    const flushed = await viewBuffer.flush();
+    return NextResponse.json({ flushed, ...viewBuffer.stats() });
+}
@@ -1,6 +1,7 @@
 import { NextResponse } from 'next/server';
+import { withServerTiming } from '@/lib/server-timing';
 
-export async function GET() {
+export const GET = withServerTiming(async function GET() {
     const health = {
         status: 'healthy',
         timestamp: new Date().toISOString(),
@@ -10,4 +11,4 @@ export async function GET() {
     };
 
     return NextResponse.json(health, { status: 200 });
-}
+});
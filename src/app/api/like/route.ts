@@ -1,12 +1,13 @@
 import { NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
 
 // Toggle like on a movie
-export async function POST(request: Request) {
+export const POST = withServerTiming(async function POST(request: Request) {
     try {
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -63,10 +64,10 @@ export async function POST(request: Request) {
             { status: 500 }
         );
     }
-}
+});
 
 // Check if movie is liked and get like count
-export async function GET(request: Request) {
+export const GET = withServerTiming(async function GET(request: Request) {
     try {
         const supabase = await createClient();
 
@@ -85,7 +86,7 @@ export async function GET(request: Request) {
             .eq("rating", 5);
 
         // Check if current user liked
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         let isLiked = false;
 
         if (user) {
@@ -111,4 +112,4 @@ export async function GET(request: Request) {
             { status: 500 }
         );
     }
-}
+});
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
 
 interface RouteParams {
     params: Promise<{ id: string; commentId: string }>;
@@ -9,12 +10,12 @@ interface RouteParams {
  * PUT /api/movies/[id]/comments/[commentId]
  * Update a comment
  */
-export async function PUT(request: NextRequest, { params }: RouteParams) {
+export const PUT = withServerTiming(async function PUT(request: NextRequest, { params }: RouteParams) {
     try {
         const { commentId } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -77,18 +78,18 @@ export async function PUT(request: NextRequest, { params }: RouteParams) {
         console.error("Error updating comment:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
 /**
  * DELETE /api/movies/[id]/comments/[commentId]
  * Delete a comment (soft delete)
  */
-export async function DELETE(request: NextRequest, { params }: RouteParams) {
+export const DELETE = withServerTiming(async function DELETE(request: NextRequest, { params }: RouteParams) {
     try {
         const { commentId } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -121,5 +122,5 @@ export async function DELETE(request: NextRequest, { params }: RouteParams) {
         console.error("Error deleting comment:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
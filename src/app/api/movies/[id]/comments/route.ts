@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
 
 interface RouteParams {
     params: Promise<{ id: string }>;
@@ -9,7 +10,7 @@ interface RouteParams {
  * GET /api/movies/[id]/comments
  * Get comments for a movie
  */
-export async function GET(request: NextRequest, { params }: RouteParams) {
+export const GET = withServerTiming(async function GET(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
@@ -70,18 +71,18 @@ export async function GET(request: NextRequest, { params }: RouteParams) {
         console.error("Error fetching comments:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
 /**
  * POST /api/movies/[id]/comments
  * Create a new comment
  */
-export async function POST(request: NextRequest, { params }: RouteParams) {
+export const POST = withServerTiming(async function POST(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -152,5 +153,5 @@ export async function POST(request: NextRequest, { params }: RouteParams) {
         console.error("Error creating comment:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
 
 interface RouteParams {
     params: Promise<{ id: string }>;
@@ -9,12 +10,12 @@ interface RouteParams {
  * GET /api/movies/[id]/rating
  * Get user's rating for a movie
  */
-export async function GET(request: NextRequest, { params }: RouteParams) {
+export const GET = withServerTiming(async function GET(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -33,18 +34,18 @@ export async function GET(request: NextRequest, { params }: RouteParams) {
         console.error("Error fetching rating:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
 /**
  * POST /api/movies/[id]/rating
  * Set user's rating for a movie
  */
-export async function POST(request: NextRequest, { params }: RouteParams) {
+export const POST = withServerTiming(async function POST(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -104,18 +105,18 @@ export async function POST(request: NextRequest, { params }: RouteParams) {
         console.error("Error setting rating:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
 /**
  * DELETE /api/movies/[id]/rating
  * Remove user's rating
  */
-export async function DELETE(request: NextRequest, { params }: RouteParams) {
+export const DELETE = withServerTiming(async function DELETE(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -144,5 +145,5 @@ export async function DELETE(request: NextRequest, { params }: RouteParams) {
         console.error("Error deleting rating:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
@@ -0,0 +1,71 @@
+import { NextRequest, NextResponse } from "next/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
+import { CATALOG_TAG, catalogCache } from "@/lib/catalog-cache";
+
+interface RouteParams {
+    params: Promise<{ id: string }>;
+}
+
+/**
+ * POST /api/movies/[id]/review
+ * Approve or reject a movie (admins only)
+ *
+ * Goes through the server rather than the browser client so the catalog
+ * cache drops the homepage and featured lists as soon as the status changes.
+ */
+export const POST = withServerTiming(async function POST(request: NextRequest, { params }: RouteParams) {
+    try {
+        const { id } = await params;
+        const supabase = await createClient();
+
+        const user = await getVerifiedUser();
+        if (!user) {
+            return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
+        }
+
+        const { data: profile } = await supabase
+            .from("profiles")
+            .select("role")
+            .eq("id", user.id)
+            .single();
+
+        if (profile?.role !== "admin" && profile?.role !== "super_admin") {
+            return NextResponse.json({ error: "Forbidden" }, { status: 403 });
+        }
+
+        const { action, reason } = await request.json() as {
+            action: "approve" | "reject";
+            reason?: string;
+        };
+
+        if (action !== "approve" && action !== "reject") {
+            return NextResponse.json({ error: "Invalid action" }, { status: 400 });
+        }
+        if (action === "reject" && !reason?.trim()) {
+            return NextResponse.json({ error: "Rejection reason is required" }, { status: 400 });
+        }
+
+        const { error } = await supabase
+            .from("movies")
+            .update(
+                action === "approve"
+                    ? { status: "approved", reviewed_at: new Date().toISOString() }
+                    : {
+                        status: "rejected",
+                        rejection_reason: reason,
+                        reviewed_at: new Date().toISOString(),
+                    }
+            )
+            .eq("id", id);
+
+        if (error) throw error;
+
+        catalogCache.invalidate(CATALOG_TAG);
+
+        return NextResponse.json({ success: true });
+    } catch (error) {
+        console.error("Error reviewing movie:", error);
+        return NextResponse.json({ error: "Internal Error" }, { status: 500 });
+    }
+});
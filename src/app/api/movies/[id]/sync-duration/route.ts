@@ -1,9 +1,10 @@
 
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { bunnyStream } from "@/lib/bunny";
+import { withServerTiming } from "@/lib/server-timing";
 
-export async function POST(
+export const POST = withServerTiming(async function POST(
     request: NextRequest,
     context: { params: Promise<{ id: string }> } // Fix for Next.js 15
 ) {
@@ -12,7 +13,7 @@ export async function POST(
         const supabase = await createClient();
 
         // 1. Auth & Admin check
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
 
         const { data: profile } = await supabase
@@ -63,7 +64,7 @@ export async function POST(
         console.error("Sync duration error:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
 function formatDuration(seconds: number): string {
     const h = Math.floor(seconds / 3600);
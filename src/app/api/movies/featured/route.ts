@@ -1,29 +1,52 @@
 import { NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createPublicClient } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
+import { CATALOG_TAG, TRENDING_TAG, catalogCache } from "@/lib/catalog-cache";
 
-export async function GET() {
-    try {
-        const supabase = await createClient();
+interface FeaturedMovies {
+    trending: { id: string; total_views?: number | null }[];
+    new: { id: string }[];
+}
+
+async function loadFeatured(): Promise<FeaturedMovies> {
+    const supabase = await createPublicClient();
 
-        // Fetch trending movies (most viewed)
-        const { data: trending } = await supabase
+    // Trending (most viewed) and new (most recent) movies, in parallel
+    const [trending, newMovies] = await Promise.all([
+        supabase
             .from("movies")
             .select("id, title, genre, total_views, bunny_video_id")
             .eq("status", "approved")
             .order("total_views", { ascending: false })
-            .limit(4);
-
-        // Fetch new movies (most recent)
-        const { data: newMovies } = await supabase
+            .limit(4),
+        supabase
             .from("movies")
             .select("id, title, genre, total_views, bunny_video_id")
             .eq("status", "approved")
             .order("created_at", { ascending: false })
-            .limit(4);
+            .limit(4),
+    ]);
+
+    if (trending.error) throw trending.error;
+    if (newMovies.error) throw newMovies.error;
+
+    // View flushes that reorder this list invalidate it
+    catalogCache.setRanking(trending.data || []);
 
-        return NextResponse.json({
-            trending: trending || [],
-            new: newMovies || [],
+    return {
+        trending: trending.data || [],
+        new: newMovies.data || [],
+    };
+}
+
+export const GET = withServerTiming(async function GET() {
+    try {
+        const [featured, outcome] = await catalogCache.get(
+            "api:featured", [CATALOG_TAG, TRENDING_TAG], loadFeatured
+        );
+
+        return NextResponse.json(featured, {
+            headers: { "X-Mafilu-Cache": outcome },
         });
     } catch (error) {
         console.error("Featured movies error:", error);
@@ -32,4 +55,4 @@ export async function GET() {
             { status: 500 }
         );
     }
-}
+});
@@ -0,0 +1,49 @@
+import { NextRequest, NextResponse } from "next/server";
+import { withServerTiming } from "@/lib/server-timing";
+import { InvalidCursorError, pageSize } from "@/lib/pagination";
+import { getBrowsePage, isBrowseSort } from "@/lib/supabase/queries";
+
+/**
+ * GET /api/movies?sort=newest|oldest|popular&genre=&year=&cursor=&limit=24
+ * One page of approved movies for /browse (card columns only)
+ *
+ * Returns `{ movies, nextCursor }`; pass `nextCursor` back as `cursor` for
+ * the next page. It is null on the last page.
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
+    const params = request.nextUrl.searchParams;
+    const sort = params.get("sort") || "newest";
+    const year = params.get("year") ? Number(params.get("year")) : null;
+
+    if (!isBrowseSort(sort)) {
+        return NextResponse.json({ error: "Invalid sort" }, { status: 400 });
+    }
+    if (year !== null && !Number.isInteger(year)) {
+        return NextResponse.json({ error: "Invalid year" }, { status: 400 });
+    }
+
+    try {
+        const page = await getBrowsePage({
+            sort,
+            genre: params.get("genre"),
+            year,
+            cursor: params.get("cursor"),
+            limit: pageSize(params.get("limit")),
+        });
+
+        return NextResponse.json(
+            { movies: page.items, nextCursor: page.nextCursor },
+            { headers: { "Cache-Control": "public, s-maxage=30, stale-while-revalidate=60" } }
+        );
+    } catch (error) {
+        if (error instanceof InvalidCursorError) {
+            return NextResponse.json({ error: error.message }, { status: 400 });
+        }
+        // An unknown genre is a bad request, not a server error
+        if ((error as { code?: string }).code === "22P02") {
+            return NextResponse.json({ error: "Invalid genre" }, { status: 400 });
+        }
+        console.error("Browse movies error:", error);
+        return NextResponse.json({ error: "Internal Error" }, { status: 500 });
+    }
+});
@@ -0,0 +1,78 @@
+import { NextRequest, NextResponse } from "next/server";
+import { createPublicClient } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
+import { bunnyStream } from "@/lib/bunny";
+
+const DEFAULT_LIMIT = 24;
+const MAX_LIMIT = 100;
+const MAX_QUERY_LENGTH = 100;
+
+/**
+ * GET /api/search?q=<query>&limit=24&cursor=<cursor>&genre=<genre>
+ * Ranked search over approved movies (`search_movies`, migration 013)
+ *
+ * Returns `{ movies, nextCursor }` with card columns only, like
+ * `/api/movies`. Hits are ranked by relevance, which has no keyset, so the
+ * cursor is the offset of the next page. Results are public, so shared
+ * caches may keep them briefly.
+ */
+export const GET = withServerTiming(async function GET(request: NextRequest) {
+    try {
+        const params = request.nextUrl.searchParams;
+        const query = (params.get("q") || "").trim().slice(0, MAX_QUERY_LENGTH);
+        const limit = Math.min(Math.max(Number(params.get("limit")) || DEFAULT_LIMIT, 1), MAX_LIMIT);
+        const offset = Math.max(Math.floor(Number(params.get("cursor"))) || 0, 0);
+        const genre = params.get("genre") || null;
+
+        if (!query) {
+            return NextResponse.json({ movies: [], nextCursor: null });
+        }
+
+        const supabase = await createPublicClient();
+
+        // One extra row tells whether there is another page
+        const { data, error } = await supabase.rpc("search_movies", {
+            p_query: query,
+            p_limit: limit + 1,
+            p_offset: offset,
+            p_genre: genre,
+        });
+
+        if (error) {
+            // An unknown genre is a bad request, not a server error
+            if (error.code === "22P02") {
+                return NextResponse.json({ error: "Invalid genre" }, { status: 400 });
+            }
+            throw error;
+        }
+
+        const rows = (data || []) as {
+            id: string;
+            title: string;
+            genre: string;
+            release_year: number | null;
+            total_views: number | null;
+            bunny_video_id: string | null;
+            thumbnail_url: string | null;
+        }[];
+
+        const movies = rows.slice(0, limit).map((movie) => ({
+            id: movie.id,
+            title: movie.title,
+            genre: movie.genre,
+            release_year: movie.release_year,
+            total_views: movie.total_views || 0,
+            bunny_video_id: movie.bunny_video_id,
+            thumbnailUrl: movie.thumbnail_url
+                || (movie.bunny_video_id ? bunnyStream.getThumbnailUrl(movie.bunny_video_id) : undefined),
+        }));
+
+        return NextResponse.json(
+            { movies, nextCursor: rows.length > limit ? String(offset + limit) : null },
+            { headers: { "Cache-Control": "public, s-maxage=30, stale-while-revalidate=60" } }
+        );
+    } catch (error) {
+        console.error("Search error:", error);
+        return NextResponse.json({ error: "Internal Error" }, { status: 500 });
+    }
+});
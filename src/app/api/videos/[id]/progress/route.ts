@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
 
 interface RouteParams {
     params: Promise<{ id: string }>;
@@ -9,12 +10,12 @@ interface RouteParams {
  * GET /api/videos/[id]/progress
  * Get playback position for a movie
  */
-export async function GET(request: NextRequest, { params }: RouteParams) {
+export const GET = withServerTiming(async function GET(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -41,83 +42,52 @@ export async function GET(request: NextRequest, { params }: RouteParams) {
         console.error("Error fetching progress:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
 
 /**
  * POST /api/videos/[id]/progress
  * Save playback position for a movie
+ *
+ * The player sends coalesced updates, and `navigator.sendBeacon` on page
+ * hide, so the body is parsed from text whatever its content type. The
+ * write is a single `save_watch_progress` upsert (migration 009).
  */
-export async function POST(request: NextRequest, { params }: RouteParams) {
+export const POST = withServerTiming(async function POST(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
 
-        const { position, completed } = await request.json() as {
-            position: number;
-            completed?: boolean;
-        };
+        let body: { position?: unknown; completed?: unknown };
+        try {
+            body = JSON.parse(await request.text());
+        } catch {
+            return NextResponse.json({ error: "Invalid body" }, { status: 400 });
+        }
 
-        if (typeof position !== "number" || position < 0) {
+        const { position, completed } = body ?? {};
+        if (typeof position !== "number" || !Number.isFinite(position) || position < 0) {
             return NextResponse.json(
                 { error: "Invalid position" },
                 { status: 400 }
             );
         }
 
-        // Get movie duration to check if completed
-        const { data: movie } = await supabase
-            .from("movies")
-            .select("duration_seconds")
-            .eq("id", id)
-            .single();
-
-        const isCompleted = completed || (movie?.duration_seconds && position >= movie.duration_seconds * 0.9);
-
-        // Check if view record exists
-        const { data: existingView } = await supabase
-            .from("movie_views")
-            .select("id")
-            .eq("movie_id", id)
-            .eq("user_id", user.id)
-            .order("viewed_at", { ascending: false })
-            .limit(1)
-            .single();
-
-        if (existingView) {
-            // Update existing view
-            const { error: updateError } = await supabase
-                .from("movie_views")
-                .update({
-                    watch_duration_seconds: Math.floor(position),
-                    completed: isCompleted,
-                    viewed_at: new Date().toISOString(),
-                })
-                .eq("id", existingView.id);
-
-            if (updateError) throw updateError;
-        } else {
-            // Insert new view
-            const { error: insertError } = await supabase
-                .from("movie_views")
-                .insert({
-                    movie_id: id,
-                    user_id: user.id,
-                    watch_duration_seconds: Math.floor(position),
-                    completed: isCompleted,
-                });
+        const { error } = await supabase.rpc("save_watch_progress", {
+            p_movie_id: id,
+            p_position: Math.floor(position),
+            p_completed: completed === true,
+        });
 
-            if (insertError) throw insertError;
-        }
+        if (error) throw error;
 
         return NextResponse.json({ success: true });
     } catch (error) {
         console.error("Error saving progress:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
-
+});
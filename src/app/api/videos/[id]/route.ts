@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { bunnyStream } from "@/lib/bunny";
+import { withServerTiming } from "@/lib/server-timing";
 
 interface RouteParams {
     params: Promise<{ id: string }>;
@@ -11,15 +12,15 @@ interface RouteParams {
  * 
  * Get video processing status from Bunny.net
  */
-export async function GET(request: NextRequest, { params }: RouteParams) {
+export const GET = withServerTiming(async function GET(request: NextRequest, { params }: RouteParams) {
     try {
         const { id: videoId } = await params;
 
         // Authenticate user
         const supabase = await createClient();
-        const { data: { user }, error: authError } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
 
-        if (authError || !user) {
+        if (!user) {
             return NextResponse.json(
                 { error: "Unauthorized" },
                 { status: 401 }
@@ -75,22 +76,22 @@ export async function GET(request: NextRequest, { params }: RouteParams) {
             { status: 500 }
         );
     }
-}
+});
 
 /**
  * DELETE /api/videos/[id]
  * 
  * Delete a video from Bunny.net
  */
-export async function DELETE(request: NextRequest, { params }: RouteParams) {
+export const DELETE = withServerTiming(async function DELETE(request: NextRequest, { params }: RouteParams) {
     try {
         const { id: videoId } = await params;
 
         // Authenticate user
         const supabase = await createClient();
-        const { data: { user }, error: authError } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
 
-        if (authError || !user) {
+        if (!user) {
             return NextResponse.json(
                 { error: "Unauthorized" },
                 { status: 401 }
@@ -143,4 +144,4 @@ export async function DELETE(request: NextRequest, { params }: RouteParams) {
             { status: 500 }
         );
     }
-}
+});
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { bunnyStream } from "@/lib/bunny";
+import { withServerTiming } from "@/lib/server-timing";
 
 interface RouteParams {
     params: Promise<{ id: string }>;
@@ -9,14 +10,14 @@ interface RouteParams {
 // Export maxDuration for Vercel (60 seconds max for Hobby plan)
 export const maxDuration = 60;
 
-export async function PUT(request: NextRequest, { params }: RouteParams) {
+export const PUT = withServerTiming(async function PUT(request: NextRequest, { params }: RouteParams) {
     try {
         const { id: videoId } = await params;
         const supabase = await createClient();
 
         // 1. Auth Check
-        const { data: { user }, error: authError } = await supabase.auth.getUser();
-        if (authError || !user) {
+        const user = await getVerifiedUser();
+        if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
 
@@ -88,4 +89,4 @@ export async function PUT(request: NextRequest, { params }: RouteParams) {
             message: error instanceof Error ? error.message : "Unknown error"
         }, { status: 500 });
     }
-}
+});
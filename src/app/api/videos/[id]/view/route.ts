@@ -1,39 +1,71 @@
-import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createHash } from "node:crypto";
+import { NextRequest, NextResponse, after } from "next/server";
+import { getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
+import { isUuid } from "@/lib/utils";
+import { VIEWER_COOKIE, viewBuffer } from "@/lib/view-buffer";
 
 interface RouteParams {
     params: Promise<{ id: string }>;
 }
 
-export async function POST(request: NextRequest, { params }: RouteParams) {
+const VIEWER_COOKIE_MAX_AGE = 60 * 60 * 24 * 365;
+
+/**
+ * Dedup key for a request without the cookie. Derived from the client
+ * address and user agent, so a client that never keeps cookies is still
+ * the same viewer on every request. Only used until the client sends its
+ * own cookie back: everyone behind one NAT with the same browser shares it.
+ */
+function anonymousViewer(request: NextRequest): string {
+    const address = request.headers.get("x-forwarded-for")?.split(",")[0].trim()
+        || request.headers.get("x-real-ip")
+        || "";
+    const agent = request.headers.get("user-agent") || "";
+    return createHash("sha256").update(`${address}\n${agent}`).digest("base64url");
+}
+
+/**
+ * POST /api/videos/[id]/view
+ * Count a view, once per viewer and movie within the dedup window
+ *
+ * Views are buffered and added to `movies.total_views` in batches (see
+ * `src/lib/view-buffer.ts`), so the request itself makes no database call.
+ */
+export const POST = withServerTiming(async function POST(request: NextRequest, { params }: RouteParams) {
     try {
         const { id } = await params;
-        const supabase = await createClient();
-
-        // Increment view count
-        // Note: In a real app, you'd want to prevent duplicate views from same IP/Session
-        const { error } = await supabase.rpc('increment_view_count', { movie_id: id });
+        // A batch with a malformed id would be rejected as a whole
+        if (!isUuid(id)) {
+            return NextResponse.json({ error: "Invalid movie id" }, { status: 400 });
+        }
 
-        if (error) {
-            // Fallback if RPC doesn't exist yet (we haven't created it)
-            // This is race-safe enough for MVP
-            const { data: movie } = await supabase
-                .from('movies')
-                .select('total_views')
-                .eq('id', id)
-                .single();
+        // Signed-in users count once across browsers; others by cookie,
+        // or by address and user agent until they have one
+        const user = await getVerifiedUser();
+        const existing = request.cookies.get(VIEWER_COOKIE)?.value;
+        const key = user
+            ? `user:${user.id}`
+            : existing ? `cookie:${existing}` : `anon:${anonymousViewer(request)}`;
+        const counted = viewBuffer.record(id, key);
 
-            if (movie) {
-                await supabase
-                    .from('movies')
-                    .update({ total_views: (movie.total_views || 0) + 1 })
-                    .eq('id', id);
-            }
+        if (viewBuffer.flushDue()) {
+            after(() => viewBuffer.flush());
         }
 
-        return NextResponse.json({ success: true });
+        const response = NextResponse.json({ success: true, counted });
+        if (!existing) {
+            response.cookies.set(VIEWER_COOKIE, crypto.randomUUID(), {
+                httpOnly: true,
+                sameSite: "lax",
+                secure: process.env.NODE_ENV === "production",
+                maxAge: VIEWER_COOKIE_MAX_AGE,
+                path: "/",
+            });
+        }
+        return response;
     } catch (error) {
         console.error("Error recording view:", error);
         return NextResponse.json({ error: "Internal Error" }, { status: 500 });
     }
-}
+});
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { bunnyStream } from "@/lib/bunny";
+import { withServerTiming } from "@/lib/server-timing";
 
 /**
  * POST /api/videos/upload
@@ -8,13 +9,13 @@ import { bunnyStream } from "@/lib/bunny";
  * Creates a video entry on Bunny.net and returns upload credentials
  * for direct browser-to-CDN upload (TUS protocol)
  */
-export async function POST(request: NextRequest) {
+export const POST = withServerTiming(async function POST(request: NextRequest) {
     try {
         // Authenticate user
         const supabase = await createClient();
-        const { data: { user }, error: authError } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
 
-        if (authError || !user) {
+        if (!user) {
             return NextResponse.json(
                 { error: "Unauthorized" },
                 { status: 401 }
@@ -116,4 +117,4 @@ export async function POST(request: NextRequest) {
             { status: 500 }
         );
     }
-}
+});
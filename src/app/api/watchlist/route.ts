@@ -1,12 +1,18 @@
 import { NextResponse } from "next/server";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
+import { withServerTiming } from "@/lib/server-timing";
+import { InvalidCursorError, afterCursor, decodeCursor, pageSize, toPage } from "@/lib/pagination";
+import { isUuid } from "@/lib/utils";
+
+// Enough for every movie the homepage renders
+const MAX_MEMBERSHIP_IDS = 200;
 
 // Add movie to watchlist
-export async function POST(request: Request) {
+export const POST = withServerTiming(async function POST(request: Request) {
     try {
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -53,14 +59,16 @@ export async function POST(request: Request) {
             { status: 500 }
         );
     }
-}
+});
 
-// Check if movie is in watchlist
-export async function GET(request: Request) {
+// Check if movie is in watchlist, which of ?movieIds=a,b,... are in it, or
+// list it a page at a time (?cursor=&limit=, newest first; `total` is only
+// counted on the first page)
+export const GET = withServerTiming(async function GET(request: Request) {
     try {
         const supabase = await createClient();
 
-        const { data: { user } } = await supabase.auth.getUser();
+        const user = await getVerifiedUser();
         if (!user) {
             return NextResponse.json({ error: "Unauthorized" }, { status: 401 });
         }
@@ -80,8 +88,35 @@ export async function GET(request: Request) {
             return NextResponse.json({ inWatchlist: !!data });
         }
 
-        // Get all watchlist items
-        const { data: watchlist, error: watchlistError } = await supabase
+        const movieIds = searchParams.get("movieIds");
+        if (movieIds !== null) {
+            // Membership of the movies a page renders, without paging
+            const ids = [...new Set(movieIds.split(",").filter(Boolean))];
+            if (ids.length > MAX_MEMBERSHIP_IDS || !ids.every(isUuid)) {
+                return NextResponse.json(
+                    { error: `movieIds must be at most ${MAX_MEMBERSHIP_IDS} movie ids` },
+                    { status: 400 }
+                );
+            }
+            if (ids.length === 0) {
+                return NextResponse.json({ movieIds: [] });
+            }
+
+            const { data, error } = await supabase
+                .from("watchlist")
+                .select("movie_id")
+                .eq("user_id", user.id)
+                .in("movie_id", ids);
+
+            if (error) throw error;
+            return NextResponse.json({ movieIds: (data || []).map((row) => row.movie_id) });
+        }
+
+        // One page of watchlist items, keyset-paginated on (added_at, id)
+        const limit = pageSize(searchParams.get("limit"));
+        const after = decodeCursor(searchParams.get("cursor"));
+
+        let query = supabase
             .from("watchlist")
             .select(`
                 id,
@@ -95,21 +130,36 @@ export async function GET(request: Request) {
                     duration_seconds,
                     release_year
                 )
-            `)
-            .eq("user_id", user.id)
-            .order("added_at", { ascending: false });
+            `, { count: after ? undefined : "exact" })
+            .eq("user_id", user.id);
+
+        if (after) query = query.or(afterCursor("added_at", after));
+
+        // One extra row tells whether there is another page
+        const { data: watchlist, count, error: watchlistError } = await query
+            .order("added_at", { ascending: false })
+            .order("id", { ascending: false })
+            .limit(limit + 1);
 
         if (watchlistError) {
             console.error("Watchlist query error:", watchlistError);
             throw watchlistError;
         }
 
-        return NextResponse.json({ watchlist: watchlist || [] });
+        const page = toPage(watchlist || [], limit, (item) => item.added_at);
+        return NextResponse.json({
+            watchlist: page.items,
+            nextCursor: page.nextCursor,
+            ...(after ? {} : { total: count ?? page.items.length }),
+        });
     } catch (error) {
+        if (error instanceof InvalidCursorError) {
+            return NextResponse.json({ error: error.message }, { status: 400 });
+        }
         console.error("Watchlist fetch error:", error);
         return NextResponse.json(
             { error: "Failed to fetch watchlist" },
             { status: 500 }
         );
     }
-}
+});
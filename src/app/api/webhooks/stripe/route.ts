@@ -3,6 +3,7 @@ import { headers } from "next/headers";
 import { createClient } from "@supabase/supabase-js";
 import { verifyStripeWebhook } from "@/lib/payment/stripe";
 import type Stripe from "stripe";
+import { withServerTiming } from "@/lib/server-timing";
 
 // Use service role for webhook handler
 const supabaseAdmin = createClient(
@@ -10,7 +11,7 @@ const supabaseAdmin = createClient(
     process.env.SUPABASE_SERVICE_ROLE_KEY || ""
 );
 
-export async function POST(request: Request) {
+export const POST = withServerTiming(async function POST(request: Request) {
     try {
         const body = await request.text();
         const headersList = await headers();
@@ -61,7 +62,7 @@ export async function POST(request: Request) {
             { status: 400 }
         );
     }
-}
+});
 
 async function handleCheckoutComplete(session: Stripe.Checkout.Session) {
     const userId = session.metadata?.userId;
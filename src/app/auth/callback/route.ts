@@ -1,8 +1,9 @@
 import { createClient } from "@/lib/supabase/server";
 import { NextResponse } from "next/server";
 import type { NextRequest } from "next/server";
+import { withServerTiming } from "@/lib/server-timing";
 
-export async function GET(request: NextRequest) {
+export const GET = withServerTiming(async function GET(request: NextRequest) {
     const requestUrl = new URL(request.url);
     const code = requestUrl.searchParams.get("code");
     const type = requestUrl.searchParams.get("type"); // signup, recovery, invite, etc.
@@ -36,5 +37,5 @@ export async function GET(request: NextRequest) {
     return NextResponse.redirect(
         new URL("/login?error=auth_callback_error", requestUrl.origin)
     );
-}
+});
 
@@ -1,91 +1,169 @@
 "use client";
 
-import { useState, useMemo } from "react";
+import { useState, useMemo, useEffect, useCallback, useRef } from "react";
 import Link from "next/link";
 import { Search, Play, X, SlidersHorizontal } from "lucide-react";
 import { Card, CardContent } from "@/components/ui/card";
 import { Badge } from "@/components/ui/badge";
 import { motion, AnimatePresence } from "framer-motion";
+import { useInfiniteScroll } from "@/lib/use-infinite-scroll";
 
 interface Movie {
     id: string;
     title: string;
-    description?: string;
     genre: string;
-    release_year?: number;
+    release_year?: number | null;
     total_views?: number;
-    bunny_video_id?: string;
     thumbnailUrl?: string;
 }
 
+interface MoviePage {
+    items: Movie[];
+    nextCursor: string | null;
+}
+
 interface BrowseClientProps {
-    movies: Movie[];
+    initialPage: MoviePage;
     genres: string[];
+    years: number[];
+}
+
+type Sort = "newest" | "popular" | "oldest";
+
+const SEARCH_DEBOUNCE_MS = 200;
+const MIN_SEARCH_LENGTH = 2;
+
+function listingUrl(sort: Sort, genre: string | null, year: number | null): string {
+    const params = new URLSearchParams({ sort });
+    if (genre) params.set("genre", genre);
+    if (year) params.set("year", String(year));
+    return `/api/movies?${params}`;
+}
+
+function searchUrl(query: string, genre: string | null): string {
+    const params = new URLSearchParams({ q: query });
+    if (genre) params.set("genre", genre);
+    return `/api/search?${params}`;
+}
+
+async function fetchPage(url: string, cursor: string | null, signal?: AbortSignal): Promise<MoviePage> {
+    const res = await fetch(cursor ? `${url}&cursor=${encodeURIComponent(cursor)}` : url, { signal });
+    if (!res.ok) throw new Error(`Loading movies failed with ${res.status}`);
+    const data = await res.json() as { movies: Movie[]; nextCursor: string | null };
+    return { items: data.movies, nextCursor: data.nextCursor };
+}
+
+/** `value`, once it has stopped changing for `delay` ms. */
+function useDebouncedValue<T>(value: T, delay: number): T {
+    const [debounced, setDebounced] = useState(value);
+
+    useEffect(() => {
+        const timer = setTimeout(() => setDebounced(value), delay);
+        return () => clearTimeout(timer);
+    }, [value, delay]);
+
+    return debounced;
+}
+
+/**
+ * Movies of `url` (`/api/movies` or `/api/search`), one page at a time.
+ * A new `url` starts over from its first page and aborts the request of
+ * the one it replaced; until that page arrives the previous movies stay on
+ * screen and `isLoading` is set. `loadMore` appends the next page.
+ */
+function useMoviePages(url: string, initialUrl: string, initialPage: MoviePage) {
+    const [listing, setListing] = useState({ url: initialUrl, ...initialPage });
+    const [loadingMore, setLoadingMore] = useState(false);
+    const loadingMoreRef = useRef(false);
+
+    useEffect(() => {
+        if (listing.url === url) return;
+
+        const controller = new AbortController();
+        fetchPage(url, null, controller.signal)
+            .then((page) => setListing({ url, ...page }))
+            .catch((err) => {
+                if (controller.signal.aborted) return;
+                console.error("Browse error:", err);
+                setListing({ url, items: [], nextCursor: null });
+            });
+
+        return () => controller.abort();
+    }, [url, listing.url]);
+
+    const loadMore = useCallback(async () => {
+        const cursor = listing.nextCursor;
+        if (listing.url !== url || !cursor || loadingMoreRef.current) return;
+
+        loadingMoreRef.current = true;
+        setLoadingMore(true);
+        try {
+            const page = await fetchPage(url, cursor);
+            setListing((current) => {
+                if (current.url !== url || current.nextCursor !== cursor) return current;
+                // Popularity can change between pages; show each movie once
+                const seen = new Set(current.items.map((movie) => movie.id));
+                return {
+                    url,
+                    items: [...current.items, ...page.items.filter((movie) => !seen.has(movie.id))],
+                    nextCursor: page.nextCursor,
+                };
+            });
+        } catch (err) {
+            console.error("Browse error:", err);
+        } finally {
+            loadingMoreRef.current = false;
+            setLoadingMore(false);
+        }
+    }, [url, listing]);
+
+    const isLoading = listing.url !== url;
+    return {
+        movies: listing.items,
+        hasMore: !isLoading && listing.nextCursor !== null,
+        isLoading,
+        isLoadingMore: loadingMore,
+        loadMore,
+    };
 }
 
-export default function BrowseClient({ movies, genres }: BrowseClientProps) {
+export default function BrowseClient({ initialPage, genres, years }: BrowseClientProps) {
     const [searchQuery, setSearchQuery] = useState("");
     const [selectedGenre, setSelectedGenre] = useState<string | null>(null);
     const [selectedYear, setSelectedYear] = useState<number | null>(null);
-    const [sortBy, setSortBy] = useState<"newest" | "popular" | "oldest" | "rating">("newest");
+    const [sortBy, setSortBy] = useState<Sort>("newest");
     const [showFilters, setShowFilters] = useState(false);
 
-    // Extract unique years from movies
-    const years = useMemo(() => {
-        const uniqueYears = [...new Set(movies.map(m => m.release_year).filter(Boolean))] as number[];
-        return uniqueYears.sort((a, b) => b - a);
-    }, [movies]);
+    // Server search once typing pauses; sorted by relevance
+    const typedQuery = searchQuery.trim();
+    const searchedQuery = useDebouncedValue(typedQuery, SEARCH_DEBOUNCE_MS);
+    const searching = searchedQuery.length >= MIN_SEARCH_LENGTH;
+    const url = searching
+        ? searchUrl(searchedQuery, selectedGenre)
+        : listingUrl(sortBy, selectedGenre, selectedYear);
+    const pages = useMoviePages(url, listingUrl("newest", null, null), initialPage);
+    const sentinelRef = useInfiniteScroll(pages.loadMore, pages.hasMore && !pages.isLoadingMore);
 
-    // Filter and sort movies
     const filteredMovies = useMemo(() => {
-        let result = [...movies];
+        let result = pages.movies;
 
-        // Search filter
-        if (searchQuery.trim()) {
-            const query = searchQuery.toLowerCase();
+        // Until the hits for what is typed arrive, narrow what is on screen
+        const showingHits = searching && !pages.isLoading && searchedQuery === typedQuery;
+        if (typedQuery && !showingHits) {
+            const query = typedQuery.toLocaleLowerCase("tr");
             result = result.filter(movie =>
-                movie.title.toLowerCase().includes(query) ||
-                movie.description?.toLowerCase().includes(query) ||
+                movie.title.toLocaleLowerCase("tr").includes(query) ||
                 movie.genre.toLowerCase().includes(query)
             );
         }
 
-        // Genre filter - case-insensitive comparison
-        if (selectedGenre) {
-            result = result.filter(movie =>
-                movie.genre.toLowerCase() === selectedGenre.toLowerCase() ||
-                movie.genre === selectedGenre
-            );
-        }
-
-        // Year filter
-        if (selectedYear) {
+        // Search takes no year; filter its hits here
+        if (searching && selectedYear) {
             result = result.filter(movie => movie.release_year === selectedYear);
         }
 
-        // Sort
-        switch (sortBy) {
-            case "popular":
-                result.sort((a, b) => (b.total_views || 0) - (a.total_views || 0));
-                break;
-            case "oldest":
-                result.sort((a, b) => (a.release_year || 0) - (b.release_year || 0));
-                break;
-            case "rating":
-                // Sort by rating if available (higher first)
-                result.sort((a, b) => {
-                    const ratingA = (a as any).average_rating || 0;
-                    const ratingB = (b as any).average_rating || 0;
-                    return ratingB - ratingA;
-                });
-                break;
-            case "newest":
-            default:
-                result.sort((a, b) => (b.release_year || 0) - (a.release_year || 0));
-        }
-
         return result;
-    }, [movies, searchQuery, selectedGenre, selectedYear, sortBy]);
+    }, [pages.movies, pages.isLoading, searching, searchedQuery, typedQuery, selectedYear]);
 
     const clearFilters = () => {
         setSearchQuery("");
@@ -104,6 +182,7 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
                 <div className="relative">
                     <Search className="absolute left-4 top-1/2 -translate-y-1/2 w-5 h-5 text-[var(--mf-text-muted)]" />
                     <input
+                        data-testid="browse-search"
                         type="text"
                         placeholder="Film ara..."
                         value={searchQuery}
@@ -112,6 +191,7 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
                     />
                     {searchQuery && (
                         <button
+                            data-testid="browse-search-clear"
                             onClick={() => setSearchQuery("")}
                             className="absolute right-14 top-1/2 -translate-y-1/2 text-[var(--mf-text-muted)] hover:text-[var(--mf-primary-glow-alt)] transition-colors"
                         >
@@ -119,6 +199,7 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
                         </button>
                     )}
                     <button
+                        data-testid="browse-filters-toggle"
                         onClick={() => setShowFilters(!showFilters)}
                         className={`absolute right-4 top-1/2 -translate-y-1/2 p-2 rounded-lg transition-colors ${showFilters ? "text-[var(--mf-primary-glow-alt)] bg-[var(--mf-primary-dark)]/10" : "text-[var(--mf-text-muted)] hover:text-[var(--mf-primary-glow-alt)]"
                             }`}
@@ -174,7 +255,6 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
                                         {[
                                             { value: "newest", label: "En Yeni" },
                                             { value: "popular", label: "En Popüler" },
-                                            { value: "rating", label: "En Yüksek Puan" },
                                             { value: "oldest", label: "En Eski" },
                                         ].map((option) => (
                                             <button
@@ -224,6 +304,7 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
                                 {/* Clear Filters */}
                                 {hasActiveFilters && (
                                     <button
+                                        data-testid="browse-filters-clear"
                                         onClick={clearFilters}
                                         className="text-sm text-[var(--mf-primary-glow-alt)] hover:text-[var(--mf-text-accent)] transition-colors flex items-center gap-1"
                                     >
@@ -238,14 +319,14 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
 
                 {/* Results Count */}
                 {searchQuery && (
-                    <p className="text-sm text-[var(--mf-text-muted)]">
-                        &quot;{searchQuery}&quot; için {filteredMovies.length} sonuç bulundu
+                    <p data-testid="browse-search-count" aria-busy={pages.isLoading} className="text-sm text-[var(--mf-text-muted)]">
+                        &quot;{searchQuery}&quot; için {filteredMovies.length}{pages.hasMore ? "+" : ""} sonuç bulundu
                     </p>
                 )}
             </div>
 
             {/* Movies Grid */}
-            <div className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
+            <div aria-busy={pages.isLoading} className="grid grid-cols-1 sm:grid-cols-2 lg:grid-cols-3 xl:grid-cols-4 gap-6">
                 <AnimatePresence mode="popLayout">
                     {filteredMovies.map((movie) => (
                         <motion.div
@@ -300,14 +381,29 @@ export default function BrowseClient({ movies, genres }: BrowseClientProps) {
                 </AnimatePresence>
             </div>
 
+            {/* Next page, loaded as it scrolls into view */}
+            {pages.hasMore && (
+                <div ref={sentinelRef} className="flex justify-center pt-10">
+                    <button
+                        data-testid="browse-load-more"
+                        onClick={pages.loadMore}
+                        disabled={pages.isLoadingMore}
+                        className="px-4 py-2 rounded-lg bg-[var(--mf-primary-dark)]/10 text-[var(--mf-primary-glow-alt)] hover:bg-[var(--mf-primary-dark)]/20 transition-colors disabled:opacity-50"
+                    >
+                        {pages.isLoadingMore ? "Yükleniyor..." : "Daha fazla göster"}
+                    </button>
+                </div>
+            )}
+
             {/* No Results */}
-            {filteredMovies.length === 0 && (
+            {filteredMovies.length === 0 && !pages.isLoading && (
                 <div className="text-center py-20">
                     <Search className="w-12 h-12 text-[var(--mf-text-muted)] mx-auto mb-4" />
                     <p className="text-[var(--mf-text-muted)] text-lg">Sonuç bulunamadı</p>
                     <p className="text-[var(--mf-text-medium)] text-sm mt-2">Farklı anahtar kelimeler deneyin veya filtreleri temizleyin.</p>
                     {hasActiveFilters && (
                         <button
+                            data-testid="browse-no-results-clear"
                             onClick={clearFilters}
                             className="mt-4 px-4 py-2 rounded-lg bg-[var(--mf-primary-dark)]/10 text-[var(--mf-primary-glow-alt)] hover:bg-[var(--mf-primary-dark)]/20 transition-colors"
                         >
@@ -1,9 +1,10 @@
-import { createClient } from "@/lib/supabase/server";
-import { bunnyStream } from "@/lib/bunny";
+import { getBrowsePage, type BrowseMovie } from "@/lib/supabase/queries";
+import type { Page } from "@/lib/pagination";
+import type { MovieGenre } from "@/types/database";
 import BrowseClient from "./browse-client";
 import type { Metadata } from "next";
 
-// Force dynamic rendering - uses Supabase server client
+// Force dynamic rendering - the first page is read per request
 export const dynamic = 'force-dynamic';
 
 export const metadata: Metadata = {
@@ -25,37 +26,26 @@ export const metadata: Metadata = {
     },
 };
 
-export default async function BrowsePage() {
-    const supabase = await createClient();
+const GENRES: MovieGenre[] = [
+    "drama", "comedy", "thriller", "documentary", "horror",
+    "sci_fi", "romance", "animation", "experimental", "short_film",
+];
 
-    // Fetch approved movies
-    const { data: movies, error } = await supabase
-        .from("movies")
-        .select("*")
-        .eq("status", "approved")
-        .order("created_at", { ascending: false });
+// The year filter offers the last ten release years
+function recentYears(count = 10): number[] {
+    const current = new Date().getFullYear();
+    return Array.from({ length: count }, (_, index) => current - index);
+}
 
-    if (error) {
+export default async function BrowsePage() {
+    // First page of approved movies; the client scrolls in the rest
+    let initialPage: Page<BrowseMovie> = { items: [], nextCursor: null };
+    try {
+        initialPage = await getBrowsePage();
+    } catch (error) {
         console.error("Error fetching movies:", error);
     }
 
-    // Process movies to add thumbnail URLs
-    const processedMovies = (movies || []).map((movie) => ({
-        id: movie.id,
-        title: movie.title,
-        description: movie.description,
-        genre: movie.genre,
-        release_year: movie.release_year,
-        total_views: movie.total_views || 0,
-        bunny_video_id: movie.bunny_video_id,
-        thumbnailUrl: movie.bunny_video_id
-            ? bunnyStream.getThumbnailUrl(movie.bunny_video_id)
-            : undefined,
-    }));
-
-    // Extract unique genres
-    const genres = [...new Set(movies?.map((m) => m.genre).filter(Boolean) || [])];
-
     return (
         <div className="min-h-screen bg-[var(--mf-black-alt)] relative overflow-hidden">
             {/* Background glows */}
@@ -76,7 +66,7 @@ export default async function BrowsePage() {
                     <p className="text-[var(--mf-text-medium)] mt-2">Bağımsız sinemanın en yeni, en çarpıcı yapımları.</p>
                 </div>
 
-                <BrowseClient movies={processedMovies} genres={genres} />
+                <BrowseClient initialPage={initialPage} genres={GENRES} years={recentYears()} />
             </main>
         </div>
     );
@@ -19,7 +19,7 @@ export default async function HomePage() {
       {/* ================================================
           FOOTER
           ================================================ */}
-      <footer className="border-t border-[var(--border-subtle)] py-16 bg-[var(--mf-black)]">
+      <footer data-testid="footer" className="border-t border-[var(--border-subtle)] py-16 bg-[var(--mf-black)]">
         <div className="max-w-[1600px] mx-auto px-6 md:px-12">
           {/* Top Row */}
           <div className="grid grid-cols-1 md:grid-cols-4 gap-10 mb-12">
@@ -37,9 +37,9 @@ export default async function HomePage() {
             <div>
               <h4 className="text-[var(--mf-text-high)] font-medium text-sm mb-4 tracking-wide uppercase">İzleyiciler</h4>
               <ul className="space-y-3 text-sm">
-                <li><Link href="/browse" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Filmleri Keşfet</Link></li>
-                <li><Link href="/subscription" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Premium Üyelik</Link></li>
-                <li><Link href="/watchlist" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">İzleme Listem</Link></li>
+                <li><Link href="/browse" data-testid="footer-browse" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Filmleri Keşfet</Link></li>
+                <li><Link href="/subscription" data-testid="footer-subscription" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Premium Üyelik</Link></li>
+                <li><Link href="/watchlist" data-testid="footer-watchlist" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">İzleme Listem</Link></li>
               </ul>
             </div>
 
@@ -50,13 +50,14 @@ export default async function HomePage() {
                 <li>
                   <Link
                     href="/dashboard"
+                    data-testid="footer-become-producer"
                     className="inline-flex items-center gap-2 text-[var(--mf-primary-glow)] hover:text-[var(--mf-primary)] transition-colors font-medium"
                   >
                     <span>🎬</span> Yapımcı Ol
                   </Link>
                 </li>
-                <li><Link href="/dashboard" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Yapımcı Paneli</Link></li>
-                <li><Link href="/dashboard/movies/upload" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Film Yükle</Link></li>
+                <li><Link href="/dashboard" data-testid="footer-producer-panel" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Yapımcı Paneli</Link></li>
+                <li><Link href="/dashboard/movies/upload" data-testid="footer-upload" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] transition-colors">Film Yükle</Link></li>
               </ul>
             </div>
 
@@ -164,6 +164,7 @@ export default function SubscriptionPage() {
 
                                     {/* CTA Button - Always at bottom */}
                                     <Button
+                                        data-testid={`subscription-subscribe-${plan.id}`}
                                         onClick={() => handleSubscribe(plan.id)}
                                         disabled={isLoading}
                                         className={`w-full mt-auto ${isPopular
@@ -1,5 +1,5 @@
 import { notFound, redirect } from "next/navigation";
-import { createClient } from "@/lib/supabase/server";
+import { createClient, getVerifiedUser } from "@/lib/supabase/server";
 import { bunnyStream } from "@/lib/bunny";
 import { ViewCounter } from "@/components/video/view-counter";
 import { RelatedMovies } from "@/components/video/related-movies";
@@ -75,7 +75,7 @@ export default async function WatchPage({ params }: PageProps) {
     const supabase = await createClient();
 
     // Check if user is authenticated
-    const { data: { user } } = await supabase.auth.getUser();
+    const user = await getVerifiedUser();
 
     if (!user) {
         redirect(`/login?next=/watch/${id}`);
@@ -213,6 +213,7 @@ export default async function WatchPage({ params }: PageProps) {
                 {playbackUrl ? (
                     <CustomPlayer
                         videoId={movie.bunny_video_id || ""}
+                        movieId={id}
                         playbackUrl={playbackUrl}
                         posterUrl={thumbnailUrl}
                         duration={movie.duration_seconds}
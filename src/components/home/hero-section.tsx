@@ -36,7 +36,7 @@ export function HeroSection({ movies }: HeroSectionProps) {
   };
 
   return (
-    <section className="relative h-screen min-h-[700px] w-full overflow-hidden">
+    <section data-testid="home-hero" className="relative h-screen min-h-[700px] w-full overflow-hidden">
       {/* Background Gradient Animation */}
       <AnimatePresence mode="wait">
         <motion.div
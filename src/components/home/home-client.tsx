@@ -14,17 +14,26 @@ export function HomeClient({ heroMovies, categories }: HomeClientProps) {
   const [watchlist, setWatchlist] = useState<Set<string>>(new Set());
   const [isLoadingWatchlist, setIsLoadingWatchlist] = useState(true);
 
-  // Fetch user's watchlist on mount (only if authenticated)
+  // Fetch which rendered movies are in the user's watchlist on mount (only if
+  // authenticated). The full list is paginated, so ask about these ids only.
   useEffect(() => {
+    const movieIds = [
+      ...new Set([
+        ...heroMovies.map((movie) => movie.id),
+        ...categories.flatMap((category) => category.movies.map((movie) => movie.id)),
+      ]),
+    ];
+
     const fetchWatchlist = async () => {
+      if (movieIds.length === 0) {
+        setIsLoadingWatchlist(false);
+        return;
+      }
       try {
-        const res = await fetch("/api/watchlist");
+        const res = await fetch(`/api/watchlist?movieIds=${movieIds.join(",")}`);
         if (res.ok) {
           const data = await res.json();
-          const watchlistIds = new Set<string>(
-            (data.watchlist || []).map((item: any) => item.movies?.id).filter(Boolean) as string[]
-          );
-          setWatchlist(watchlistIds);
+          setWatchlist(new Set<string>(data.movieIds || []));
         } else if (res.status === 401) {
           // User not authenticated, this is expected - just set empty watchlist
           setWatchlist(new Set());
@@ -38,7 +47,7 @@ export function HomeClient({ heroMovies, categories }: HomeClientProps) {
     };
 
     fetchWatchlist();
-  }, []);
+  }, [heroMovies, categories]);
 
   const toggleWatchlist = async (movieId: string) => {
     // Optimistic update
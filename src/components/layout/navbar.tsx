@@ -102,7 +102,7 @@ export function Navbar() {
             <div className="max-w-7xl mx-auto px-4 sm:px-6">
                 <div className="flex items-center justify-between h-16">
                     {/* Logo */}
-                    <Link href="/" className="flex items-center gap-3" onClick={() => setIsMenuOpen(false)}>
+                    <Link href="/" data-testid="navbar-logo" className="flex items-center gap-3" onClick={() => setIsMenuOpen(false)}>
                         <Film className="w-7 h-7 text-[var(--mf-primary-glow-alt)]" />
                         <span className="text-xl font-bold text-[var(--mf-text-high)] headline-serif tracking-tight">
                             Mafilu
@@ -117,6 +117,7 @@ export function Navbar() {
                                 <Link
                                     key={link.href}
                                     href={link.href}
+                                    data-testid={`navbar-link${link.href.replace("/", "-")}`}
                                     className={`flex items-center gap-2 text-sm transition-colors ${pathname === link.href
                                         ? "text-[var(--mf-primary-glow-alt)]"
                                         : "text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)]"
@@ -137,7 +138,7 @@ export function Navbar() {
 
                                 {/* User Menu */}
                                 <div className="relative group">
-                                    <button className="w-9 h-9 rounded-full bg-gradient-to-br from-[var(--mf-primary-dark)] to-[var(--mf-primary-glow-alt)] flex items-center justify-center text-white font-bold text-sm">
+                                    <button data-testid="navbar-user-menu" className="w-9 h-9 rounded-full bg-gradient-to-br from-[var(--mf-primary-dark)] to-[var(--mf-primary-glow-alt)] flex items-center justify-center text-white font-bold text-sm">
                                         {user.email?.[0].toUpperCase() || "U"}
                                     </button>
 
@@ -145,12 +146,14 @@ export function Navbar() {
                                     <div className="absolute right-0 top-full mt-2 w-48 py-2 opacity-0 invisible group-hover:opacity-100 group-hover:visible transition-all duration-200 rounded-xl bg-[var(--mf-dark-alt)] border border-[var(--mf-primary-dark)]/20 shadow-xl">
                                         <Link
                                             href="/account"
+                                            data-testid="navbar-account"
                                             className="flex items-center gap-2 px-4 py-2 text-sm text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)] hover:bg-[var(--mf-primary-dark)]/10"
                                         >
                                             <Settings className="w-4 h-4" />
                                             Hesabım
                                         </Link>
                                         <button
+                                            data-testid="navbar-logout"
                                             onClick={handleLogout}
                                             className="w-full flex items-center gap-2 px-4 py-2 text-sm text-red-400 hover:bg-red-500/10"
                                         >
@@ -163,12 +166,12 @@ export function Navbar() {
                         ) : (
                             <>
                                 <Link href="/login">
-                                    <Button variant="ghost" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)]">
+                                    <Button data-testid="navbar-login" variant="ghost" className="text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)]">
                                         Giriş
                                     </Button>
                                 </Link>
                                 <Link href="/signup">
-                                    <Button className="bg-[var(--mf-primary-dark)] hover:bg-[var(--mf-primary-darker)]">
+                                    <Button data-testid="navbar-signup" className="bg-[var(--mf-primary-dark)] hover:bg-[var(--mf-primary-darker)]">
                                         Kayıt Ol
                                     </Button>
                                 </Link>
@@ -177,6 +180,7 @@ export function Navbar() {
 
                         {/* Mobile Menu Button */}
                         <button
+                            data-testid="navbar-menu-toggle"
                             onClick={() => setIsMenuOpen(!isMenuOpen)}
                             className="md:hidden p-2 text-[var(--mf-text-medium)] hover:text-[var(--mf-text-high)]"
                         >
@@ -196,6 +200,7 @@ export function Navbar() {
                                 <Link
                                     key={link.href}
                                     href={link.href}
+                                    data-testid={`navbar-mobile-link${link.href.replace("/", "-")}`}
                                     onClick={() => setIsMenuOpen(false)}
                                     className={`flex items-center gap-3 px-4 py-3 rounded-xl transition-colors ${pathname === link.href
                                         ? "bg-[var(--mf-primary-dark)]/10 text-[var(--mf-primary-glow-alt)]"
@@ -21,6 +21,7 @@ import {
 
 interface CustomPlayerProps {
     videoId: string;
+    movieId?: string;
     playbackUrl: string;
     posterUrl?: string;
     duration?: number;
@@ -36,8 +37,13 @@ interface QualityLevel {
 
 const PLAYBACK_SPEEDS = [0.25, 0.5, 0.75, 1, 1.25, 1.5, 1.75, 2, 3, 4];
 
+// Progress is kept in localStorage every few seconds but only sent to the
+// server at this interval while playing, and on pause, hide and unload.
+const PROGRESS_SYNC_INTERVAL_MS = 30000;
+
 export function CustomPlayer({
     videoId,
+    movieId,
     playbackUrl,
     posterUrl,
     title,
@@ -48,6 +54,8 @@ export function CustomPlayer({
     const progressRef = useRef<HTMLDivElement>(null);
     const hlsRef = useRef<Hls | null>(null);
     const savePositionIntervalRef = useRef<NodeJS.Timeout | null>(null);
+    const syncedPositionRef = useRef<number | null>(null);
+    const syncDisabledRef = useRef(false);
 
     // Core states
     const [isPlaying, setIsPlaying] = useState(false);
@@ -101,6 +109,36 @@ export function CustomPlayer({
         }
     }, [storageKey]);
 
+    // Send position to the server, skipping it if nothing changed since the
+    // last update. On page hide a beacon outlives the page; fetch may not.
+    const syncProgress = useCallback((useBeacon = false) => {
+        const video = videoRef.current;
+        if (!movieId || !video || syncDisabledRef.current) return;
+
+        const position = Math.floor(video.currentTime);
+        if (!(position > 0) || position === syncedPositionRef.current) return;
+        syncedPositionRef.current = position;
+
+        const url = `/api/videos/${movieId}/progress`;
+        const body = JSON.stringify({ position, completed: video.ended });
+        if (useBeacon && navigator.sendBeacon?.(url, new Blob([body], { type: "application/json" }))) {
+            return;
+        }
+        fetch(url, {
+            method: "POST",
+            headers: { "Content-Type": "application/json" },
+            body,
+            keepalive: true,
+        })
+            .then((response) => {
+                // Anonymous viewers have nowhere to save progress
+                if (response.status === 401) syncDisabledRef.current = true;
+            })
+            .catch(() => {
+                syncedPositionRef.current = null;
+            });
+    }, [movieId]);
+
     // Restore position from localStorage
     const restorePosition = useCallback(() => {
         try {
@@ -215,6 +253,27 @@ export function CustomPlayer({
         };
     }, [savePosition]);
 
+    // Sync position to the server while playing, and when the page is hidden
+    useEffect(() => {
+        const interval = setInterval(() => {
+            if (videoRef.current && !videoRef.current.paused) syncProgress();
+        }, PROGRESS_SYNC_INTERVAL_MS);
+
+        const handleVisibilityChange = () => {
+            if (document.visibilityState === "hidden") syncProgress(true);
+        };
+        const handlePageHide = () => syncProgress(true);
+        document.addEventListener("visibilitychange", handleVisibilityChange);
+        window.addEventListener("pagehide", handlePageHide);
+
+        return () => {
+            clearInterval(interval);
+            document.removeEventListener("visibilitychange", handleVisibilityChange);
+            window.removeEventListener("pagehide", handlePageHide);
+            syncProgress();
+        };
+    }, [syncProgress]);
+
     // Video event listeners
     useEffect(() => {
         const video = videoRef.current;
@@ -226,6 +285,7 @@ export function CustomPlayer({
         const handlePause = () => {
             setIsPlaying(false);
             savePosition();
+            syncProgress();
         };
         const handleWaiting = () => setIsLoading(true);
         const handleCanPlay = () => setIsLoading(false);
@@ -252,7 +312,7 @@ export function CustomPlayer({
             video.removeEventListener("canplay", handleCanPlay);
             video.removeEventListener("progress", handleProgress);
         };
-    }, [savePosition]);
+    }, [savePosition, syncProgress]);
 
     // Keyboard shortcuts
     useEffect(() => {
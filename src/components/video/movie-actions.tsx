@@ -77,6 +77,7 @@ export function MovieActions({ movieId, movieTitle }: MovieActionsProps) {
         <div className="flex items-center gap-3 border-y border-[#7C3AED]/10 py-4">
             <Button
                 variant="ghost"
+                data-testid="movie-actions-watchlist"
                 onClick={handleWatchlist}
                 disabled={isLoading}
                 className={`hover:bg-[#7C3AED]/10 transition-colors ${inWatchlist ? "text-green-400" : "hover:text-[#C4B5FD]"
@@ -97,6 +98,7 @@ export function MovieActions({ movieId, movieTitle }: MovieActionsProps) {
 
             <Button
                 variant="ghost"
+                data-testid="movie-actions-share"
                 onClick={handleShare}
                 className="hover:bg-[#7C3AED]/10 hover:text-[#C4B5FD]"
             >
@@ -1,7 +1,9 @@
 /**
  * Analytics Service for Producer Dashboard
  * 
- * Provides real-time analytics data from movie_views and related tables
+ * Provides real-time analytics data from movie_views and related tables.
+ * Views per day come from the movie_view_daily rollup (migration 012),
+ * which triggers keep in step with movie_views.
  */
 
 import { createClient } from "@/lib/supabase/server";
@@ -65,19 +67,11 @@ export async function getProducerAnalytics(producerId: string): Promise<Producer
     // Estimate revenue (example: $0.001 per view)
     const estimatedRevenue = totalViews * 0.001;
 
-    // Get views by day (last 30 days)
-    const thirtyDaysAgo = new Date();
-    thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
+    // Get views by day (last 30 days), summed over the producer's movies
+    const { data: dailyViews } = await supabase
+        .rpc("producer_views_by_day", { p_producer_id: producerId, p_days: 30 });
 
-    const { data: viewsData } = await supabase
-        .from("movie_views")
-        .select("viewed_at")
-        .in("movie_id", movieIds)
-        .gte("viewed_at", thirtyDaysAgo.toISOString())
-        .order("viewed_at", { ascending: true });
-
-    // Group views by day
-    const viewsByDay = groupViewsByDay(viewsData || []);
+    const viewsByDay = fillViewsByDay(dailyViews || []);
 
     // Get top movies
     const topMovies: TopMovie[] = (movies || [])
@@ -117,9 +111,11 @@ export async function getProducerAnalytics(producerId: string): Promise<Producer
 }
 
 /**
- * Group views by day for chart display
+ * Fill daily rollup rows into the last 30 days for chart display. Both
+ * callers pass at most one row per day: `producer_views_by_day` sums the
+ * producer's movies, and `getMovieAnalytics` reads a single movie.
  */
-function groupViewsByDay(views: { viewed_at: string }[]): DailyViews[] {
+function fillViewsByDay(rows: { day: string; views: number }[]): DailyViews[] {
     const grouped: Record<string, number> = {};
 
     // Initialize last 30 days with 0
@@ -130,11 +126,10 @@ function groupViewsByDay(views: { viewed_at: string }[]): DailyViews[] {
         grouped[dateStr] = 0;
     }
 
-    // Count views per day
-    views.forEach(view => {
-        const dateStr = view.viewed_at.split('T')[0];
-        if (grouped[dateStr] !== undefined) {
-            grouped[dateStr]++;
+    // Add the rollup counts; days outside the window are ignored
+    rows.forEach(row => {
+        if (grouped[row.day] !== undefined) {
+            grouped[row.day] += Number(row.views);
         }
     });
 
@@ -179,15 +174,15 @@ export async function getMovieAnalytics(movieId: string, producerId: string) {
 
     // Get view history
     const thirtyDaysAgo = new Date();
-    thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 30);
+    thirtyDaysAgo.setDate(thirtyDaysAgo.getDate() - 29);
 
-    const { data: viewsData } = await supabase
-        .from("movie_views")
-        .select("viewed_at")
+    const { data: dailyViews } = await supabase
+        .from("movie_view_daily")
+        .select("day, views")
         .eq("movie_id", movieId)
-        .gte("viewed_at", thirtyDaysAgo.toISOString());
+        .gte("day", thirtyDaysAgo.toISOString().split('T')[0]);
 
-    const viewsByDay = groupViewsByDay(viewsData || []);
+    const viewsByDay = fillViewsByDay(dailyViews || []);
 
     return {
         ...movie,
@@ -7,9 +7,15 @@
  * - BUNNY_STREAM_API_KEY: API key from Bunny.net dashboard
  * - BUNNY_STREAM_LIBRARY_ID: Video library ID
  * - NEXT_PUBLIC_BUNNY_CDN_URL: CDN hostname for playback
+ *
+ * Optional:
+ * - BUNNY_STREAM_API_URL: base URL for server-side API calls (e.g. a local
+ *   Bunny Stream emulator in tests). Upload URLs handed to the browser always
+ *   use the public API host.
  */
 
 const BUNNY_API_BASE = "https://video.bunnycdn.com";
+const BUNNY_API_URL = (process.env.BUNNY_STREAM_API_URL || BUNNY_API_BASE).replace(/\/$/, "");
 
 interface BunnyVideoCreateResponse {
     videoLibraryId: number;
@@ -78,7 +84,7 @@ class BunnyStreamService {
         try {
             // Step 1: Create video entry
             const createResponse = await fetch(
-                `${BUNNY_API_BASE}/library/${this.libraryId}/videos`,
+                `${BUNNY_API_URL}/library/${this.libraryId}/videos`,
                 {
                     method: "POST",
                     headers: {
@@ -135,7 +141,7 @@ class BunnyStreamService {
         try {
             const blob = new Blob([file], { type: "application/octet-stream" });
             const response = await fetch(
-                `${BUNNY_API_BASE}/library/${this.libraryId}/videos/${videoId}`,
+                `${BUNNY_API_URL}/library/${this.libraryId}/videos/${videoId}`,
                 {
                     method: "PUT",
                     headers: {
@@ -181,7 +187,7 @@ class BunnyStreamService {
 
         try {
             const response = await fetch(
-                `${BUNNY_API_BASE}/library/${this.libraryId}/videos/${videoId}`,
+                `${BUNNY_API_URL}/library/${this.libraryId}/videos/${videoId}`,
                 {
                     headers: {
                         "AccessKey": this.apiKey,
@@ -206,7 +212,7 @@ class BunnyStreamService {
 
         try {
             const response = await fetch(
-                `${BUNNY_API_BASE}/library/${this.libraryId}/videos/${videoId}`,
+                `${BUNNY_API_URL}/library/${this.libraryId}/videos/${videoId}`,
                 {
                     method: "DELETE",
                     headers: {
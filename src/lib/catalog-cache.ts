@@ -0,0 +1,184 @@
+/**
+ * Catalog cache
+ *
+ * The homepage and `/api/movies/featured` read the same public catalog for
+ * every visitor: approved movies only, no per-user data. Both re-ran their
+ * queries on every request, so the homepage's cost grew with the catalog.
+ * Their results are now cached per server process with
+ * stale-while-revalidate:
+ *
+ * - Within `CATALOG_CACHE_TTL_SECONDS` (default 60) an entry is served as is.
+ * - For `CATALOG_CACHE_STALE_SECONDS` (default 300) after that, the stale
+ *   entry is still served while one background load refreshes it.
+ * - Older or missing entries are loaded before responding. Concurrent
+ *   callers share one load.
+ *
+ * Entries are invalidated by tag. Approving or rejecting a movie drops
+ * everything tagged `catalog`. A view flush that changes the trending order
+ * drops `trending` (see `noteViewTotals`). A load that started before an
+ * invalidation is neither stored nor shared with later callers.
+ *
+ * Hits, stale hits, misses, refreshes, invalidations and errors are counted
+ * per key and served at `/api/debug/cache` in dev and test builds.
+ */
+
+export type CacheOutcome = "hit" | "stale" | "miss";
+
+export const CATALOG_TAG = "catalog";
+export const TRENDING_TAG = "trending";
+
+interface Entry<T> {
+    value: T;
+    fetchedAt: number;
+    tags: string[];
+}
+
+interface KeyStats {
+    hits: number;
+    stale: number;
+    misses: number;
+    refreshes: number;
+    invalidations: number;
+    errors: number;
+}
+
+interface RankedMovie {
+    id: string;
+    total_views?: number | null;
+}
+
+function seconds(name: string, fallback: number): number {
+    const value = Number(process.env[name]);
+    return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+class CatalogCache {
+    private readonly ttlMs = seconds("CATALOG_CACHE_TTL_SECONDS", 60) * 1000;
+    private readonly staleMs = seconds("CATALOG_CACHE_STALE_SECONDS", 300) * 1000;
+    private readonly entries = new Map<string, Entry<unknown>>();
+    private readonly loading = new Map<string, { promise: Promise<unknown>; generation: string }>();
+    private readonly generations = new Map<string, number>();
+    private readonly counters = new Map<string, KeyStats>();
+    private ranking: RankedMovie[] = [];
+
+    /**
+     * The cached value of `key`, loading it with `loader` when missing or
+     * expired. Returns the value and whether it was a hit, stale or a miss.
+     */
+    async get<T>(key: string, tags: string[], loader: () => Promise<T>): Promise<[T, CacheOutcome]> {
+        const entry = this.entries.get(key) as Entry<T> | undefined;
+        const age = entry ? Date.now() - entry.fetchedAt : Infinity;
+
+        if (entry && age < this.ttlMs) {
+            this.stats(key).hits += 1;
+            return [entry.value, "hit"];
+        }
+        if (entry && age < this.ttlMs + this.staleMs) {
+            this.stats(key).stale += 1;
+            this.load(key, tags, loader).catch(() => {
+                // Counted in load(); the stale value is served meanwhile.
+            });
+            return [entry.value, "stale"];
+        }
+
+        this.stats(key).misses += 1;
+        return [await this.load(key, tags, loader), "miss"];
+    }
+
+    /** Drop every entry tagged `tag`, and loads of it that are in flight. */
+    invalidate(tag: string) {
+        this.generations.set(tag, (this.generations.get(tag) ?? 0) + 1);
+        this.entries.forEach((entry, key) => {
+            if (entry.tags.includes(tag)) {
+                this.entries.delete(key);
+                this.stats(key).invalidations += 1;
+            }
+        });
+    }
+
+    /** Remember the trending list a cached entry was built from. */
+    setRanking(movies: RankedMovie[]) {
+        this.ranking = movies.map(({ id, total_views }) => ({ id, total_views: total_views ?? 0 }));
+    }
+
+    /**
+     * New view totals from a flush. Invalidates `trending` when they change
+     * which movies rank in the cached trending list, or their order.
+     */
+    noteViewTotals(totals: { movie_id: string; total_views: number }[]) {
+        if (this.ranking.length === 0 || totals.length === 0) return;
+
+        const updated = new Map(this.ranking.map((movie) => [movie.id, movie.total_views ?? 0]));
+        const floor = Math.min(...updated.values());
+        totals.forEach(({ movie_id, total_views }) => {
+            if (updated.has(movie_id) || total_views > floor) {
+                updated.set(movie_id, total_views);
+            }
+        });
+        const reranked = Array.from(updated)
+            .sort((a, b) => b[1] - a[1])
+            .slice(0, this.ranking.length)
+            .map(([id]) => id);
+
+        if (reranked.some((id, index) => id !== this.ranking[index].id)) {
+            this.ranking = [];
+            this.invalidate(TRENDING_TAG);
+        }
+    }
+
+    snapshot() {
+        return {
+            ttlSeconds: this.ttlMs / 1000,
+            staleSeconds: this.staleMs / 1000,
+            entries: Array.from(this.entries, ([key, entry]) => ({
+                key,
+                tags: entry.tags,
+                ageSeconds: Math.round((Date.now() - entry.fetchedAt) / 100) / 10,
+            })),
+            keys: Object.fromEntries(this.counters),
+        };
+    }
+
+    private load<T>(key: string, tags: string[], loader: () => Promise<T>): Promise<T> {
+        // A load started before an invalidation is not joined or stored.
+        const generation = tags.map((tag) => this.generations.get(tag) ?? 0).join(":");
+        const inFlight = this.loading.get(key);
+        if (inFlight && inFlight.generation === generation) {
+            return inFlight.promise as Promise<T>;
+        }
+
+        const promise = loader()
+            .then((value) => {
+                const current = tags.map((tag) => this.generations.get(tag) ?? 0).join(":");
+                if (current === generation) {
+                    this.entries.set(key, { value, fetchedAt: Date.now(), tags });
+                    this.stats(key).refreshes += 1;
+                }
+                return value;
+            })
+            .catch((error) => {
+                this.stats(key).errors += 1;
+                throw error;
+            })
+            .finally(() => {
+                if (this.loading.get(key)?.promise === promise) this.loading.delete(key);
+            });
+        this.loading.set(key, { promise, generation });
+        return promise;
+    }
+
+    private stats(key: string): KeyStats {
+        let stats = this.counters.get(key);
+        if (!stats) {
+            stats = { hits: 0, stale: 0, misses: 0, refreshes: 0, invalidations: 0, errors: 0 };
+            this.counters.set(key, stats);
+        }
+        return stats;
+    }
+}
+
+// Route handlers and pages are compiled as separate bundles, so the cache
+// lives on globalThis to be shared by every module instance in the process.
+export const catalogCache: CatalogCache = ((
+    globalThis as { __mafiluCatalogCache?: CatalogCache }
+).__mafiluCatalogCache ??= new CatalogCache());
@@ -0,0 +1,179 @@
+/**
+ * Server-Timing instrumentation
+ *
+ * Breaks a request's server time into Supabase auth calls, PostgREST
+ * queries (with the number of database round trips) and the handler's own
+ * work, and reports it in a `Server-Timing` header:
+ *
+ *   Server-Timing: mw-auth;dur=41.2;desc="1 call", auth;dur=38.0;desc="1 call",
+ *                  db;dur=52.7;desc="3 round trips", render;dur=6.1, total;dur=96.8
+ *
+ * - `createClient()` (server and middleware) passes a timed `fetch` to
+ *   Supabase, which classifies each call by path (`/auth/v1/` → auth,
+ *   `/rest/v1/` → db, `/storage/v1/` → storage).
+ * - `withServerTiming()` wraps a route handler in a per-request scope and
+ *   writes the header; `render` is the handler time not spent in Supabase.
+ * - The middleware's own timings are prefixed with `mw-`. They are set on
+ *   its response and forwarded to the handler in a request header, so API
+ *   responses carry both.
+ *
+ * - A request sent with an `x-mafilu-query-log: <id>` header also records its
+ *   Supabase calls under that id, pages included (server components cannot
+ *   set response headers). `/api/debug/queries/<id>` returns the counts, and
+ *   the test suite uses them to enforce round-trip budgets per route.
+ *
+ * Enabled outside production builds, or with `SERVER_TIMING=1`.
+ */
+
+import { AsyncLocalStorage } from "node:async_hooks";
+
+export const MIDDLEWARE_TIMING_HEADER = "x-mafilu-server-timing";
+export const QUERY_LOG_HEADER = "x-mafilu-query-log";
+
+const MAX_QUERY_LOGS = 1000;
+
+type Category = "auth" | "db" | "storage";
+
+export interface TimingSnapshot {
+    roundTrips: number;
+    calls: Partial<Record<Category, number>>;
+    durationsMs: Partial<Record<Category, number>>;
+}
+
+const CATEGORY_PATHS: [string, Category][] = [
+    ["/auth/v1/", "auth"],
+    ["/rest/v1/", "db"],
+    ["/storage/v1/", "storage"],
+];
+
+export function serverTimingEnabled(): boolean {
+    return process.env.NODE_ENV !== "production" || process.env.SERVER_TIMING === "1";
+}
+
+export class ServerTiming {
+    private readonly started = performance.now();
+    private readonly durations = new Map<Category, number>();
+    private readonly counts = new Map<Category, number>();
+
+    constructor(private readonly prefix = "", private readonly upstream = "") {}
+
+    record(category: Category, ms: number) {
+        this.durations.set(category, (this.durations.get(category) ?? 0) + ms);
+        this.counts.set(category, (this.counts.get(category) ?? 0) + 1);
+    }
+
+    /** Supabase round trips so far: auth, db and storage calls. */
+    get roundTrips(): number {
+        let total = 0;
+        this.counts.forEach((count) => (total += count));
+        return total;
+    }
+
+    snapshot(): TimingSnapshot {
+        return {
+            roundTrips: this.roundTrips,
+            calls: Object.fromEntries(this.counts),
+            durationsMs: Object.fromEntries(
+                Array.from(this.durations, ([category, ms]) => [category, Math.round(ms * 10) / 10])
+            ),
+        };
+    }
+
+    header(): string {
+        const total = performance.now() - this.started;
+        const entries: string[] = this.upstream ? [this.upstream] : [];
+        let external = 0;
+        this.durations.forEach((ms, category) => {
+            const count = this.counts.get(category) ?? 0;
+            const unit = category === "db" ? "round trip" : "call";
+            external += ms;
+            entries.push(
+                `${this.prefix}${category};dur=${ms.toFixed(1)};desc="${count} ${unit}${count === 1 ? "" : "s"}"`
+            );
+        });
+        entries.push(`${this.prefix}render;dur=${Math.max(0, total - external).toFixed(1)}`);
+        entries.push(`${this.prefix}total;dur=${total.toFixed(1)}`);
+        return entries.join(", ");
+    }
+}
+
+const storage = new AsyncLocalStorage<ServerTiming>();
+
+/** The timing scope of the current route handler, if any. */
+export function currentServerTiming(): ServerTiming | undefined {
+    return storage.getStore();
+}
+
+// Route handlers and pages are compiled as separate bundles, so the log
+// lives on globalThis to be shared by every module instance in the process.
+const queryLogs: Map<string, ServerTiming> = ((
+    globalThis as { __mafiluQueryLogs?: Map<string, ServerTiming> }
+).__mafiluQueryLogs ??= new Map());
+
+/** The query log for request `id`, created on first use. */
+export function queryLog(id: string): ServerTiming {
+    let log = queryLogs.get(id);
+    if (!log) {
+        if (queryLogs.size >= MAX_QUERY_LOGS) {
+            // Maps iterate in insertion order: drop the oldest log.
+            queryLogs.delete(queryLogs.keys().next().value as string);
+        }
+        log = new ServerTiming();
+        queryLogs.set(id, log);
+    }
+    return log;
+}
+
+export function readQueryLog(id: string): TimingSnapshot | null {
+    return queryLogs.get(id)?.snapshot() ?? null;
+}
+
+function categorize(input: RequestInfo | URL): Category | null {
+    const url = typeof input === "string" ? input : input instanceof URL ? input.href : input.url;
+    const match = CATEGORY_PATHS.find(([path]) => url.includes(path));
+    return match ? match[1] : null;
+}
+
+/**
+ * A `fetch` for Supabase clients that records every call on the current
+ * handler's scope and on `timing` (a middleware timing or a query log).
+ */
+export function timedFetch(timing?: ServerTiming): typeof fetch {
+    return async (input, init) => {
+        const scope = storage.getStore();
+        const targets = [scope, timing].filter(
+            (target, index, all): target is ServerTiming => !!target && all.indexOf(target) === index
+        );
+        const category = targets.length ? categorize(input) : null;
+        if (!category) {
+            return fetch(input, init);
+        }
+        const started = performance.now();
+        try {
+            return await fetch(input, init);
+        } finally {
+            const elapsed = performance.now() - started;
+            targets.forEach((target) => target.record(category, elapsed));
+        }
+    };
+}
+
+/** Wrap a route handler so its response carries a `Server-Timing` header. */
+export function withServerTiming<Args extends unknown[], R extends Response>(
+    handler: (...args: Args) => Promise<R>
+): (...args: Args) => Promise<R> {
+    return async (...args: Args) => {
+        if (!serverTimingEnabled()) {
+            return handler(...args);
+        }
+        const request = args[0] instanceof Request ? args[0] : null;
+        const timing = new ServerTiming("", request?.headers.get(MIDDLEWARE_TIMING_HEADER) ?? "");
+        const response = await storage.run(timing, () => handler(...args));
+        try {
+            response.headers.set("Server-Timing", timing.header());
+        } catch {
+            // Responses such as Response.redirect() have immutable headers.
+        }
+        return response;
+    };
+}
@@ -1,3 +1,4 @@
 export { createClient } from './client';
-export { createClient as createServerClient } from './server';
+export { createClient as createServerClient, getVerifiedUser } from './server';
 export { updateSession } from './middleware';
+export { revokeSession, type VerifiedUser } from './verify';
@@ -1,7 +1,44 @@
 import { createServerClient } from '@supabase/ssr';
 import { NextResponse, type NextRequest } from 'next/server';
+import {
+    MIDDLEWARE_TIMING_HEADER,
+    ServerTiming,
+    serverTimingEnabled,
+    timedFetch,
+} from '@/lib/server-timing';
+import { VERIFIED_USER_HEADER, encodeVerifiedUser, resolveUser, type VerifiedUser } from './verify';
+
+/**
+ * Forward the verified user to the route handler (see `getVerifiedUser`),
+ * and report the middleware's Supabase time on `response`. The handler
+ * folds that into its own Server-Timing header.
+ */
+async function forward(
+    request: NextRequest,
+    response: NextResponse,
+    user: VerifiedUser | null,
+    timing?: ServerTiming
+) {
+    const value = timing?.header();
+    if (response.headers.has('location')) {
+        if (value) response.headers.set('Server-Timing', value);
+        return response;
+    }
+    // Request headers are captured when NextResponse.next() is created, so
+    // build a new one and carry over the refreshed session cookies.
+    const verified = await encodeVerifiedUser(user);
+    if (verified !== null) request.headers.set(VERIFIED_USER_HEADER, verified);
+    if (value) request.headers.set(MIDDLEWARE_TIMING_HEADER, value);
+    const forwarded = NextResponse.next({ request });
+    response.cookies.getAll().forEach((cookie) => forwarded.cookies.set(cookie));
+    if (value) forwarded.headers.set('Server-Timing', value);
+    return forwarded;
+}
 
 export async function updateSession(request: NextRequest) {
+    // Only this middleware may say who the user is
+    request.headers.delete(VERIFIED_USER_HEADER);
+
     let supabaseResponse = NextResponse.next({
         request,
     });
@@ -16,10 +53,13 @@ export async function updateSession(request: NextRequest) {
         return supabaseResponse;
     }
 
+    const timing = serverTimingEnabled() ? new ServerTiming('mw-') : undefined;
+
     const supabase = createServerClient(
         supabaseUrl,
         supabaseAnonKey,
         {
+            global: timing ? { fetch: timedFetch(timing) } : undefined,
             cookies: {
                 getAll() {
                     return request.cookies.getAll();
@@ -40,12 +80,10 @@ export async function updateSession(request: NextRequest) {
     );
 
     // IMPORTANT: Avoid writing any logic between createServerClient and
-    // supabase.auth.getUser(). A simple mistake could make it very hard to debug
+    // resolveUser(). A simple mistake could make it very hard to debug
     // issues with users being randomly logged out.
 
-    const {
-        data: { user },
-    } = await supabase.auth.getUser();
+    const user = await resolveUser(supabase);
 
     // Protected routes - redirect to login if not authenticated
     const protectedPaths = ['/dashboard', '/movies', '/earnings', '/settings', '/producer', '/admin', '/account'];
@@ -57,7 +95,7 @@ export async function updateSession(request: NextRequest) {
         const url = request.nextUrl.clone();
         url.pathname = '/login';
         url.searchParams.set('redirect', request.nextUrl.pathname);
-        return NextResponse.redirect(url);
+        return forward(request, NextResponse.redirect(url), user, timing);
     }
 
     // Producer-only routes - redirect to home if not a producer
@@ -85,7 +123,7 @@ export async function updateSession(request: NextRequest) {
             if (profile?.role !== 'producer' && profile?.role !== 'admin' && profile?.role !== 'super_admin') {
                 const url = request.nextUrl.clone();
                 url.pathname = '/';
-                return NextResponse.redirect(url);
+                return forward(request, NextResponse.redirect(url), user, timing);
             }
         }
 
@@ -94,7 +132,7 @@ export async function updateSession(request: NextRequest) {
             if (profile?.role !== 'admin' && profile?.role !== 'super_admin') {
                 const url = request.nextUrl.clone();
                 url.pathname = '/';
-                return NextResponse.redirect(url);
+                return forward(request, NextResponse.redirect(url), user, timing);
             }
         }
     }
@@ -108,8 +146,8 @@ export async function updateSession(request: NextRequest) {
     if (isAuthPath && user) {
         const url = request.nextUrl.clone();
         url.pathname = '/';
-        return NextResponse.redirect(url);
+        return forward(request, NextResponse.redirect(url), user, timing);
     }
 
-    return supabaseResponse;
+    return forward(request, supabaseResponse, user, timing);
 }
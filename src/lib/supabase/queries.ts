@@ -3,10 +3,15 @@
  * 
  * Centralized query functions for fetching data from Supabase
  * All queries respect Row Level Security (RLS) policies
+ *
+ * Homepage catalog reads are public and the same for every visitor, so they
+ * go through the shared catalog cache (`@/lib/catalog-cache`).
  */
 
-import { createClient } from "./server";
+import { createPublicClient } from "./server";
 import { bunnyStream } from "@/lib/bunny";
+import { CATALOG_TAG, catalogCache } from "@/lib/catalog-cache";
+import { DEFAULT_PAGE_SIZE, afterCursor, decodeCursor, toPage, type Page } from "@/lib/pagination";
 import type { Movie, MovieGenre } from "@/types/database";
 
 export interface FeaturedMovie {
@@ -48,39 +53,41 @@ export interface MovieCard {
  */
 export async function getFeaturedMovies(): Promise<FeaturedMovie[]> {
   try {
-    const supabase = await createClient();
+    const [value] = await catalogCache.get("home:hero", [CATALOG_TAG], loadFeaturedMovies);
+    return value;
+  } catch (error) {
+    console.error("Error in getFeaturedMovies:", error);
+    return [];
+  }
+}
 
-    const { data: movies, error } = await supabase
-      .from("movies")
-      .select("id, title, description, genre, release_year, duration_seconds, bunny_video_id, thumbnail_url, featured, featured_order, created_at, average_rating, rating_count")
-      .eq("status", "approved")
-      .eq("featured", true)
-      .order("featured_order", { ascending: true, nullsFirst: false })
-      .order("created_at", { ascending: false })
-      .limit(5);
+async function loadFeaturedMovies(): Promise<FeaturedMovie[]> {
+  const supabase = await createPublicClient();
 
-    if (error) {
-      console.error("Error fetching featured movies:", error);
-      return [];
-    }
+  const { data: movies, error } = await supabase
+    .from("movies")
+    .select("id, title, description, genre, release_year, duration_seconds, bunny_video_id, thumbnail_url, featured, featured_order, created_at, average_rating, rating_count")
+    .eq("status", "approved")
+    .eq("featured", true)
+    .order("featured_order", { ascending: true, nullsFirst: false })
+    .order("created_at", { ascending: false })
+    .limit(5);
 
-    if (!movies || movies.length === 0) {
-      // Fallback: get most recent approved movies if no featured movies
-      const { data: fallbackMovies } = await supabase
-        .from("movies")
-        .select("id, title, description, genre, release_year, duration_seconds, bunny_video_id, thumbnail_url, created_at, average_rating, rating_count")
-        .eq("status", "approved")
-        .order("created_at", { ascending: false })
-        .limit(3);
+  if (error) throw error;
 
-      return (fallbackMovies || []).map((movie, index) => formatFeaturedMovie(movie, index));
-    }
+  if (!movies || movies.length === 0) {
+    // Fallback: get most recent approved movies if no featured movies
+    const { data: fallbackMovies } = await supabase
+      .from("movies")
+      .select("id, title, description, genre, release_year, duration_seconds, bunny_video_id, thumbnail_url, created_at, average_rating, rating_count")
+      .eq("status", "approved")
+      .order("created_at", { ascending: false })
+      .limit(3);
 
-    return movies.map((movie, index) => formatFeaturedMovie(movie, index));
-  } catch (error) {
-    console.error("Error in getFeaturedMovies:", error);
-    return [];
+    return (fallbackMovies || []).map((movie, index) => formatFeaturedMovie(movie, index));
   }
+
+  return movies.map((movie, index) => formatFeaturedMovie(movie, index));
 }
 
 /**
@@ -139,114 +146,172 @@ function formatFeaturedMovie(movie: any, index: number): FeaturedMovie {
  */
 export async function getMovieCategories(): Promise<MovieCategory[]> {
   try {
-    const supabase = await createClient();
+    const [value] = await catalogCache.get("home:categories", [CATALOG_TAG], loadMovieCategories);
+    return value;
+  } catch (error) {
+    console.error("Error in getMovieCategories:", error);
+    return [];
+  }
+}
 
-    // Get all approved movies
-    const { data: allMovies, error } = await supabase
-      .from("movies")
-      .select("id, title, description, genre, release_year, bunny_video_id, thumbnail_url, featured, created_at, average_rating, rating_count")
-      .eq("status", "approved")
-      .order("created_at", { ascending: false });
+async function loadMovieCategories(): Promise<MovieCategory[]> {
+  const supabase = await createPublicClient();
 
-    if (error) {
-      console.error("Error fetching movies for categories:", error);
-      return [];
-    }
+  // Up to six movies per category, in one round trip (migration 014)
+  const { data: rows, error } = await supabase.rpc("home_category_movies", { p_limit: 6 });
 
-    if (!allMovies || allMovies.length === 0) {
-      return [];
-    }
+  if (error) throw error;
+
+  if (!rows || rows.length === 0) {
+    return [];
+  }
 
-    const now = new Date();
-    const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
-
-    // Format movies for cards
-    const formattedMovies = allMovies.map((movie) => {
-      // Calculate rating from average_rating field (calculated by trigger)
-      const rating = movie.average_rating
-        ? movie.average_rating.toFixed(1)
-        : movie.rating_count && movie.rating_count > 0
-          ? "N/A"
-          : "Yeni";
-
-      return {
-        id: movie.id,
-        title: movie.title,
-        description: movie.description,
-        genre: formatGenre(movie.genre),
-        year: movie.release_year,
-        rating,
-        isNew: new Date(movie.created_at) > thirtyDaysAgo,
-        isOriginal: movie.featured || false,
-        thumbnailUrl: movie.thumbnail_url
-          || (movie.bunny_video_id ? bunnyStream.getThumbnailUrl(movie.bunny_video_id) : undefined),
-      };
+  const now = new Date();
+  const thirtyDaysAgo = new Date(now.getTime() - 30 * 24 * 60 * 60 * 1000);
+
+  // Format movies for cards, grouped by category
+  const byCategory = new Map<string, MovieCard[]>();
+  (rows as HomeCategoryRow[]).forEach((movie) => {
+    // Calculate rating from average_rating field (calculated by trigger)
+    const rating = movie.average_rating
+      ? Number(movie.average_rating).toFixed(1)
+      : movie.rating_count && movie.rating_count > 0
+        ? "N/A"
+        : "Yeni";
+
+    const movies = byCategory.get(movie.category) || [];
+    movies.push({
+      id: movie.id,
+      title: movie.title,
+      description: movie.description,
+      genre: formatGenre(movie.genre),
+      year: movie.release_year,
+      rating,
+      isNew: new Date(movie.created_at) > thirtyDaysAgo,
+      isOriginal: movie.featured || false,
+      thumbnailUrl: movie.thumbnail_url
+        || (movie.bunny_video_id ? bunnyStream.getThumbnailUrl(movie.bunny_video_id) : undefined),
     });
+    byCategory.set(movie.category, movies);
+  });
 
-    // Build categories
-    const categories: MovieCategory[] = [];
+  // Build categories
+  const categories: MovieCategory[] = [];
+  const recent = byCategory.get("recent") || [];
 
+  const rowsInOrder: [string, string, MovieCard[]][] = [
     // 1. Mafilu Orijinalleri (Featured movies)
-    const originals = formattedMovies
-      .filter((m) => m.isOriginal)
-      .slice(0, 6);
-    if (originals.length > 0) {
-      categories.push({
-        id: "originals",
-        title: "Mafilu Orijinalleri",
-        movies: originals,
-      });
+    ["originals", "Mafilu Orijinalleri", byCategory.get("originals") || []],
+    // 2. Şu An Trend (Most recent)
+    ["trending", "Şu An Trend", recent],
+    // 3. Festival Ödüllü (Older movies, released before 2024)
+    ["awards", "Festival Ödüllü", byCategory.get("awards") || []],
+    // 4. Türk Sineması (All Turkish movies - assuming genre-based or all for now)
+    ["turkish", "Türk Sineması", recent],
+    // 5. Belgeseller (Documentary genre)
+    ["documentary", "Belgeseller", byCategory.get("documentary") || []],
+  ];
+  rowsInOrder.forEach(([id, title, movies]) => {
+    if (movies.length > 0) {
+      categories.push({ id, title, movies });
     }
+  });
 
-    // 2. Şu An Trend (Most recent, limit 6)
-    const trending = formattedMovies.slice(0, 6);
-    if (trending.length > 0) {
-      categories.push({
-        id: "trending",
-        title: "Şu An Trend",
-        movies: trending,
-      });
-    }
+  return categories;
+}
 
-    // 3. Festival Ödüllü (Older movies, released before 2024)
-    const awards = formattedMovies
-      .filter((m) => m.year && m.year < 2024)
-      .slice(0, 6);
-    if (awards.length > 0) {
-      categories.push({
-        id: "awards",
-        title: "Festival Ödüllü",
-        movies: awards,
-      });
-    }
+interface HomeCategoryRow {
+  category: string;
+  id: string;
+  title: string;
+  description: string | null;
+  genre: MovieGenre;
+  release_year: number | null;
+  bunny_video_id: string | null;
+  thumbnail_url: string | null;
+  featured: boolean | null;
+  created_at: string;
+  average_rating: number | string | null;
+  rating_count: number | null;
+}
 
-    // 4. Türk Sineması (All Turkish movies - assuming genre-based or all for now)
-    const turkish = formattedMovies.slice(0, 6);
-    if (turkish.length > 0) {
-      categories.push({
-        id: "turkish",
-        title: "Türk Sineması",
-        movies: turkish,
-      });
-    }
+export type BrowseSort = "newest" | "oldest" | "popular";
 
-    // 5. Belgeseller (Documentary genre)
-    const documentaries = formattedMovies
-      .filter((m) => m.genre.toLowerCase().includes("belgesel") || m.genre === "documentary")
-      .slice(0, 6);
-    if (documentaries.length > 0) {
-      categories.push({
-        id: "documentary",
-        title: "Belgeseller",
-        movies: documentaries,
-      });
-    }
+export interface BrowseMovie {
+  id: string;
+  title: string;
+  genre: string;
+  release_year: number | null;
+  total_views: number;
+  thumbnailUrl?: string;
+}
 
-    return categories;
-  } catch (error) {
-    console.error("Error in getMovieCategories:", error);
-    return [];
-  }
+export interface BrowseOptions {
+  sort?: BrowseSort;
+  genre?: string | null;
+  year?: number | null;
+  cursor?: string | null;
+  limit?: number;
+}
+
+// Release year, missing years last (migration 015), as browse always sorted
+const BROWSE_ORDER: Record<BrowseSort, { column: "release_order" | "total_views"; ascending: boolean }> = {
+  newest: { column: "release_order", ascending: false },
+  oldest: { column: "release_order", ascending: true },
+  popular: { column: "total_views", ascending: false },
+};
+
+export function isBrowseSort(value: string | null): value is BrowseSort {
+  return value !== null && value in BROWSE_ORDER;
+}
+
+/**
+ * One page of approved movies for /browse, card columns only
+ * Keyset-paginated on (release_order, id) or (total_views, id); pass the
+ * returned `nextCursor` back to continue. Throws InvalidCursorError for a
+ * cursor that did not come from here.
+ */
+export async function getBrowsePage({
+  sort = "newest",
+  genre = null,
+  year = null,
+  cursor = null,
+  limit = DEFAULT_PAGE_SIZE,
+}: BrowseOptions = {}): Promise<Page<BrowseMovie>> {
+  const { column, ascending } = BROWSE_ORDER[sort];
+  const after = decodeCursor(cursor);
+  const supabase = await createPublicClient();
+
+  let query = supabase
+    .from("movies")
+    .select("id, title, genre, release_year, release_order, total_views, bunny_video_id, thumbnail_url")
+    .eq("status", "approved");
+
+  if (genre) query = query.eq("genre", genre);
+  if (year) query = query.eq("release_year", year);
+  if (after) query = query.or(afterCursor(column, after, ascending));
+
+  // One extra row tells whether there is another page
+  const { data, error } = await query
+    .order(column, { ascending })
+    .order("id", { ascending })
+    .limit(limit + 1);
+
+  if (error) throw error;
+
+  const page = toPage(data || [], limit, (movie) => movie[column]);
+  return {
+    items: page.items.map((movie) => ({
+      id: movie.id,
+      title: movie.title,
+      genre: movie.genre,
+      release_year: movie.release_year,
+      total_views: movie.total_views || 0,
+      thumbnailUrl: movie.thumbnail_url
+        || (movie.bunny_video_id ? bunnyStream.getThumbnailUrl(movie.bunny_video_id) : undefined),
+    })),
+    nextCursor: page.nextCursor,
+  };
 }
 
 /**
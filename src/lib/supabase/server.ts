@@ -1,13 +1,23 @@
 import { createServerClient } from '@supabase/ssr';
-import { cookies } from 'next/headers';
+import { createClient as createSupabaseClient } from '@supabase/supabase-js';
+import { cookies, headers } from 'next/headers';
+import { cache } from 'react';
+import { QUERY_LOG_HEADER, queryLog, serverTimingEnabled, timedFetch } from '@/lib/server-timing';
+import { VERIFIED_USER_HEADER, decodeVerifiedUser, resolveUser } from './verify';
 
 export async function createClient() {
     const cookieStore = await cookies();
+    const logId = serverTimingEnabled() ? (await headers()).get(QUERY_LOG_HEADER) : null;
 
     return createServerClient(
         process.env.NEXT_PUBLIC_SUPABASE_URL || 'https://placeholder.supabase.co',
         process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || 'placeholder-key',
         {
+            // Calls made inside withServerTiming() are reported in Server-Timing,
+            // and in the request's query log when the caller asked for one.
+            global: serverTimingEnabled()
+                ? { fetch: timedFetch(logId ? queryLog(logId) : undefined) }
+                : undefined,
             cookies: {
                 getAll() {
                     return cookieStore.getAll();
@@ -27,3 +37,47 @@ export async function createClient() {
         }
     );
 }
+
+/**
+ * A client without the visitor's session, for public catalog reads that are
+ * cached and shared between visitors. It never reads or sets cookies, so a
+ * cached load does not depend on who triggered it.
+ */
+export async function createPublicClient() {
+    let logId: string | null = null;
+    if (serverTimingEnabled()) {
+        try {
+            logId = (await headers()).get(QUERY_LOG_HEADER);
+        } catch {
+            // Called outside a request, e.g. from a timer.
+        }
+    }
+
+    return createSupabaseClient(
+        process.env.NEXT_PUBLIC_SUPABASE_URL || 'https://placeholder.supabase.co',
+        process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || 'placeholder-key',
+        {
+            auth: { persistSession: false, autoRefreshToken: false },
+            global: serverTimingEnabled()
+                ? { fetch: timedFetch(logId ? queryLog(logId) : undefined) }
+                : undefined,
+        }
+    );
+}
+
+/**
+ * The signed-in user, or null. The middleware has already verified the
+ * session and forwards the user, so this is usually free; requests the
+ * middleware does not see verify it here. Memoized per request, so layouts,
+ * pages and handlers can all call it.
+ */
+export const getVerifiedUser = cache(async () => {
+    // Trusted only with the middleware's signature: routes outside its
+    // matcher receive whatever header the client sent
+    const forwarded = (await headers()).get(VERIFIED_USER_HEADER);
+    if (forwarded !== null) {
+        const user = await decodeVerifiedUser(forwarded);
+        if (user !== undefined) return user;
+    }
+    return resolveUser(await createClient());
+});
@@ -0,0 +1,374 @@
+import type { SupabaseClient, User } from '@supabase/supabase-js';
+
+/**
+ * Verified sessions without a GoTrue round trip
+ *
+ * `supabase.auth.getUser()` asks GoTrue whether the session's access token
+ * is still good. That is a network round trip, and the middleware and most
+ * handlers each made one on every request. The token is a JWT signed for
+ * the project, so its signature and claims can be checked locally:
+ *
+ * - Projects with asymmetric signing keys (ES256 or RS256) publish them at
+ *   `/auth/v1/.well-known/jwks.json`. The key set is cached for an hour, and
+ *   fetched again when a token names a key that is not in it.
+ * - Projects on the shared secret (HS256) need `SUPABASE_JWT_SECRET`.
+ *
+ * A verified token is memoized for `AUTH_VERIFY_TTL_SECONDS` (default 30),
+ * so requests that repeat it skip the crypto as well. Some answers only
+ * GoTrue has, so `resolveUser` still calls `getUser()` when:
+ *
+ * - the token expires within a minute, i.e. its refresh failed;
+ * - its session was revoked in this module instance: signed out through
+ *   `revokeSession`, or found gone by an earlier remote check;
+ * - its session has not been confirmed by GoTrue for
+ *   `AUTH_SESSION_RECHECK_SECONDS` (default 300).
+ *
+ * The revocation list is per module instance, and the middleware is an
+ * instance of its own: the signout handler's `revokeSession` does not
+ * reach it. So a copy of a signed-out access token, like a sign-out from
+ * another device or process, keeps verifying in the middleware until the
+ * session's next recheck, i.e. for up to `AUTH_SESSION_RECHECK_SECONDS`.
+ * - there is no key to check it with;
+ * - `AUTH_LOCAL_VERIFY=0` turns local verification off.
+ *
+ * The middleware resolves the user once and forwards it to handlers in the
+ * `x-mafilu-verified-user` request header (see `getVerifiedUser`). The
+ * value carries an HMAC under a server secret, so a handler can tell it
+ * from one a client sent to a route the middleware does not run on. This
+ * module runs in the middleware as well, so it only uses Web APIs.
+ */
+
+export const VERIFIED_USER_HEADER = 'x-mafilu-verified-user';
+
+/** The parts of a Supabase user that the access token carries. */
+export interface VerifiedUser {
+    id: string;
+    email?: string;
+    role: string;
+    app_metadata: Record<string, unknown>;
+    session_id?: string;
+    /** Token expiry, in seconds since the epoch */
+    expires_at: number;
+}
+
+type Verification =
+    | { status: 'valid'; user: VerifiedUser }
+    | { status: 'invalid' }
+    | { status: 'remote'; reason: 'expiring' | 'revoked' | 'unconfirmed' | 'no-key' | 'disabled' };
+
+interface Claims {
+    sub?: string;
+    exp?: number;
+    iss?: string;
+    aud?: string | string[];
+    role?: string;
+    email?: string;
+    session_id?: string;
+    app_metadata?: Record<string, unknown>;
+}
+
+interface Jwk extends JsonWebKey {
+    kid?: string;
+}
+
+const EXPIRY_MARGIN_MS = 60 * 1000;
+const JWKS_TTL_MS = 60 * 60 * 1000;
+// Access tokens live an hour at most; older revocations no longer matter
+const REVOKED_TTL_MS = 60 * 60 * 1000;
+// Unknown key ids trigger a refetch, at most this often
+const JWKS_REFETCH_MS = 30 * 1000;
+const MAX_TOKENS = 10000;
+const MAX_SESSIONS = 50000;
+
+function seconds(name: string, fallback: number): number {
+    const value = Number(process.env[name]);
+    return Number.isFinite(value) && value >= 0 ? value : fallback;
+}
+
+const localVerify = process.env.AUTH_LOCAL_VERIFY !== '0';
+const verifyTtlMs = seconds('AUTH_VERIFY_TTL_SECONDS', 30) * 1000;
+const sessionRecheckMs = seconds('AUTH_SESSION_RECHECK_SECONDS', 300) * 1000;
+
+const verified = new Map<string, { user: VerifiedUser; until: number }>();
+const confirmedSessions = new Map<string, number>();
+const revokedSessions = new Map<string, number>();
+const keys = new Map<string, Promise<CryptoKey>>();
+let jwks: { keys: Jwk[]; fetchedAt: number } | null = null;
+let jwksLoading: Promise<Jwk[]> | null = null;
+
+function decodeBase64Url(segment: string): Uint8Array<ArrayBuffer> {
+    const base64 = segment.replace(/-/g, '+').replace(/_/g, '/');
+    const binary = atob(base64.padEnd(base64.length + ((4 - (base64.length % 4)) % 4), '='));
+    const bytes = new Uint8Array(binary.length);
+    for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+    return bytes;
+}
+
+function decodeJson<T>(segment: string): T | null {
+    try {
+        return JSON.parse(new TextDecoder().decode(decodeBase64Url(segment))) as T;
+    } catch {
+        return null;
+    }
+}
+
+/** Remember `key` under `map`, dropping the oldest entry past `max`. */
+function remember<V>(map: Map<string, V>, key: string, value: V, max: number) {
+    map.delete(key);
+    map.set(key, value);
+    if (map.size > max) {
+        map.delete(map.keys().next().value as string);
+    }
+}
+
+function supabaseUrl(): string {
+    return (process.env.NEXT_PUBLIC_SUPABASE_URL || '').replace(/\/$/, '');
+}
+
+async function fetchJwks(): Promise<Jwk[]> {
+    if (jwks && Date.now() - jwks.fetchedAt < JWKS_REFETCH_MS) return jwks.keys;
+    jwksLoading ??= fetch(`${supabaseUrl()}/auth/v1/.well-known/jwks.json`, {
+        headers: { apikey: process.env.NEXT_PUBLIC_SUPABASE_ANON_KEY || '' },
+    })
+        .then(async (res) => {
+            const body = res.ok ? await res.json() as { keys?: Jwk[] } : {};
+            jwks = { keys: body.keys || [], fetchedAt: Date.now() };
+            return jwks.keys;
+        })
+        .catch(() => jwks?.keys || [])
+        .finally(() => {
+            jwksLoading = null;
+        });
+    return jwksLoading;
+}
+
+async function signingKey(alg: string, kid: string | undefined): Promise<CryptoKey | null> {
+    if (alg === 'HS256') {
+        const secret = process.env.SUPABASE_JWT_SECRET;
+        if (!secret) return null;
+        let key = keys.get('hs256');
+        if (!key) {
+            key = crypto.subtle.importKey(
+                'raw', new TextEncoder().encode(secret), { name: 'HMAC', hash: 'SHA-256' }, false, ['verify']
+            );
+            keys.set('hs256', key);
+        }
+        return key;
+    }
+
+    if ((alg !== 'ES256' && alg !== 'RS256') || !kid) return null;
+    const cached = keys.get(kid);
+    if (cached) return cached;
+
+    const stale = !jwks || Date.now() - jwks.fetchedAt > JWKS_TTL_MS;
+    let jwk = stale ? undefined : jwks?.keys.find((candidate) => candidate.kid === kid);
+    if (!jwk) {
+        jwk = (await fetchJwks()).find((candidate) => candidate.kid === kid);
+    }
+    if (!jwk) return null;
+
+    const algorithm = alg === 'ES256'
+        ? { name: 'ECDSA', namedCurve: 'P-256' }
+        : { name: 'RSASSA-PKCS1-v1_5', hash: 'SHA-256' };
+    const key = crypto.subtle.importKey('jwk', jwk, algorithm, false, ['verify']);
+    keys.set(kid, key);
+    return key;
+}
+
+function checkClaims(claims: Claims): claims is Claims & { sub: string; exp: number } {
+    const audiences = Array.isArray(claims.aud) ? claims.aud : [claims.aud];
+    return typeof claims.sub === 'string'
+        && typeof claims.exp === 'number'
+        && claims.role === 'authenticated'
+        && audiences.includes('authenticated')
+        && (!claims.iss || claims.iss === `${supabaseUrl()}/auth/v1`);
+}
+
+/** Check `token` locally; see the module comment for when it says "remote". */
+export async function verifyAccessToken(token: string): Promise<Verification> {
+    if (!localVerify) {
+        return { status: 'remote', reason: 'disabled' };
+    }
+    const now = Date.now();
+    const memo = verified.get(token);
+    if (memo && now < memo.until && !isRevoked(memo.user.session_id)) {
+        return { status: 'valid', user: memo.user };
+    }
+
+    const [headerPart, payloadPart, signaturePart] = token.split('.');
+    const header = headerPart ? decodeJson<{ alg?: string; kid?: string }>(headerPart) : null;
+    const claims = payloadPart ? decodeJson<Claims>(payloadPart) : null;
+    if (!header?.alg || !claims || !signaturePart || !checkClaims(claims)) {
+        return { status: 'invalid' };
+    }
+
+    // Only GoTrue knows about refreshes and sign-outs
+    if (claims.exp * 1000 - now < EXPIRY_MARGIN_MS) {
+        return { status: 'remote', reason: 'expiring' };
+    }
+    if (isRevoked(claims.session_id)) {
+        return { status: 'remote', reason: 'revoked' };
+    }
+    const confirmedAt = claims.session_id ? confirmedSessions.get(claims.session_id) : undefined;
+    if (confirmedAt === undefined || now - confirmedAt > sessionRecheckMs) {
+        return { status: 'remote', reason: 'unconfirmed' };
+    }
+
+    const key = await signingKey(header.alg, header.kid);
+    if (!key) {
+        return { status: 'remote', reason: 'no-key' };
+    }
+    const algorithm = header.alg === 'ES256'
+        ? { name: 'ECDSA', hash: 'SHA-256' }
+        : header.alg === 'RS256' ? { name: 'RSASSA-PKCS1-v1_5' } : { name: 'HMAC' };
+    const valid = await crypto.subtle.verify(
+        algorithm,
+        key,
+        decodeBase64Url(signaturePart),
+        new TextEncoder().encode(`${headerPart}.${payloadPart}`)
+    );
+    if (!valid) {
+        return { status: 'invalid' };
+    }
+
+    const user: VerifiedUser = {
+        id: claims.sub,
+        email: claims.email,
+        role: claims.role || 'authenticated',
+        app_metadata: claims.app_metadata || {},
+        session_id: claims.session_id,
+        expires_at: claims.exp,
+    };
+    remember(verified, token, {
+        user,
+        until: Math.min(now + verifyTtlMs, claims.exp * 1000 - EXPIRY_MARGIN_MS),
+    }, MAX_TOKENS);
+    return { status: 'valid', user };
+}
+
+function isRevoked(sessionId: string | undefined): boolean {
+    if (!sessionId) return false;
+    const revokedAt = revokedSessions.get(sessionId);
+    if (revokedAt !== undefined && Date.now() - revokedAt > REVOKED_TTL_MS) {
+        revokedSessions.delete(sessionId);
+        return false;
+    }
+    return revokedAt !== undefined;
+}
+
+/**
+ * Stop trusting tokens of `sessionId` in this module instance, e.g. after
+ * signing out. Other instances (the middleware) notice at their next
+ * recheck of the session; see the module comment.
+ */
+export function revokeSession(sessionId: string | undefined) {
+    if (!sessionId) return;
+    confirmedSessions.delete(sessionId);
+    remember(revokedSessions, sessionId, Date.now(), MAX_SESSIONS);
+}
+
+/** The session id a token claims, without verifying it. */
+export function tokenSessionId(token: string): string | undefined {
+    return decodeJson<Claims>(token.split('.')[1] || '')?.session_id;
+}
+
+/**
+ * The signed-in user of `supabase`'s session, verified locally when
+ * possible and by GoTrue otherwise. Null when signed out.
+ */
+export async function resolveUser(supabase: SupabaseClient): Promise<VerifiedUser | null> {
+    // Reads the session from the cookies, refreshing it when about to expire
+    const { data: { session } } = await supabase.auth.getSession();
+    if (!session) return null;
+
+    const verification = await verifyAccessToken(session.access_token);
+    if (verification.status === 'valid') return verification.user;
+    if (verification.status === 'invalid') return null;
+
+    const sessionId = tokenSessionId(session.access_token);
+    const { data: { user } } = await supabase.auth.getUser();
+    if (!user) {
+        revokeSession(sessionId);
+        return null;
+    }
+
+    // getUser() may have refreshed the session; describe the current token
+    const { data: { session: current } } = await supabase.auth.getSession();
+    const currentSessionId = current ? tokenSessionId(current.access_token) : sessionId;
+    if (currentSessionId) {
+        revokedSessions.delete(currentSessionId);
+        remember(confirmedSessions, currentSessionId, Date.now(), MAX_SESSIONS);
+    }
+    return fromUser(user, currentSessionId, current?.expires_at ?? session.expires_at);
+}
+
+function fromUser(user: User, sessionId: string | undefined, expiresAt: number | undefined): VerifiedUser {
+    return {
+        id: user.id,
+        email: user.email,
+        role: user.role || 'authenticated',
+        app_metadata: user.app_metadata || {},
+        session_id: sessionId,
+        expires_at: expiresAt ?? 0,
+    };
+}
+
+function encodeBase64Url(bytes: Uint8Array): string {
+    let binary = '';
+    for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i]);
+    return btoa(binary).replace(/\+/g, '-').replace(/\//g, '_').replace(/=+$/, '');
+}
+
+/** HMAC key for forwarded users, or null when no server secret is set. */
+function forwardKey(): Promise<CryptoKey> | null {
+    // Server-only secrets the middleware and handlers both have
+    const secret = process.env.SUPABASE_JWT_SECRET || process.env.SUPABASE_SERVICE_ROLE_KEY;
+    if (!secret) return null;
+    let key = keys.get('forward');
+    if (!key) {
+        key = crypto.subtle.importKey(
+            'raw', new TextEncoder().encode(`mafilu-forward:${secret}`), { name: 'HMAC', hash: 'SHA-256' },
+            false, ['sign', 'verify']
+        );
+        keys.set('forward', key);
+    }
+    return key;
+}
+
+/**
+ * Signed header value for forwarding `user` to handlers ("payload.hmac",
+ * with an empty payload when signed out), or null when there is no secret
+ * to sign with and handlers must verify the session themselves.
+ */
+export async function encodeVerifiedUser(user: VerifiedUser | null): Promise<string | null> {
+    const key = forwardKey();
+    if (!key) return null;
+    const payload = user ? encodeBase64Url(new TextEncoder().encode(JSON.stringify(user))) : '';
+    const signature = await crypto.subtle.sign('HMAC', await key, new TextEncoder().encode(payload));
+    return `${payload}.${encodeBase64Url(new Uint8Array(signature))}`;
+}
+
+/**
+ * The user in a value from `encodeVerifiedUser`: null when signed out, and
+ * undefined when the value was not signed here and must not be trusted.
+ */
+export async function decodeVerifiedUser(value: string): Promise<VerifiedUser | null | undefined> {
+    const key = forwardKey();
+    const dot = value.lastIndexOf('.');
+    if (!key || dot < 0) return undefined;
+    const payload = value.slice(0, dot);
+    let valid = false;
+    try {
+        valid = await crypto.subtle.verify(
+            'HMAC', await key, decodeBase64Url(value.slice(dot + 1)), new TextEncoder().encode(payload)
+        );
+    } catch {
+        return undefined;
+    }
+    if (!valid) return undefined;
+    if (!payload) return null;
+    const user = decodeJson<VerifiedUser>(payload);
+    // A replayed value must not outlive the token it was verified from
+    if (!user || user.expires_at * 1000 <= Date.now()) return undefined;
+    return user;
+}
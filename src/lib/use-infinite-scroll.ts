@@ -0,0 +1,30 @@
+import { useEffect, useRef } from "react";
+
+// Start loading the next page this far before the end of the list
+const SCROLL_MARGIN = "800px 0px";
+
+/**
+ * Ref for a sentinel element after a paginated list: `onVisible` is called
+ * when it comes near the viewport while `enabled`. The observer is created
+ * again whenever `onVisible` or `enabled` change (after every page), so a
+ * sentinel that is still visible loads the next page as well.
+ */
+export function useInfiniteScroll<T extends HTMLElement = HTMLDivElement>(
+    onVisible: () => void,
+    enabled: boolean
+) {
+    const ref = useRef<T>(null);
+
+    useEffect(() => {
+        const node = ref.current;
+        if (!node || !enabled) return;
+
+        const observer = new IntersectionObserver((entries) => {
+            if (entries.some((entry) => entry.isIntersecting)) onVisible();
+        }, { rootMargin: SCROLL_MARGIN });
+        observer.observe(node);
+        return () => observer.disconnect();
+    }, [onVisible, enabled]);
+
+    return ref;
+}
@@ -0,0 +1,193 @@
+/**
+ * Buffered view counting
+ *
+ * `POST /api/videos/[id]/view` runs once per playback, so writing
+ * `movies.total_views` on every request would make the trending order
+ * (which sorts by it) the most contended row update in the app. Instead:
+ *
+ * - A view counts once per viewer and movie within `DEDUP_WINDOW_MS`. The
+ *   route identifies a signed-in viewer by user id, and anyone else by the
+ *   random `mafilu_viewer` cookie it sets (by a hash of address and user
+ *   agent until the client sends the cookie back).
+ * - Counted views are added to an in-memory delta per movie.
+ * - `flush()` sends all deltas as one batch to `apply_view_batch`
+ *   (migrations 010 and 011). It runs every `FLUSH_INTERVAL_MS`, when
+ *   `MAX_PENDING_VIEWS` are pending, and after responses once a flush is
+ *   due.
+ * - A failed batch is kept with its id and sent again before anything
+ *   newer. The database applies each batch id once, so a retry after a
+ *   lost response does not count twice. A batch the database rejects as
+ *   invalid (a data or integrity error) would fail every retry, so it is
+ *   dropped and its views counted in `droppedViews`.
+ * - The new totals go to the catalog cache, which drops its trending list
+ *   when they reorder it.
+ *
+ * Dedup and the buffer are per server process. With several instances a
+ * viewer may be counted once per instance within the window, and a process
+ * killed outright loses the views of its last `FLUSH_INTERVAL_MS`.
+ */
+
+import { createClient } from "@supabase/supabase-js";
+import { catalogCache } from "@/lib/catalog-cache";
+
+export const VIEWER_COOKIE = "mafilu_viewer";
+
+const DEDUP_WINDOW_MS = 30 * 60 * 1000;
+const MAX_DEDUP_ENTRIES = 200_000;
+const FLUSH_INTERVAL_MS = 5000;
+const MAX_PENDING_VIEWS = 1000;
+// SQLSTATE classes 22 (data exception) and 23 (integrity constraint violation)
+const PERMANENT_ERROR = /^2[23]/;
+
+interface Batch {
+    id: string;
+    deltas: Map<string, number>;
+}
+
+export interface ViewBufferStats {
+    pending: number;
+    unsentBatches: number;
+    dedupEntries: number;
+    counted: number;
+    duplicates: number;
+    flushed: number;
+    failedFlushes: number;
+    droppedViews: number;
+}
+
+class ViewBuffer {
+    // Expiry per "movie:viewer". The window is fixed, so insertion order is
+    // expiry order and expired entries are always at the front.
+    private readonly seen = new Map<string, number>();
+    private pending = new Map<string, number>();
+    private pendingCount = 0;
+    private readonly unsent: Batch[] = [];
+    private flushing: Promise<number> | null = null;
+    private lastFlush = Date.now();
+    private timer: ReturnType<typeof setInterval> | null = null;
+    private readonly totals = {
+        counted: 0, duplicates: 0, flushed: 0, failedFlushes: 0, droppedViews: 0,
+    };
+
+    /** Count a view unless `viewer` already viewed `movieId` in the window. */
+    record(movieId: string, viewer: string): boolean {
+        const now = Date.now();
+        this.prune(now);
+
+        const key = `${movieId}:${viewer}`;
+        if (this.seen.has(key)) {
+            this.totals.duplicates += 1;
+            return false;
+        }
+        if (this.seen.size >= MAX_DEDUP_ENTRIES) {
+            this.seen.delete(this.seen.keys().next().value as string);
+        }
+        this.seen.set(key, now + DEDUP_WINDOW_MS);
+
+        this.pending.set(movieId, (this.pending.get(movieId) ?? 0) + 1);
+        this.pendingCount += 1;
+        this.totals.counted += 1;
+        this.startTimer();
+        if (this.pendingCount >= MAX_PENDING_VIEWS) {
+            void this.flush();
+        }
+        return true;
+    }
+
+    /** Whether a flush is overdue, for callers that can run it after responding. */
+    flushDue(): boolean {
+        return (this.pendingCount > 0 || this.unsent.length > 0)
+            && Date.now() - this.lastFlush >= FLUSH_INTERVAL_MS;
+    }
+
+    /** Send pending views and earlier failed batches; returns the views applied. */
+    flush(): Promise<number> {
+        // One flush at a time keeps batches in order; a caller arriving
+        // during a flush waits for it and then flushes what is left.
+        if (this.flushing) {
+            return this.flushing.then(() => this.flush());
+        }
+        this.flushing = this.send().finally(() => {
+            this.flushing = null;
+        });
+        return this.flushing;
+    }
+
+    stats(): ViewBufferStats {
+        return {
+            pending: this.pendingCount,
+            unsentBatches: this.unsent.length,
+            dedupEntries: this.seen.size,
+            ...this.totals,
+        };
+    }
+
+    private async send(): Promise<number> {
+        this.lastFlush = Date.now();
+        if (this.pendingCount > 0) {
+            this.unsent.push({ id: crypto.randomUUID(), deltas: this.pending });
+            this.pending = new Map();
+            this.pendingCount = 0;
+        }
+
+        let applied = 0;
+        while (this.unsent.length > 0) {
+            const batch = this.unsent[0];
+            const { data, error } = await adminClient().rpc("apply_view_batch", {
+                p_batch_id: batch.id,
+                p_movie_ids: Array.from(batch.deltas.keys()),
+                p_counts: Array.from(batch.deltas.values()),
+            });
+            if (error) {
+                this.totals.failedFlushes += 1;
+                if (!PERMANENT_ERROR.test(error.code ?? "")) {
+                    console.error("Error flushing view counts:", error);
+                    break;
+                }
+                // Retrying would fail again and hold up every later batch
+                this.unsent.shift();
+                batch.deltas.forEach((count) => (this.totals.droppedViews += count));
+                console.error("Dropping view batch the database rejected:", error);
+                continue;
+            }
+            this.unsent.shift();
+            batch.deltas.forEach((count) => (applied += count));
+            catalogCache.noteViewTotals((data ?? []) as { movie_id: string; total_views: number }[]);
+        }
+        this.totals.flushed += applied;
+        return applied;
+    }
+
+    private prune(now: number) {
+        for (const [key, expires] of this.seen) {
+            if (expires > now) break;
+            this.seen.delete(key);
+        }
+    }
+
+    private startTimer() {
+        if (this.timer) return;
+        this.timer = setInterval(() => {
+            if (this.flushDue()) void this.flush();
+        }, FLUSH_INTERVAL_MS);
+        // Do not keep the process alive just to flush
+        this.timer.unref?.();
+    }
+}
+
+let admin: ReturnType<typeof createClient> | null = null;
+
+function adminClient() {
+    // Only the service role may execute apply_view_batch
+    admin ??= createClient(
+        process.env.NEXT_PUBLIC_SUPABASE_URL || "",
+        process.env.SUPABASE_SERVICE_ROLE_KEY || ""
+    );
+    return admin;
+}
+
+// Route handler bundles are separate module instances, so the buffer lives
+// on globalThis to be shared by every route in the process.
+export const viewBuffer: ViewBuffer = ((
+    globalThis as { __mafiluViewBuffer?: ViewBuffer }
+).__mafiluViewBuffer ??= new ViewBuffer());
@@ -0,0 +1,45 @@
+-- Save playback position in one round trip
+-- POST /api/videos/[id]/progress used to read the movie's duration, look up
+-- the latest view and then update or insert it: three queries per save, and
+-- two tabs saving at once could both insert. This function does the same
+-- work as a single upsert on the (movie_id, user_id) unique index from 002.
+
+CREATE OR REPLACE FUNCTION public.save_watch_progress(
+    p_movie_id UUID,
+    p_position INTEGER,
+    p_completed BOOLEAN DEFAULT FALSE
+)
+RETURNS VOID AS $$
+BEGIN
+    IF auth.uid() IS NULL THEN
+        RAISE EXCEPTION 'not authenticated' USING ERRCODE = '28000';
+    END IF;
+
+    IF p_position IS NULL OR p_position < 0 THEN
+        RAISE EXCEPTION 'invalid position' USING ERRCODE = '22023';
+    END IF;
+
+    -- A position past 90% of the movie counts as completed
+    INSERT INTO movie_views (movie_id, user_id, watch_duration_seconds, completed, viewed_at)
+    SELECT
+        m.id,
+        auth.uid(),
+        p_position,
+        COALESCE(p_completed, FALSE)
+            OR COALESCE(p_position >= m.duration_seconds * 0.9, FALSE),
+        NOW()
+    FROM movies m
+    WHERE m.id = p_movie_id
+    ON CONFLICT (movie_id, user_id) WHERE user_id IS NOT NULL
+    DO UPDATE SET
+        watch_duration_seconds = EXCLUDED.watch_duration_seconds,
+        completed = EXCLUDED.completed,
+        viewed_at = EXCLUDED.viewed_at;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.save_watch_progress(UUID, INTEGER, BOOLEAN) FROM PUBLIC, anon;
+GRANT EXECUTE ON FUNCTION public.save_watch_progress(UUID, INTEGER, BOOLEAN) TO authenticated;
+
+COMMENT ON FUNCTION public.save_watch_progress(UUID, INTEGER, BOOLEAN) IS
+'Upserts the caller''s playback position for a movie (continue watching)';
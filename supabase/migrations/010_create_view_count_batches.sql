@@ -0,0 +1,60 @@
+-- Batched, exactly-once view counting
+-- POST /api/videos/[id]/view used to call increment_view_count, which no
+-- migration created, and then fell back to reading total_views and writing
+-- it back + 1, losing increments under concurrency. The app now buffers
+-- deduplicated views in memory and flushes aggregated deltas through
+-- apply_view_batch(). Each batch carries an id, so a flush retried after a
+-- lost response is applied once.
+
+-- total_views exists in the deployed schema but was never added here
+ALTER TABLE movies ADD COLUMN IF NOT EXISTS total_views INTEGER DEFAULT 0;
+
+CREATE INDEX IF NOT EXISTS idx_movies_total_views ON movies(total_views DESC);
+
+CREATE TABLE IF NOT EXISTS view_count_batches (
+    id UUID PRIMARY KEY,
+    views INTEGER NOT NULL,
+    applied_at TIMESTAMPTZ DEFAULT NOW() NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_view_count_batches_applied ON view_count_batches(applied_at);
+
+-- Only the service role writes batches; nobody reads them through the API
+ALTER TABLE view_count_batches ENABLE ROW LEVEL SECURITY;
+
+CREATE OR REPLACE FUNCTION public.apply_view_batch(
+    p_batch_id UUID,
+    p_movie_ids UUID[],
+    p_counts INTEGER[]
+)
+RETURNS BOOLEAN AS $$
+DECLARE
+    inserted INTEGER;
+BEGIN
+    INSERT INTO view_count_batches (id, views)
+    SELECT p_batch_id, COALESCE(SUM(c), 0) FROM unnest(p_counts) AS c
+    ON CONFLICT (id) DO NOTHING;
+
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+    IF inserted = 0 THEN
+        -- Already applied by an earlier attempt
+        RETURN FALSE;
+    END IF;
+
+    UPDATE movies m
+    SET total_views = COALESCE(m.total_views, 0) + d.count
+    FROM unnest(p_movie_ids, p_counts) AS d(movie_id, count)
+    WHERE m.id = d.movie_id;
+
+    -- Retries happen within seconds; a day of batch ids is plenty
+    DELETE FROM view_count_batches WHERE applied_at < NOW() - INTERVAL '1 day';
+
+    RETURN TRUE;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.apply_view_batch(UUID, UUID[], INTEGER[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.apply_view_batch(UUID, UUID[], INTEGER[]) TO service_role;
+
+COMMENT ON FUNCTION public.apply_view_batch(UUID, UUID[], INTEGER[]) IS
+'Adds aggregated view deltas to movies.total_views once per batch id';
@@ -0,0 +1,45 @@
+-- Return the new view totals from apply_view_batch
+-- The catalog cache keeps the trending list of /api/movies/featured for a
+-- while. When a flush moves a movie into or within the trending ranks, the
+-- app needs the new totals to invalidate it, without another query.
+-- The return type changes, so the function has to be dropped first.
+
+DROP FUNCTION IF EXISTS public.apply_view_batch(UUID, UUID[], INTEGER[]);
+
+CREATE FUNCTION public.apply_view_batch(
+    p_batch_id UUID,
+    p_movie_ids UUID[],
+    p_counts INTEGER[]
+)
+RETURNS TABLE (movie_id UUID, total_views INTEGER) AS $$
+#variable_conflict use_column
+DECLARE
+    inserted INTEGER;
+BEGIN
+    INSERT INTO view_count_batches (id, views)
+    SELECT p_batch_id, COALESCE(SUM(c), 0) FROM unnest(p_counts) AS c
+    ON CONFLICT (id) DO NOTHING;
+
+    GET DIAGNOSTICS inserted = ROW_COUNT;
+    IF inserted = 0 THEN
+        -- Already applied by an earlier attempt
+        RETURN;
+    END IF;
+
+    RETURN QUERY
+    UPDATE movies m
+    SET total_views = COALESCE(m.total_views, 0) + d.count
+    FROM unnest(p_movie_ids, p_counts) AS d(id, count)
+    WHERE m.id = d.id
+    RETURNING m.id, m.total_views;
+
+    -- Retries happen within seconds; a day of batch ids is plenty
+    DELETE FROM view_count_batches WHERE applied_at < NOW() - INTERVAL '1 day';
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION public.apply_view_batch(UUID, UUID[], INTEGER[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION public.apply_view_batch(UUID, UUID[], INTEGER[]) TO service_role;
+
+COMMENT ON FUNCTION public.apply_view_batch(UUID, UUID[], INTEGER[]) IS
+'Adds aggregated view deltas to movies.total_views once per batch id and returns the new totals';
@@ -0,0 +1,123 @@
+-- Daily view rollup for producer analytics
+-- The producer dashboard used to fetch every movie_views row of the last 30
+-- days and count them per day in Node. movie_view_daily keeps those counts
+-- per movie and UTC day, maintained by triggers on movie_views, so a
+-- dashboard reads at most 30 rows.
+
+CREATE TABLE IF NOT EXISTS movie_view_daily (
+    movie_id UUID NOT NULL REFERENCES movies(id) ON DELETE CASCADE,
+    day DATE NOT NULL,
+    views INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (movie_id, day)
+);
+
+CREATE INDEX IF NOT EXISTS idx_movie_view_daily_day ON movie_view_daily(day);
+
+ALTER TABLE movie_view_daily ENABLE ROW LEVEL SECURITY;
+
+CREATE POLICY "Producers can view own movie rollups"
+    ON movie_view_daily FOR SELECT
+    USING (
+        EXISTS (
+            SELECT 1 FROM movies
+            WHERE movies.id = movie_view_daily.movie_id
+            AND movies.producer_id = auth.uid()
+        )
+        OR is_admin()
+    );
+
+-- Keeps movie_view_daily equal to counting movie_views by UTC day of
+-- viewed_at: an insert adds one, a delete removes one, and an update that
+-- moves a row to another day or movie does both.
+CREATE OR REPLACE FUNCTION update_movie_view_daily()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        UPDATE movie_view_daily
+        SET views = views - 1
+        WHERE movie_id = OLD.movie_id
+        AND day = (OLD.viewed_at AT TIME ZONE 'UTC')::DATE;
+    END IF;
+
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO movie_view_daily (movie_id, day, views)
+        VALUES (NEW.movie_id, (NEW.viewed_at AT TIME ZONE 'UTC')::DATE, 1)
+        ON CONFLICT (movie_id, day)
+        DO UPDATE SET views = movie_view_daily.views + 1;
+    END IF;
+
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+DROP TRIGGER IF EXISTS trigger_movie_view_daily_insert ON movie_views;
+CREATE TRIGGER trigger_movie_view_daily_insert
+    AFTER INSERT ON movie_views
+    FOR EACH ROW
+    EXECUTE FUNCTION update_movie_view_daily();
+
+-- Progress saves update viewed_at every 30 seconds; only a change of day
+-- or movie touches the rollup.
+DROP TRIGGER IF EXISTS trigger_movie_view_daily_update ON movie_views;
+CREATE TRIGGER trigger_movie_view_daily_update
+    AFTER UPDATE OF viewed_at, movie_id ON movie_views
+    FOR EACH ROW
+    WHEN (
+        OLD.movie_id IS DISTINCT FROM NEW.movie_id
+        OR (OLD.viewed_at AT TIME ZONE 'UTC')::DATE IS DISTINCT FROM (NEW.viewed_at AT TIME ZONE 'UTC')::DATE
+    )
+    EXECUTE FUNCTION update_movie_view_daily();
+
+DROP TRIGGER IF EXISTS trigger_movie_view_daily_delete ON movie_views;
+CREATE TRIGGER trigger_movie_view_daily_delete
+    AFTER DELETE ON movie_views
+    FOR EACH ROW
+    EXECUTE FUNCTION update_movie_view_daily();
+
+-- Recount the rollup from movie_views, for all movies or the given ones.
+-- Writes to movie_views wait until the rebuild commits.
+CREATE OR REPLACE FUNCTION rebuild_movie_view_daily(p_movie_ids UUID[] DEFAULT NULL)
+RETURNS INTEGER AS $$
+DECLARE
+    rebuilt INTEGER;
+BEGIN
+    LOCK TABLE movie_views IN SHARE MODE;
+
+    DELETE FROM movie_view_daily
+    WHERE p_movie_ids IS NULL OR movie_id = ANY(p_movie_ids);
+
+    INSERT INTO movie_view_daily (movie_id, day, views)
+    SELECT movie_id, (viewed_at AT TIME ZONE 'UTC')::DATE, COUNT(*)
+    FROM movie_views
+    WHERE p_movie_ids IS NULL OR movie_id = ANY(p_movie_ids)
+    GROUP BY 1, 2;
+
+    GET DIAGNOSTICS rebuilt = ROW_COUNT;
+    RETURN rebuilt;
+END;
+$$ LANGUAGE plpgsql SECURITY DEFINER SET search_path = public;
+
+REVOKE EXECUTE ON FUNCTION rebuild_movie_view_daily(UUID[]) FROM PUBLIC, anon, authenticated;
+GRANT EXECUTE ON FUNCTION rebuild_movie_view_daily(UUID[]) TO service_role;
+
+-- Views per UTC day over the producer's movies, one row per day including
+-- days without views. Runs with the caller's rights, so RLS applies.
+CREATE OR REPLACE FUNCTION producer_views_by_day(p_producer_id UUID, p_days INTEGER DEFAULT 30)
+RETURNS TABLE (day DATE, views BIGINT) AS $$
+    SELECT d.day::DATE, COALESCE(SUM(r.views), 0)
+    FROM generate_series(
+        (NOW() AT TIME ZONE 'UTC')::DATE - (p_days - 1),
+        (NOW() AT TIME ZONE 'UTC')::DATE,
+        INTERVAL '1 day'
+    ) AS d(day)
+    LEFT JOIN movie_view_daily r
+        ON r.day = d.day::DATE
+        AND r.movie_id IN (SELECT id FROM movies WHERE producer_id = p_producer_id)
+    GROUP BY d.day
+    ORDER BY d.day;
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION producer_views_by_day(UUID, INTEGER) TO authenticated;
+
+-- Backfill from the existing views
+SELECT rebuild_movie_view_daily();
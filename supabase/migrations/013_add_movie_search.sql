@@ -0,0 +1,85 @@
+-- Indexed movie search for /browse and /api/search
+-- Browse used to download every approved movie and filter titles in the
+-- browser. Search now runs in Postgres on two generated columns:
+--   search_vector  full-text (title weighted over description) for ranked
+--                  prefix matches as the user types
+--   search_text    the same text for pg_trgm, which catches substrings and
+--                  typos
+-- Both go through mafilu_search_normalize(), which folds Turkish letters
+-- and circumflexes to ASCII before lowercasing. "İstanbul", "ISTANBUL" and
+-- "istanbul" then match each other, and so do "çığ" and "cig", whatever
+-- keyboard the viewer has. No stemmer is applied: prefix matching already
+-- covers Turkish suffixes ("film" finds "filmler").
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE OR REPLACE FUNCTION mafilu_search_normalize(value TEXT)
+RETURNS TEXT AS $$
+    -- Translate before lower(): lower('I') is 'i' and lower('İ') depends on
+    -- the collation, while Turkish text means 'ı' and 'i' respectively.
+    SELECT lower(translate(COALESCE(value, ''), 'İIıŞşĞğÜüÖöÇçÂâÎîÛû', 'iiissgguuooccaaiiuu'));
+$$ LANGUAGE sql IMMUTABLE PARALLEL SAFE;
+
+ALTER TABLE movies ADD COLUMN IF NOT EXISTS search_vector TSVECTOR
+    GENERATED ALWAYS AS (
+        setweight(to_tsvector('simple', mafilu_search_normalize(title)), 'A')
+        || setweight(to_tsvector('simple', mafilu_search_normalize(description)), 'B')
+    ) STORED;
+
+ALTER TABLE movies ADD COLUMN IF NOT EXISTS search_text TEXT
+    GENERATED ALWAYS AS (
+        mafilu_search_normalize(title || ' ' || COALESCE(description, ''))
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_movies_search_vector ON movies USING GIN (search_vector);
+CREATE INDEX IF NOT EXISTS idx_movies_search_trgm ON movies USING GIN (search_text gin_trgm_ops);
+
+-- Ranked, paginated search over approved movies, returning card columns.
+-- A movie matches when every word is a prefix of a word in it, when the
+-- query is a substring of it, or when the query is close to one of its
+-- words (typos). Runs with the caller's rights, so RLS applies.
+CREATE OR REPLACE FUNCTION search_movies(
+    p_query TEXT,
+    p_limit INTEGER DEFAULT 24,
+    p_offset INTEGER DEFAULT 0,
+    p_genre movie_genre DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    title TEXT,
+    genre movie_genre,
+    release_year INTEGER,
+    total_views INTEGER,
+    bunny_video_id TEXT,
+    thumbnail_url TEXT,
+    rank REAL
+) AS $$
+    WITH q AS (
+        SELECT
+            normalized,
+            to_tsquery('simple', array_to_string(ARRAY(
+                SELECT quote_literal(word) || ':*'
+                FROM unnest(regexp_split_to_array(normalized, '[^[:alnum:]]+')) AS word
+                WHERE word <> ''
+            ), ' & ')) AS tsq,
+            '%' || replace(replace(replace(normalized, '\', '\\'), '%', '\%'), '_', '\_') || '%' AS pattern
+        FROM (SELECT btrim(mafilu_search_normalize(p_query)) AS normalized) AS input
+    )
+    SELECT
+        m.id, m.title, m.genre, m.release_year, m.total_views, m.bunny_video_id, m.thumbnail_url,
+        (ts_rank(m.search_vector, q.tsq) * 2 + word_similarity(q.normalized, m.search_text))::REAL AS rank
+    FROM movies m, q
+    WHERE q.normalized <> ''
+    AND m.status = 'approved'
+    AND (p_genre IS NULL OR m.genre = p_genre)
+    AND (
+        m.search_vector @@ q.tsq
+        OR m.search_text LIKE q.pattern
+        OR q.normalized <% m.search_text
+    )
+    ORDER BY rank DESC, m.total_views DESC NULLS LAST, m.id
+    LIMIT LEAST(GREATEST(p_limit, 1), 100)
+    OFFSET GREATEST(p_offset, 0);
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION search_movies(TEXT, INTEGER, INTEGER, movie_genre) TO anon, authenticated;
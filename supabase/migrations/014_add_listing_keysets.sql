@@ -0,0 +1,83 @@
+-- Keyset pagination for browse, watchlist and admin listings
+-- These listings used to load whole tables. They now read one page at a
+-- time, ordered by a sort column with id as the tie-breaker. Each page
+-- starts after the last row of the previous one instead of skipping rows
+-- with OFFSET. With an index matching each ordering, page 1 and page 1000
+-- cost the same, however large the table.
+
+-- total_views is a sort key now. NULLs would need their own branch in
+-- every cursor comparison.
+UPDATE movies SET total_views = 0 WHERE total_views IS NULL;
+ALTER TABLE movies ALTER COLUMN total_views SET NOT NULL;
+
+-- Only approved movies are listed publicly. Ascending orders ("oldest")
+-- scan the same indexes backwards.
+CREATE INDEX IF NOT EXISTS idx_movies_approved_created
+    ON movies(created_at DESC, id DESC) WHERE status = 'approved';
+CREATE INDEX IF NOT EXISTS idx_movies_approved_views
+    ON movies(total_views DESC, id DESC) WHERE status = 'approved';
+CREATE INDEX IF NOT EXISTS idx_movies_approved_genre_created
+    ON movies(genre, created_at DESC, id DESC) WHERE status = 'approved';
+CREATE INDEX IF NOT EXISTS idx_movies_approved_genre_views
+    ON movies(genre, total_views DESC, id DESC) WHERE status = 'approved';
+
+CREATE INDEX IF NOT EXISTS idx_profiles_created ON profiles(created_at DESC, id DESC);
+CREATE INDEX IF NOT EXISTS idx_watchlist_user_added ON watchlist(user_id, added_at DESC, id DESC);
+
+-- The homepage rows in one round trip: up to p_limit newest movies for
+-- each category. Every branch reads a few index entries, where
+-- getMovieCategories used to load the whole approved catalog and filter it
+-- in Node. Runs with the caller's rights, so RLS applies.
+CREATE OR REPLACE FUNCTION home_category_movies(p_limit INTEGER DEFAULT 6)
+RETURNS TABLE (
+    category TEXT,
+    id UUID,
+    title TEXT,
+    description TEXT,
+    genre movie_genre,
+    release_year INTEGER,
+    bunny_video_id TEXT,
+    thumbnail_url TEXT,
+    featured BOOLEAN,
+    created_at TIMESTAMPTZ,
+    average_rating DECIMAL(3, 2),
+    rating_count INTEGER
+) AS $$
+    (
+        SELECT 'originals', m.id, m.title, m.description, m.genre, m.release_year, m.bunny_video_id,
+            m.thumbnail_url, m.featured, m.created_at, m.average_rating, m.rating_count
+        FROM movies m
+        WHERE m.status = 'approved' AND m.featured = TRUE
+        ORDER BY m.created_at DESC, m.id DESC
+        LIMIT p_limit
+    )
+    UNION ALL
+    (
+        SELECT 'recent', m.id, m.title, m.description, m.genre, m.release_year, m.bunny_video_id,
+            m.thumbnail_url, m.featured, m.created_at, m.average_rating, m.rating_count
+        FROM movies m
+        WHERE m.status = 'approved'
+        ORDER BY m.created_at DESC, m.id DESC
+        LIMIT p_limit
+    )
+    UNION ALL
+    (
+        SELECT 'awards', m.id, m.title, m.description, m.genre, m.release_year, m.bunny_video_id,
+            m.thumbnail_url, m.featured, m.created_at, m.average_rating, m.rating_count
+        FROM movies m
+        WHERE m.status = 'approved' AND m.release_year < 2024
+        ORDER BY m.created_at DESC, m.id DESC
+        LIMIT p_limit
+    )
+    UNION ALL
+    (
+        SELECT 'documentary', m.id, m.title, m.description, m.genre, m.release_year, m.bunny_video_id,
+            m.thumbnail_url, m.featured, m.created_at, m.average_rating, m.rating_count
+        FROM movies m
+        WHERE m.status = 'approved' AND m.genre = 'documentary'
+        ORDER BY m.created_at DESC, m.id DESC
+        LIMIT p_limit
+    );
+$$ LANGUAGE sql STABLE;
+
+GRANT EXECUTE ON FUNCTION home_category_movies(INTEGER) TO anon, authenticated;
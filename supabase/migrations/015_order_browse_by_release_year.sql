@@ -0,0 +1,15 @@
+-- Browse "newest" and "oldest" order by release year
+-- Before keyset pagination, /browse sorted these by release_year in the
+-- browser, with a missing year counting as 0. Migration 014 keyed them on
+-- created_at instead, which changed what viewers see. release_order keeps
+-- the release year order as a keyset: it is never NULL, so a cursor
+-- comparison needs no NULL branch, and it has indexes like created_at's.
+
+ALTER TABLE movies ADD COLUMN IF NOT EXISTS release_order INTEGER
+    GENERATED ALWAYS AS (COALESCE(release_year, 0)) STORED NOT NULL;
+
+-- Ascending orders ("oldest") scan the same indexes backwards.
+CREATE INDEX IF NOT EXISTS idx_movies_approved_release
+    ON movies(release_order DESC, id DESC) WHERE status = 'approved';
+CREATE INDEX IF NOT EXISTS idx_movies_approved_genre_release
+    ON movies(genre, release_order DESC, id DESC) WHERE status = 'approved';
@@ -2,35 +2,21 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly
+        context = await session.new_context()
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -49,64 +35,63 @@ async def run_test():
         # -> Navigate to signup page by clicking 'Kayıt Ol' button
         frame = context.pages[-1]
         # Click 'Kayıt Ol' button to go to signup page
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.signup')
+        await actions.click(elem)
         
 
         # -> Fill in the signup form fields: name, email, password, and password confirmation
         frame = context.pages[-1]
         # Fill in the name field with 'Eren Atasoy'
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Eren Atasoy')
+        elem = locators.get(frame, 'signup.full-name')
+        await actions.fill(elem, 'Eren Atasoy')
         
 
         frame = context.pages[-1]
         # Fill in the email field with 'domateskafasi@gmail.com'
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
+        elem = locators.get(frame, 'signup.email')
+        await actions.fill(elem, 'domateskafasi@gmail.com')
         
 
         frame = context.pages[-1]
         # Fill in the password field with 'Erenatasoy123.'
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
+        elem = locators.get(frame, 'signup.password')
+        await actions.fill(elem, 'Erenatasoy123.')
         
 
         frame = context.pages[-1]
         # Fill in the password confirmation field with 'Erenatasoy123.'
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[4]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
+        elem = locators.get(frame, 'signup.confirm-password')
+        await actions.fill(elem, 'Erenatasoy123.')
         
 
         # -> Submit the signup form by clicking the 'Kayıt Ol' button
         frame = context.pages[-1]
         # Click 'Kayıt Ol' button to submit signup form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'signup.submit')
+        await actions.click(elem)
         
 
         # -> Simulate clicking the email verification link to activate the account
-        await page.goto('http://localhost:3000/login', timeout=10000)
-        await asyncio.sleep(3)
+        await actions.goto(page, '/login')
         
 
         # -> Fill in login form with verified email and password
         frame = context.pages[-1]
         # Input verified email into email field
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
+        elem = locators.get(frame, 'login.email')
+        await actions.fill(elem, 'domateskafasi@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password into password field
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
+        elem = locators.get(frame, 'login.password')
+        await actions.fill(elem, 'Erenatasoy123.')
         
 
         frame = context.pages[-1]
         # Click 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'login.submit')
+        await actions.click(elem, response=actions.is_login_response)
         
 
         # --> Assertions to verify final state
@@ -114,15 +99,10 @@ async def run_test():
         await expect(frame.locator('text=Filmleri Keşfet').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Premium Üyelik').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=İzleme Listem').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,35 +2,21 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly
+        context = await session.new_context()
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -49,166 +35,166 @@ async def run_test():
         # -> Click on 'Kayıt Ol' button to go to signup page
         frame = context.pages[-1]
         # Click on 'Kayıt Ol' button to navigate to signup page
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.signup')
+        await actions.click(elem)
         
 
         # -> Fill in name, email, password, confirm password and submit signup form
         frame = context.pages[-1]
         # Input full name
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Eren Atasoy')
+        elem = locators.get(frame, 'signup.full-name')
+        await actions.fill(elem, 'Eren Atasoy')
         
 
         frame = context.pages[-1]
         # Input email
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
+        elem = locators.get(frame, 'signup.email')
+        await actions.fill(elem, 'domateskafasi@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
+        elem = locators.get(frame, 'signup.password')
+        await actions.fill(elem, 'Erenatasoy123.')
         
 
         frame = context.pages[-1]
         # Input password confirmation
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[4]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
+        elem = locators.get(frame, 'signup.confirm-password')
+        await actions.fill(elem, 'Erenatasoy123.')
         
 
         frame = context.pages[-1]
         # Click on 'Kayıt Ol' button to submit signup form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'signup.submit')
+        await actions.click(elem)
         
 
         # -> Navigate back to login page to proceed with email verification and login
         frame = context.pages[-1]
         # Click 'Giriş Sayfasına Dön' button to go back to login page
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'signup.back-to-login')
+        await actions.click(elem)
         
 
         # -> Input email and password, then click 'Giriş Yap' to login
         frame = context.pages[-1]
         # Input email for login
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
+        elem = locators.get(frame, 'login.email')
+        await actions.fill(elem, 'domateskafasi@gmail.com')
         
 
         frame = context.pages[-1]
         # Input password for login
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
+        elem = locators.get(frame, 'login.password')
+        await actions.fill(elem, 'Erenatasoy123.')
         
 
         frame = context.pages[-1]
         # Click 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'login.submit')
+        await actions.click(elem, response=actions.is_login_response)
         
 
         # -> Click on '🎬 Yapımcı Ol' or 'Yapımcı Paneli' to start onboarding or access Producer Studio
         frame = context.pages[-1]
         # Click on '🎬 Yapımcı Ol' to start onboarding preferences
-        elem = frame.locator('xpath=html/body/footer/div/div/div[3]/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'footer.become-producer')
+        await actions.click(elem)
         
 
         # -> Verify onboarding preferences completion or navigate to onboarding if needed
         frame = context.pages[-1]
         # Click on 'Ayarlar' (Settings) to check onboarding preferences or profile settings
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'producer.settings')
+        await actions.click(elem)
         
 
         # -> Fill in or update profile information and payment details, then save changes
         frame = context.pages[-1]
         # Update full name in profile information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Eren Atasoy')
+        elem = locators.get(frame, 'settings.profile.full-name')
+        await actions.fill(elem, 'Eren Atasoy')
         
 
         frame = context.pages[-1]
         # Update visible username in profile information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('erenatasoy')
+        elem = locators.get(frame, 'settings.profile.username')
+        await actions.fill(elem, 'erenatasoy')
         
 
         frame = context.pages[-1]
         # Update biography in profile information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Independent filmmaker and producer.')
+        elem = locators.get(frame, 'settings.profile.bio')
+        await actions.fill(elem, 'Independent filmmaker and producer.')
         
 
         frame = context.pages[-1]
         # Update website in profile information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div[3]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('https://erenatasoy.com')
+        elem = locators.get(frame, 'settings.profile.website')
+        await actions.fill(elem, 'https://erenatasoy.com')
         
 
         frame = context.pages[-1]
         # Update bank name in payment information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[3]/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Garanti BBVA')
+        elem = locators.get(frame, 'settings.payment.bank-name')
+        await actions.fill(elem, 'Garanti BBVA')
         
 
         frame = context.pages[-1]
         # Update tax ID in payment information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[3]/div[2]/div/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('12345678901')
+        elem = locators.get(frame, 'settings.payment.tax-id')
+        await actions.fill(elem, '12345678901')
         
 
         frame = context.pages[-1]
         # Update IBAN in payment information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[3]/div[2]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('TR001234567890123456789012')
+        elem = locators.get(frame, 'settings.payment.iban')
+        await actions.fill(elem, 'TR001234567890123456789012')
         
 
         frame = context.pages[-1]
         # Click 'Kaydet' button to save profile information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'settings.profile.save')
+        await actions.click(elem)
         
 
         frame = context.pages[-1]
         # Click 'Kaydet' button to save payment information
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[5]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'settings.payment.save')
+        await actions.click(elem)
         
 
         # -> Toggle notification preferences for Email Notifications, Marketing Emails, and Weekly Report, then save changes if applicable
         frame = context.pages[-1]
         # Toggle Email Notifications
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[5]/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'settings.notifications.email')
+        await actions.click(elem)
         
 
         frame = context.pages[-1]
         # Toggle Marketing Emails
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[5]/div[2]/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'settings.notifications.marketing')
+        await actions.click(elem)
         
 
         frame = context.pages[-1]
         # Toggle Weekly Report
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[5]/div[2]/div[3]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'settings.notifications.weekly')
+        await actions.click(elem)
         
 
         # -> Check if there is a save button for notification preferences and click it if present, then navigate to Producer Studio dashboard
         frame = context.pages[-1]
         # Click 'Kaydet' button to save payment information if needed
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[4]/div[2]/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'settings.payment.save')
+        await actions.click(elem)
         
 
         frame = context.pages[-1]
         # Click 'Dashboard' link to navigate to Producer Studio dashboard
-        elem = frame.locator('xpath=html/body/div[2]/aside/nav/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'producer.dashboard')
+        await actions.click(elem)
         
 
         # --> Assertions to verify final state
@@ -241,15 +227,10 @@ async def run_test():
         await expect(frame.locator('text=Unauthorized Access Test Film').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=İnceleniyor').first).to_be_visible(timeout=30000)
         await expect(frame.locator('text=Filmlerinizin daha fazla izlenmesi için kaliteli küçük resimler ve ilgi çekici açıklamalar kullanın. Ayrıca doğru kategori ve etiket seçimi keşfedilebilirliği artırır.').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,35 +2,21 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly
+        context = await session.new_context()
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -49,42 +35,37 @@ async def run_test():
         # -> Navigate to login page by clicking the 'Giriş' button
         frame = context.pages[-1]
         # Click the 'Giriş' button to navigate to the login page
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.login')
+        await actions.click(elem)
         
 
         # -> Enter incorrect email and password in the respective input fields
         frame = context.pages[-1]
         # Enter incorrect email in the email input field
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongemail@example.com')
+        elem = locators.get(frame, 'login.email')
+        await actions.fill(elem, 'wrongemail@example.com')
         
 
         frame = context.pages[-1]
         # Enter incorrect password in the password input field
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('wrongpassword')
+        elem = locators.get(frame, 'login.password')
+        await actions.fill(elem, 'wrongpassword')
         
 
         # -> Click the login button to attempt login with incorrect credentials
         frame = context.pages[-1]
         # Click the 'Giriş Yap' button to submit the login form with incorrect credentials
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'login.submit')
+        await actions.click(elem, response=actions.is_login_response)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         await expect(frame.locator('text=Invalid login credentials').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,35 +2,22 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly,
+        # already logged in as a producer from the cached storage state
+        context = await session.new_context(role="producer")
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,68 +33,42 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on 'Giriş' button to login as Producer.
-        frame = context.pages[-1]
-        # Click on 'Giriş' button to open login form
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click 'Giriş Yap' to login as Producer.
-        frame = context.pages[-1]
-        # Input Producer email
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input Producer password
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
-        
-
-        frame = context.pages[-1]
-        # Click 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click on 'Film Yükle' to start the upload wizard.
         frame = context.pages[-1]
         # Click on 'Film Yükle' to start the upload wizard
-        elem = frame.locator('xpath=html/body/footer/div/div/div[3]/ul/li[3]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'footer.upload')
+        await actions.click(elem)
         
 
         # -> Fill in film metadata fields and save as draft.
         frame = context.pages[-1]
         # Input film name
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/form/div/div/div/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Kayıp Şehir')
+        elem = locators.get(frame, 'movie-form.title')
+        await actions.fill(elem, 'Kayıp Şehir')
         
 
         frame = context.pages[-1]
         # Input film description
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/form/div/div/div/div[2]/div[2]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Bir grup arkadaşın kayıp bir şehri keşfetme hikayesi.')
+        elem = locators.get(frame, 'movie-form.description')
+        await actions.fill(elem, 'Bir grup arkadaşın kayıp bir şehri keşfetme hikayesi.')
         
 
         frame = context.pages[-1]
         # Input production year
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/form/div/div/div/div[2]/div[3]/div[2]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('2025')
+        elem = locators.get(frame, 'movie-form.year')
+        await actions.fill(elem, '2025')
         
 
         frame = context.pages[-1]
         # Input film tags
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/form/div/div/div/div[2]/div[4]/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('bağımsız, ödüllü, gerilim')
+        elem = locators.get(frame, 'movie-form.tags')
+        await actions.fill(elem, 'bağımsız, ödüllü, gerilim')
         
 
         frame = context.pages[-1]
         # Click 'Taslak Olarak Kaydet' to save film as draft
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/form/div/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'movie-form.save-draft')
+        await actions.click(elem)
         
 
         # --> Assertions to verify final state
@@ -116,15 +77,10 @@ async def run_test():
             await expect(frame.locator('text=Video Upload Completed Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The resumable video upload process did not complete successfully, or the status transitions draft -> pending -> published after admin approval did not occur as expected.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
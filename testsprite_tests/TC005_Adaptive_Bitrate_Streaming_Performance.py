@@ -2,35 +2,22 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, budgets, bunny, load, metrics, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly,
+        # already logged in as a viewer from the cached storage state
+        context = await session.new_context(role="viewer")
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,81 +33,30 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on 'Giriş' button to login with provided credentials.
-        frame = context.pages[-1]
-        # Click on 'Giriş' button to open login form
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click 'Giriş Yap' to login.
-        frame = context.pages[-1]
-        # Input email address
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
-        
-
-        frame = context.pages[-1]
-        # Click 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> Serve the CDN from local HLS fixtures when MAFILU_BUNNY_NETWORK is set
+        cdn = await bunny.route_cdn(context) if bunny.emulated() else None
         
 
-        # -> Click on 'Filmleri Keşfet' to browse movies and select a published movie to play.
-        frame = context.pages[-1]
-        # Click on 'Filmleri Keşfet' to browse movies
-        elem = frame.locator('xpath=html/body/footer/div/div/div[2]/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> Open a published movie on the cinematic player
+        movie_id = await load.find_movie_id(context.request)
+        await actions.goto(page, f'/watch/{movie_id}')
         
 
-        # -> Try clearing any filters or search terms to reveal available movies or navigate to another section where movies might be listed.
-        frame = context.pages[-1]
-        # Click the button to clear filters or search terms to try to reveal movies
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Try searching for a specific movie title or keyword in the search input to find a published movie to play.
-        frame = context.pages[-1]
-        # Input keyword 'Bağımsız' in search bar to find movies
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Bağımsız')
-        
-
-        # -> Try searching for a different keyword or navigate to a different category or section to find a published movie to play.
-        frame = context.pages[-1]
-        # Input keyword 'Popüler' in search bar to find movies
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Popüler')
-        
-
-        frame = context.pages[-1]
-        # Click search button or press enter to execute search
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # -> Start playback and measure the time until the first frame plays
+        await metrics.measure_playback_start(page)
         
 
         # --> Assertions to verify final state
-        frame = context.pages[-1]
-        try:
-            await expect(frame.locator('text=Adaptive Bitrate Streaming Enabled').first).to_be_visible(timeout=1000)
-        except AssertionError:
-            raise AssertionError("Test failed: The video player did not use adaptive bitrate streaming or playback did not start within 2 seconds buffer time as required by the test plan.")
-        await asyncio.sleep(5)
+        budgets.budget("first-frame", ms=2000)
+        manifests = [key for key in metrics.current().histograms if key.endswith(".m3u8")]
+        if not manifests:
+            raise AssertionError("Test failed: the player never requested an HLS manifest, so adaptive bitrate streaming is not in use.")
+        if cdn is not None and not cdn.segments():
+            raise AssertionError("Test failed: the player fetched no HLS segments from the emulated CDN.")
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -2,35 +2,22 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly,
+        # already logged in as a viewer from the cached storage state
+        context = await session.new_context(role="viewer")
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -49,44 +36,8 @@ async def run_test():
         # -> Navigate to browse movies page by clicking 'Filmleri Keşfet' link.
         frame = context.pages[-1]
         # Click on 'Filmleri Keşfet' to navigate to browse movies page
-        elem = frame.locator('xpath=html/body/footer/div/div/div[2]/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Locate and apply filter by genre 'Drama'
-        await page.mouse.wheel(0, await page.evaluate('() => window.innerHeight'))
-        
-
-        frame = context.pages[-1]
-        # Click on genre filter dropdown or button to open genre options
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Perform login with provided credentials to access filtering features.
-        frame = context.pages[-1]
-        # Input email for login
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password for login
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
-        
-
-        frame = context.pages[-1]
-        # Click login button to submit credentials
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Click on 'Filmleri Keşfet' to navigate to browse movies page.
-        frame = context.pages[-1]
-        # Click on 'Filmleri Keşfet' to navigate to browse movies page
-        elem = frame.locator('xpath=html/body/footer/div/div/div[2]/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'footer.browse')
+        await actions.click(elem)
         
 
         # -> Locate and apply filter by genre 'Drama'
@@ -95,8 +46,8 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click on 'Keşfet' button or filter to open genre options
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.user-menu')
+        await actions.click(elem)
         
 
         # --> Assertions to verify final state
@@ -105,15 +56,10 @@ async def run_test():
             await expect(frame.locator('text=No Movies Found Matching Your Criteria').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to verify that browsing and searching movies returns accurate filtered results by genre, year, popularity, and keywords in real time.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
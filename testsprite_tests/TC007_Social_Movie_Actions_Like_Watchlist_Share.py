@@ -2,35 +2,22 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly,
+        # already logged in as a viewer from the cached storage state
+        context = await session.new_context(role="viewer")
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,91 +33,64 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click the 'Giriş' (Login) button to start login process.
-        frame = context.pages[-1]
-        # Click the 'Giriş' (Login) button to open login form
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password, then click 'Giriş Yap' button to login.
-        frame = context.pages[-1]
-        # Input email address
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
-        
-
-        frame = context.pages[-1]
-        # Click 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click on 'Filmleri Keşfet' to open movie list and select a movie.
         frame = context.pages[-1]
         # Click 'Filmleri Keşfet' to open movie list
-        elem = frame.locator('xpath=html/body/footer/div/div/div[2]/ul/li/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'footer.browse')
+        await actions.click(elem)
         
 
         # -> Input a common movie title keyword in the search bar to find movies.
         frame = context.pages[-1]
         # Input 'test' in the movie search bar to find movies
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('test')
+        elem = locators.get(frame, 'browse.search')
+        await actions.fill(elem, 'test')
         
 
         # -> Click 'Filtreleri Temizle' (Clear Filters) button to reset filters and try searching again.
         frame = context.pages[-1]
         # Click 'Filtreleri Temizle' button to clear filters
-        elem = frame.locator('xpath=html/body/div[2]/main/div[4]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'browse.no-results-clear')
+        await actions.click(elem)
         
 
         # -> Try to navigate to 'Listem' (My List) page to check if movies are in watchlist or available to open.
         frame = context.pages[-1]
         # Click 'Listem' (My List) to check for movies in watchlist or available movies
-        elem = frame.locator('xpath=html/body/nav/div/div/div/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.watchlist')
+        await actions.click(elem)
         
 
         # -> Click 'Film Keşfet' button to go back to movie discovery page and try to find movies.
         frame = context.pages[-1]
         # Click 'Film Keşfet' button to navigate to movie discovery page
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'watchlist.empty-browse')
+        await actions.click(elem)
         
 
         # -> Try to navigate to 'Listem' (My List) again to check if any movies are available there or try to find a direct movie link.
         frame = context.pages[-1]
         # Click 'Listem' (My List) to check for movies in watchlist or available movies
-        elem = frame.locator('xpath=html/body/nav/div/div/div/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.watchlist')
+        await actions.click(elem)
         
 
         # -> Click 'Film Keşfet' button to navigate back to movie discovery page to try to find movies.
         frame = context.pages[-1]
         # Click 'Film Keşfet' button to go to movie discovery page
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'watchlist.empty-browse')
+        await actions.click(elem)
         
 
         # -> Try to find a direct movie link or alternative navigation to open a movie page for testing.
-        await page.goto('http://localhost:3000/movie/1', timeout=10000)
-        await asyncio.sleep(3)
+        await actions.goto(page, '/movie/1')
         
 
         # -> Navigate back to the movie discovery page and try to find any clickable movie link or alternative navigation to open a valid movie page.
         frame = context.pages[-1]
         # Click 'Keşfet' (Discover) to return to movie discovery page
-        elem = frame.locator('xpath=html/body/nav/div/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'navbar.browse')
+        await actions.click(elem)
         
 
         # --> Assertions to verify final state
@@ -139,15 +99,10 @@ async def run_test():
             await expect(frame.locator('text=This movie has been liked 9999 times!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The test plan execution failed to verify that viewers can like movies, add/remove movies to/from their watchlist, and share movie links correctly.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
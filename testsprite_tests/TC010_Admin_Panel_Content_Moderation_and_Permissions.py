@@ -2,35 +2,22 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly,
+        # already logged in as an admin from the cached storage state
+        context = await session.new_context(role="admin")
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,51 +33,25 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click on the 'Giriş' (Login) button to start admin login process.
-        frame = context.pages[-1]
-        # Click on the 'Giriş' (Login) button to open login form
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input admin email and password, then submit login form.
-        frame = context.pages[-1]
-        # Input admin email
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input admin password
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
-        
-
-        frame = context.pages[-1]
-        # Click on 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click on 'Yapımcı Paneli' (Producer Panel) to access admin functionalities.
         frame = context.pages[-1]
         # Click on 'Yapımcı Paneli' (Producer Panel) to access admin functionalities
-        elem = frame.locator('xpath=html/body/footer/div/div/div[3]/ul/li[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'footer.producer-panel')
+        await actions.click(elem)
         
 
         # -> Click on 'Tümünü Gör →' link to view all pending movie submissions for review.
         frame = context.pages[-1]
         # Click on 'Tümünü Gör →' to view all pending movie submissions
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[3]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'dashboard.recent-movies-all')
+        await actions.click(elem)
         
 
         # -> Click on the movie title or card to open detailed review and moderation options for the movie.
         frame = context.pages[-1]
         # Click on the 'Unauthorized Access Test Film' movie card to open detailed review and moderation options
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div/div/div[3]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'movies.card-edit')
+        await actions.click(elem)
         
 
         # -> Look for approve or reject buttons or controls to moderate the movie submission.
@@ -99,8 +60,8 @@ async def run_test():
 
         frame = context.pages[-1]
         # Click on 'Kaydet' button to simulate approval or save changes
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'movie-edit.save')
+        await actions.click(elem)
         
 
         # --> Assertions to verify final state
@@ -109,15 +70,10 @@ async def run_test():
             await expect(frame.locator('text=Admin Panel Access Granted').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Admin functionalities such as reviewing movies, approving/rejecting submissions, managing user accounts, and enforcing restricted API permissions did not execute successfully as per the test plan.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
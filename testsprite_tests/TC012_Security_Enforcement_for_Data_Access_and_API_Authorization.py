@@ -2,35 +2,22 @@ import asyncio
 from playwright import async_api
 from playwright.async_api import expect
 
+from harness import actions, locators, session
+
 async def run_test():
-    pw = None
-    browser = None
     context = None
     
     try:
-        # Start a Playwright session in asynchronous mode
-        pw = await async_api.async_playwright().start()
-        
-        # Launch a Chromium browser in headless mode with custom arguments
-        browser = await pw.chromium.launch(
-            headless=True,
-            args=[
-                "--window-size=1280,720",         # Set the browser window size
-                "--disable-dev-shm-usage",        # Avoid using /dev/shm which can cause issues in containers
-                "--ipc=host",                     # Use host-level IPC for better stability
-                "--single-process"                # Run the browser in a single process mode
-            ],
-        )
-        
-        # Create a new browser context (like an incognito window)
-        context = await browser.new_context()
-        context.set_default_timeout(5000)
+        # Create a new browser context (like an incognito window) on the
+        # runner's shared browser, or on a freshly launched one when run directly,
+        # already logged in as a viewer from the cached storage state
+        context = await session.new_context(role="viewer")
         
         # Open a new page in the browser context
         page = await context.new_page()
         
-        # Navigate to your target URL and wait until the network request is committed
-        await page.goto("http://localhost:3000", wait_until="commit", timeout=10000)
+        # Navigate to the app (MAFILU_BASE_URL, default http://localhost:3000) and wait for it to settle
+        await actions.goto(page, "/")
         
         # Wait for the main page to reach DOMContentLoaded state (optional for stability)
         try:
@@ -46,51 +33,25 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Click the 'Giriş' (Login) button to start login as Viewer
-        frame = context.pages[-1]
-        # Click the 'Giriş' (Login) button to open login form
-        elem = frame.locator('xpath=html/body/nav/div/div/div[2]/a/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Input email and password for Viewer and submit login form
-        frame = context.pages[-1]
-        # Input email for Viewer login
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('domateskafasi@gmail.com')
-        
-
-        frame = context.pages[-1]
-        # Input password for Viewer login
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/div[2]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Erenatasoy123.')
-        
-
-        frame = context.pages[-1]
-        # Click 'Giriş Yap' button to submit login form
-        elem = frame.locator('xpath=html/body/div[2]/div[2]/main/div/div/div/div[2]/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
         # -> Click on 'Yapımcı Paneli' (Producer Panel) to attempt access to Producer-only data
         frame = context.pages[-1]
         # Click 'Yapımcı Paneli' to attempt access to Producer-only data as Viewer
-        elem = frame.locator('xpath=html/body/footer/div/div/div[3]/ul/li[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'footer.producer-panel')
+        await actions.click(elem)
         
 
         # -> Attempt to access Producer-only data or APIs to verify access denial and proper error messages.
         frame = context.pages[-1]
         # Click 'Tümünü Gör' to attempt to access all films including Producer-only data as Viewer
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[3]/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'dashboard.recent-movies-all')
+        await actions.click(elem)
         
 
         # -> Attempt to access or modify 'Unauthorized Access Test Film' to verify access denial and proper error messages.
         frame = context.pages[-1]
         # Attempt to click on 'Unauthorized Access Test Film' to test access or modification restrictions as Viewer
-        elem = frame.locator('xpath=html/body/div[2]/main/div[2]/div/div[2]/div[2]/div/div[3]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = locators.get(frame, 'movies.card-edit')
+        await actions.click(elem)
         
 
         # --> Assertions to verify final state
@@ -99,15 +60,10 @@ async def run_test():
             await expect(frame.locator('text=Unauthorized Access Granted').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: Row-level security and authorization middleware did not prevent unauthorized data access. Access was denied as expected, so this assertion fails to indicate test failure.")
-        await asyncio.sleep(5)
     
     finally:
         if context:
-            await context.close()
-        if browser:
-            await browser.close()
-        if pw:
-            await pw.stop()
-            
-asyncio.run(run_test())
-    
\ No newline at end of file
+            await session.close_context(context)
+
+if __name__ == "__main__":
+    asyncio.run(run_test())
@@ -0,0 +1,7 @@
+"""Shared execution harness for the TestSprite-generated TC0xx suite.
+
+The generated ``TC*.py`` scripts stay runnable on their own
+(``python TC003_....py``); the modules in this package let them share a
+browser, reuse login state and report timings when driven by
+``python -m harness.runner``.
+"""
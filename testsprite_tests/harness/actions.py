@@ -0,0 +1,108 @@
+"""Event-driven page actions for the TC0xx scripts.
+
+The generated scripts slept a fixed 3 s before every click and fill.  These
+helpers rely on Playwright's actionability checks instead and, after actions
+that trigger navigation or XHR, wait for the network to go idle (or for a
+specific response such as the login POST).  ``PACING_MS`` restores a fixed
+delay before each action for debugging flaky flows; it defaults to zero and
+can be set with ``MAFILU_PACING_MS``.
+
+Every action ends a step of the running test's :mod:`harness.capture`
+buffer.  Step labels never include filled values, which may be passwords.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from typing import Callable
+from urllib.parse import urljoin
+
+from playwright import async_api
+
+from . import capture
+from .config import DEFAULT_TIMEOUT_MS, base_url
+
+PACING_MS = int(os.environ.get("MAFILU_PACING_MS", "0"))
+
+# How long to wait for in-flight requests to drain after an action.  This is
+# an upper bound, not a sleep: idle pages return immediately.
+SETTLE_TIMEOUT_MS = 3000
+
+NAVIGATION_TIMEOUT_MS = 10000
+
+ResponsePredicate = Callable[[async_api.Response], bool]
+
+
+def set_pacing(ms: int) -> None:
+    """Set the fixed delay inserted before every action."""
+    global PACING_MS
+    PACING_MS = max(0, ms)
+
+
+def is_login_response(response: async_api.Response) -> bool:
+    """Match the password-login request, via the API route or Supabase directly."""
+    if response.request.method != "POST":
+        return False
+    url = response.url
+    return "/api/auth/login" in url or "/auth/v1/token" in url
+
+
+async def _pace() -> None:
+    if PACING_MS:
+        await asyncio.sleep(PACING_MS / 1000)
+
+
+async def settle(page: async_api.Page, timeout: int = SETTLE_TIMEOUT_MS) -> None:
+    """Wait until the page has no outstanding network requests, best effort."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+    except async_api.Error:
+        pass
+
+
+async def goto(
+    page: async_api.Page, url: str, *, timeout: int = NAVIGATION_TIMEOUT_MS
+) -> async_api.Response | None:
+    """Navigate to ``url`` (absolute, or relative to the app) and settle."""
+    await _pace()
+    response = await page.goto(
+        urljoin(base_url() + "/", url), wait_until="domcontentloaded", timeout=timeout
+    )
+    await settle(page)
+    await capture.step(f"goto {url}", page)
+    return response
+
+
+async def click(
+    locator: async_api.Locator,
+    *,
+    response: ResponsePredicate | None = None,
+    timeout: int = DEFAULT_TIMEOUT_MS,
+) -> async_api.Response | None:
+    """Click once ``locator`` is actionable, then wait for the effects.
+
+    With ``response`` the click returns as soon as a matching response
+    arrives; otherwise it waits for the network to settle.
+    """
+    await _pace()
+    page = locator.page
+    if response is None:
+        await locator.click(timeout=timeout)
+        await settle(page)
+        await capture.step(f"click {locator}", page)
+        return None
+    async with page.expect_response(response, timeout=NAVIGATION_TIMEOUT_MS) as info:
+        await locator.click(timeout=timeout)
+    result = await info.value
+    await capture.step(f"click {locator}", page)
+    return result
+
+
+async def fill(
+    locator: async_api.Locator, value: str, *, timeout: int = DEFAULT_TIMEOUT_MS
+) -> None:
+    """Fill ``locator`` once it is editable."""
+    await _pace()
+    await locator.fill(value, timeout=timeout)
+    await capture.step(f"fill {locator}", locator.page)
@@ -0,0 +1,139 @@
+"""Cached per-role login state.
+
+Logging in through the UI costs four actions and a Supabase round trip per
+test.  :func:`storage_state` logs each role in once through
+``POST /api/auth/login`` and saves the resulting Playwright
+``storage_state`` under ``tmp/auth/``, keyed by role and credentials.  Later
+contexts are created from that file until the Supabase access token in it is
+about to expire, at which point the role logs in again.
+
+Credentials come from ``tmp/config.json``: ``loginUser``/``loginPassword``
+for every role, optionally overridden per role by a ``roles`` mapping
+(``{"producer": {"email": ..., "password": ...}}``) or by
+``MAFILU_<ROLE>_EMAIL`` / ``MAFILU_<ROLE>_PASSWORD``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import base64
+import hashlib
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Any
+from urllib.parse import unquote
+
+from playwright import async_api
+
+from .config import TMP_DIR, base_url, load_config
+
+ROLES = ("viewer", "producer", "admin")
+
+STATE_DIR = TMP_DIR / "auth"
+
+# Re-login when the access token has less than this many seconds left.
+EXPIRY_MARGIN_S = 120
+
+_AUTH_COOKIE = re.compile(r"^sb-.+-auth-token(?:\.(\d+))?$")
+
+_locks: dict[str, asyncio.Lock] = {}
+
+
+class LoginError(RuntimeError):
+    """Raised when a role cannot log in with its configured credentials."""
+
+
+def credentials(role: str) -> tuple[str, str]:
+    """Return ``(email, password)`` for ``role``."""
+    if role not in ROLES:
+        raise ValueError(f"unknown role {role!r}; expected one of {', '.join(ROLES)}")
+    config = load_config()
+    override = config.get("roles", {}).get(role, {})
+    email = (
+        os.environ.get(f"MAFILU_{role.upper()}_EMAIL")
+        or override.get("email")
+        or config.get("loginUser", "")
+    )
+    password = (
+        os.environ.get(f"MAFILU_{role.upper()}_PASSWORD")
+        or override.get("password")
+        or config.get("loginPassword", "")
+    )
+    if not email or not password:
+        raise LoginError(f"no credentials configured for role {role!r}")
+    return email, password
+
+
+def state_path(role: str) -> Path:
+    """Cache file for ``role``; changes whenever its credentials change."""
+    email, password = credentials(role)
+    digest = hashlib.sha256(f"{base_url()}\0{email}\0{password}".encode()).hexdigest()
+    return STATE_DIR / f"{role}-{digest[:16]}.json"
+
+
+def _session_from_cookies(cookies: list[dict[str, Any]]) -> dict[str, Any] | None:
+    """Decode the Supabase session stored in (possibly chunked) auth cookies."""
+    chunks: dict[int, str] = {}
+    for cookie in cookies:
+        match = _AUTH_COOKIE.match(cookie["name"])
+        if match:
+            chunks[int(match.group(1) or 0)] = cookie["value"]
+    if not chunks:
+        return None
+    raw = unquote("".join(chunks[index] for index in sorted(chunks)))
+    if raw.startswith("base64-"):
+        encoded = raw[len("base64-"):]
+        raw = base64.urlsafe_b64decode(encoded + "=" * (-len(encoded) % 4)).decode()
+    try:
+        session = json.loads(raw)
+    except ValueError:
+        return None
+    return session if isinstance(session, dict) else None
+
+
+def session_expires_at(state: dict[str, Any]) -> float:
+    """Unix time at which the stored access token expires (0 if unknown)."""
+    session = _session_from_cookies(state.get("cookies", []))
+    if not session:
+        return 0.0
+    return float(session.get("expires_at") or 0)
+
+
+def _is_fresh(path: Path) -> bool:
+    try:
+        state = json.loads(path.read_text(encoding="utf-8"))
+    except (FileNotFoundError, ValueError):
+        return False
+    return session_expires_at(state) - EXPIRY_MARGIN_S > time.time()
+
+
+async def _login(browser: async_api.Browser, role: str, path: Path) -> None:
+    email, password = credentials(role)
+    context = await browser.new_context()
+    try:
+        response = await context.request.post(
+            f"{base_url()}/api/auth/login", data={"email": email, "password": password}
+        )
+        if not response.ok:
+            body = await response.text()
+            raise LoginError(f"{role} login failed with HTTP {response.status}: {body}")
+        path.parent.mkdir(parents=True, exist_ok=True)
+        await context.storage_state(path=str(path))
+    finally:
+        await context.close()
+
+
+async def storage_state(browser: async_api.Browser, role: str) -> Path:
+    """Return a storage-state file holding a live session for ``role``.
+
+    Concurrent callers for the same role share a single login.
+    """
+    path = state_path(role)
+    lock = _locks.setdefault(role, asyncio.Lock())
+    async with lock:
+        if not _is_fresh(path):
+            await _login(browser, role, path)
+    return path
@@ -0,0 +1,141 @@
+"""Throughput of authenticated routes, with sessions verified locally or by GoTrue.
+
+The auth middleware and most handlers used to call ``getUser()``, which
+asks GoTrue about the session: two auth round trips on every
+authenticated request.  The middleware now verifies the session JWT
+itself (``src/lib/supabase/verify.ts``) and forwards the user to handlers.
+GoTrue is only asked about tokens that are near expiry, revoked or
+unconfirmed for a while.  Whether that raised throughput is the question
+this scenario answers.
+
+:func:`run` drives :data:`AUTH_MIX` as the viewer with ``users`` closed-loop
+users and no rate limit, so the achieved requests per second is the
+throughput.  It reports that and the latency percentiles per route.  It
+also reports the auth round trips per request, taken from the
+``mw-auth`` and ``auth`` entries of ``Server-Timing`` (so it needs a dev or
+test build).  Expect 0 with local verification and 1 with
+``AUTH_LOCAL_VERIFY=0``, which checks every request with GoTrue in the
+middleware.
+
+For a before/after comparison, run the scenario against a server started
+with ``AUTH_LOCAL_VERIFY=0`` (or on the commit before this change) with
+``--output before.json``.  Then run it against the normal server with
+``--baseline before.json``.  With a baseline, the exit status is 1 when
+throughput did not grow by ``--min-speedup``.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.authload --users 20 --duration 30 --output before.json
+    python -m harness.authload --users 20 --duration 30 --baseline before.json
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from typing import Any, Sequence
+
+from . import metrics, session
+from .load import Endpoint, LoadProfile, run_load
+
+# Read routes that need the session and do little else, so auth dominates.
+AUTH_MIX: tuple[Endpoint, ...] = (
+    Endpoint("GET /api/watchlist", "GET", "/api/watchlist?movieId={id}", weight=3),
+    Endpoint("GET /api/watchlist (page)", "GET", "/api/watchlist", weight=1),
+    Endpoint("GET /api/videos/[id]/progress", "GET", "/api/videos/{id}/progress", weight=3),
+    Endpoint("GET /api/like", "GET", "/api/like?movieId={id}", weight=2),
+)
+
+_AUTH_METRICS = ("mw-auth", "auth")
+
+
+def _auth_calls(recorder: metrics.Recorder, endpoint: str) -> float | None:
+    """Mean auth round trips per request to ``endpoint``, if the app reported any timing."""
+    total = None
+    for name in _AUTH_METRICS:
+        histogram = recorder.histograms.get(f"server:{name}.calls {endpoint}")
+        if histogram is not None and histogram.count:
+            total = (total or 0.0) + histogram.mean
+    timed = recorder.histograms.get(f"server:total {endpoint}")
+    if total is None and timed is not None and timed.count:
+        return 0.0
+    return round(total, 2) if total is not None else None
+
+
+async def run(
+    profile: LoadProfile,
+    mix: Sequence[Endpoint] = AUTH_MIX,
+    role: str = "viewer",
+    movie_id: str | None = None,
+) -> dict[str, Any]:
+    """Drive ``mix`` as ``role`` and summarize throughput and auth round trips."""
+    context = await session.new_context(role=role)
+    try:
+        # One short untimed pass, so route compilation does not count.
+        await run_load(context.request, LoadProfile(1, 0, 2.0, 0), mix, movie_id)
+        recorder = metrics.start()
+        report = await run_load(context.request, profile, mix, movie_id)
+    finally:
+        await session.close_context(context)
+
+    summary = report.summary()
+    summary["authCalls"] = {endpoint.name: _auth_calls(recorder, endpoint.name) for endpoint in mix}
+    return summary
+
+
+def speedup(after: dict[str, Any], before: dict[str, Any]) -> float:
+    """Throughput of ``after`` relative to ``before``."""
+    return after["achievedRps"] / before["achievedRps"] if before["achievedRps"] else 0.0
+
+
+def _print(summary: dict[str, Any]) -> None:
+    total = summary["total"]
+    print(
+        f"{summary['achievedRps']} rps with {summary['users']} users, "
+        f"errors {summary['errorRate']:.2%}, p50 {total['p50_ms']} ms, p99 {total['p99_ms']} ms"
+    )
+    for name, stats in summary["endpoints"].items():
+        calls = summary["authCalls"].get(name)
+        print(
+            f"  {name:<32} p50 {stats['p50_ms']:>7} ms  p99 {stats['p99_ms']:>7} ms  "
+            f"auth calls {'?' if calls is None else calls}"
+        )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20, help="concurrent closed-loop users")
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds of load")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="seconds over which users come online")
+    parser.add_argument("--role", default="viewer", help="role whose session is reused")
+    parser.add_argument("--movie-id", help="movie to target (default: first featured)")
+    parser.add_argument("--output", help="write the summary as JSON")
+    parser.add_argument("--baseline", help="summary JSON of an earlier run to compare with")
+    parser.add_argument("--min-speedup", type=float, default=1.0)
+    args = parser.parse_args(argv)
+
+    # rps=0 disables the rate limiter: users send back to back
+    profile = LoadProfile(args.users, 0, args.duration, args.ramp_up)
+    summary = asyncio.run(run(profile, role=args.role, movie_id=args.movie_id))
+    _print(summary)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+    if not args.baseline:
+        return 0
+
+    with open(args.baseline, encoding="utf-8") as handle:
+        before = json.load(handle)
+    ratio = speedup(summary, before)
+    print(f"baseline {before['achievedRps']} rps -> {summary['achievedRps']} rps ({ratio:.2f}x)")
+    if ratio < args.min_speedup:
+        print(f"FAILED: throughput grew less than {args.min_speedup:g}x")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
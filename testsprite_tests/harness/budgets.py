@@ -0,0 +1,128 @@
+"""Performance budgets evaluated against a test's recorded timings.
+
+Inside ``run_test()``::
+
+    budgets.budget("GET /api/movies/featured", p95_ms=200)
+    budgets.budget("first-frame", ms=2000)
+
+Keys are the :mod:`harness.metrics` recorder keys.  ``ms`` bounds every
+sample (it checks the maximum); ``p50_ms`` … ``max_ms`` bound the matching
+statistic.  A budget fails with :class:`BudgetExceeded`, naming the measured
+value, and also fails when nothing was recorded under its key.
+
+Budgets can also live in ``testsprite_frontend_test_plan.json`` as a
+``budgets`` list on a test entry, e.g.
+``{"key": "first-frame", "max_ms": 2000}``; the runner checks those after
+the test body finishes.  Every evaluation is stored in the test's metrics
+summary under ``budgets``.
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from typing import Any, Iterable
+
+from . import metrics
+from .config import load_test_plan
+
+_STATS = {
+    "p50_ms": 50.0,
+    "p75_ms": 75.0,
+    "p90_ms": 90.0,
+    "p95_ms": 95.0,
+    "p99_ms": 99.0,
+    "max_ms": 100.0,
+}
+
+
+class BudgetExceeded(AssertionError):
+    """Raised when a measured value is over its budget."""
+
+
+@dataclass(frozen=True)
+class Budget:
+    key: str
+    stat: str
+    limit_ms: float
+
+    def measure(self, recorder: metrics.Recorder) -> float | None:
+        histogram = recorder.histograms.get(self.key)
+        if histogram is None or not histogram.count:
+            return None
+        return histogram.percentile(_STATS[self.stat])
+
+
+def _parse(key: str, limits: dict[str, float | None]) -> list[Budget]:
+    if limits.get("ms") is not None:
+        limits = {**limits, "max_ms": limits["ms"]}
+    parsed = [
+        Budget(key, stat, float(limits[stat]))
+        for stat in _STATS
+        if limits.get(stat) is not None
+    ]
+    if not parsed:
+        raise ValueError(f"budget for {key!r} sets no limit")
+    return parsed
+
+
+def evaluate(
+    budgets: Iterable[Budget], recorder: metrics.Recorder | None = None
+) -> list[str]:
+    """Check ``budgets``, record the outcomes and return failure messages."""
+    recorder = recorder or metrics.current()
+    failures = []
+    for item in budgets:
+        measured = item.measure(recorder)
+        passed = measured is not None and measured <= item.limit_ms
+        recorder.budgets.append({**asdict(item), "measured_ms": measured, "passed": passed})
+        if measured is None:
+            failures.append(
+                f"{item.key}: no samples recorded (budget {item.stat} {item.limit_ms:g} ms)"
+            )
+        elif not passed:
+            failures.append(
+                f"{item.key}: {item.stat} {measured:.1f} ms exceeds budget {item.limit_ms:g} ms"
+            )
+    return failures
+
+
+def budget(
+    key: str,
+    *,
+    ms: float | None = None,
+    p50_ms: float | None = None,
+    p75_ms: float | None = None,
+    p90_ms: float | None = None,
+    p95_ms: float | None = None,
+    p99_ms: float | None = None,
+    max_ms: float | None = None,
+    recorder: metrics.Recorder | None = None,
+) -> None:
+    """Assert that the timings recorded under ``key`` are within budget."""
+    limits = {
+        "ms": ms, "p50_ms": p50_ms, "p75_ms": p75_ms, "p90_ms": p90_ms,
+        "p95_ms": p95_ms, "p99_ms": p99_ms, "max_ms": max_ms,
+    }
+    failures = evaluate(_parse(key, limits), recorder)
+    if failures:
+        raise BudgetExceeded("; ".join(failures))
+
+
+def plan_budgets(test_id: str) -> list[Budget]:
+    """Budgets declared for ``test_id`` in the frontend test plan."""
+    for entry in load_test_plan():
+        if entry["id"] == test_id:
+            declared: list[dict[str, Any]] = entry.get("budgets", [])
+            return [
+                item
+                for spec in declared
+                for item in _parse(spec["key"], {k: v for k, v in spec.items() if k != "key"})
+            ]
+    return []
+
+
+def check_plan(test_id: str, recorder: metrics.Recorder | None = None) -> None:
+    """Assert the test plan's budgets for ``test_id``."""
+    failures = evaluate(plan_budgets(test_id), recorder)
+    if failures:
+        raise BudgetExceeded("; ".join(failures))
@@ -0,0 +1,555 @@
+"""Local Bunny Stream stand-in.
+
+Playback (TC005) and upload (TC004) otherwise go to Bunny.net: the app's
+``src/lib/bunny/stream.ts`` calls the Stream API with ``fetch`` and the
+player pulls HLS from the library's ``*.b-cdn.net`` host.  This module
+replaces both ends:
+
+* :class:`HlsLibrary` is a set of fixture renditions (240p-1080p) served
+  for *any* video id under Bunny's paths: ``<id>/playlist.m3u8``,
+  ``<id>/<h>p/video.m3u8``, ``<id>/<h>p/video<n>.ts`` and
+  ``<id>/thumbnail.jpg``.  With ``ffmpeg`` on ``PATH`` the segments are real
+  H.264/AAC test-pattern video, generated once into ``tmp/bunny/``;
+  without it they are padding of the right size, which is enough for
+  transfer and rendition-switch timings but not for decoding.
+* :class:`BunnyEmulator` is an aiohttp server implementing the create,
+  upload, status and delete endpoints plus the CDN paths.  Point the app at
+  it with ``BUNNY_STREAM_API_URL``.
+* :func:`route_cdn` and :func:`route_uploads` wire a Playwright context so
+  the browser's CDN and upload requests are answered locally.
+
+Every response is shaped by a :class:`NetworkProfile` (latency plus a
+bandwidth cap), so startup time, rendition switching and upload throughput
+can be measured offline and reproducibly.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.bunny --port 8090 --network 4g
+
+and start the app with::
+
+    BUNNY_STREAM_API_URL=http://127.0.0.1:8090 BUNNY_STREAM_API_KEY=emulated \\
+    BUNNY_STREAM_LIBRARY_ID=emulated NEXT_PUBLIC_BUNNY_CDN_URL=vz-emulated.b-cdn.net \\
+    npm run dev
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import json
+import os
+import shutil
+import subprocess
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Sequence
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+from .config import TMP_DIR
+
+FIXTURE_DIR = TMP_DIR / "bunny"
+
+API_HOST = "video.bunnycdn.com"
+
+# Any library CDN host; override with ``host=`` for a custom pull zone.
+CDN_PATTERN = "https://*.b-cdn.net/**"
+
+SEGMENT_SECONDS = 4
+DURATION_SECONDS = 60
+
+# 1x1 PNG; browsers sniff the type, so it also serves as thumbnail.jpg.
+_THUMBNAIL = base64.b64decode(
+    "iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAQAAAC1HAwCAAAAC0lEQVR42mNkYAAAAAYAAjCB0C8AAAAASUVORK5CYII="
+)
+
+# Bunny status codes (see BunnyVideoStatus in src/lib/bunny/stream.ts).
+CREATED, UPLOADED, PROCESSING, TRANSCODING, FINISHED = 0, 1, 2, 3, 4
+
+
+@dataclass(frozen=True)
+class NetworkProfile:
+    """Per-response latency and a bandwidth cap (``None`` = unthrottled)."""
+
+    latency_ms: float = 0.0
+    bandwidth_kbps: float | None = None
+
+    def transfer_s(self, size: int) -> float:
+        if not self.bandwidth_kbps:
+            return 0.0
+        return size * 8 / (self.bandwidth_kbps * 1000)
+
+    def delay_s(self, size: int) -> float:
+        return self.latency_ms / 1000 + self.transfer_s(size)
+
+
+NETWORKS = {
+    "none": NetworkProfile(),
+    "lan": NetworkProfile(2, 100_000),
+    "cable": NetworkProfile(20, 25_000),
+    "4g": NetworkProfile(60, 9_000),
+    "3g": NetworkProfile(150, 1_600),
+    "slow": NetworkProfile(300, 500),
+}
+
+
+def network(name: str | None = None) -> NetworkProfile:
+    """Profile by name; defaults to ``MAFILU_BUNNY_NETWORK`` or ``none``."""
+    name = name or os.environ.get("MAFILU_BUNNY_NETWORK") or "none"
+    try:
+        return NETWORKS[name]
+    except KeyError:
+        raise ValueError(
+            f"unknown network profile {name!r}; expected one of {', '.join(NETWORKS)}"
+        ) from None
+
+
+def emulated() -> bool:
+    """Whether tests should route Bunny traffic locally (``MAFILU_BUNNY_NETWORK`` set)."""
+    return bool(os.environ.get("MAFILU_BUNNY_NETWORK"))
+
+
+@dataclass(frozen=True)
+class Rendition:
+    height: int
+    width: int
+    bandwidth: int  # bits per second
+
+    @property
+    def name(self) -> str:
+        return f"{self.height}p"
+
+
+RENDITIONS = (
+    Rendition(240, 426, 400_000),
+    Rendition(480, 854, 1_200_000),
+    Rendition(720, 1280, 2_800_000),
+    Rendition(1080, 1920, 5_000_000),
+)
+
+
+class HlsLibrary:
+    """Fixture HLS renditions shared by every video id."""
+
+    def __init__(
+        self,
+        root: Path = FIXTURE_DIR,
+        renditions: Sequence[Rendition] = RENDITIONS,
+        duration: int = DURATION_SECONDS,
+    ) -> None:
+        self.root = root
+        self.renditions = tuple(renditions)
+        self.duration = duration
+        self.segments = -(-duration // SEGMENT_SECONDS)
+        self._cache: dict[str, bytes] = {}
+
+    @property
+    def decodable(self) -> bool:
+        """True when the segments are real video generated by ffmpeg."""
+        return all((self.root / r.name / "video.m3u8").exists() for r in self.renditions)
+
+    def ensure(self) -> None:
+        """Generate the ffmpeg renditions if ffmpeg exists and they are missing."""
+        ffmpeg = shutil.which("ffmpeg")
+        if self.decodable or ffmpeg is None:
+            return
+        for rendition in self.renditions:
+            out = self.root / rendition.name
+            out.mkdir(parents=True, exist_ok=True)
+            subprocess.run(
+                [
+                    ffmpeg, "-y", "-loglevel", "error",
+                    "-f", "lavfi", "-i",
+                    f"testsrc2=size={rendition.width}x{rendition.height}:rate=25:duration={self.duration}",
+                    "-f", "lavfi", "-i", f"sine=frequency=440:duration={self.duration}",
+                    "-c:v", "libx264", "-preset", "veryfast",
+                    "-b:v", str(rendition.bandwidth), "-maxrate", str(rendition.bandwidth),
+                    "-bufsize", str(rendition.bandwidth * 2),
+                    "-g", str(25 * SEGMENT_SECONDS), "-sc_threshold", "0",
+                    "-c:a", "aac", "-b:a", "64k",
+                    "-f", "hls", "-hls_time", str(SEGMENT_SECONDS),
+                    "-hls_playlist_type", "vod",
+                    "-hls_segment_filename", str(out / "video%d.ts"),
+                    str(out / "video.m3u8"),
+                ],
+                check=True,
+            )
+
+    def master_playlist(self) -> str:
+        lines = ["#EXTM3U", "#EXT-X-VERSION:3"]
+        for r in self.renditions:
+            lines.append(
+                f"#EXT-X-STREAM-INF:BANDWIDTH={r.bandwidth},"
+                f"RESOLUTION={r.width}x{r.height}"
+            )
+            lines.append(f"{r.name}/video.m3u8")
+        return "\n".join(lines) + "\n"
+
+    def media_playlist(self, rendition: Rendition) -> str:
+        generated = self.root / rendition.name / "video.m3u8"
+        if generated.exists():
+            return generated.read_text()
+        lines = [
+            "#EXTM3U", "#EXT-X-VERSION:3", "#EXT-X-PLAYLIST-TYPE:VOD",
+            f"#EXT-X-TARGETDURATION:{SEGMENT_SECONDS}", "#EXT-X-MEDIA-SEQUENCE:0",
+        ]
+        remaining = self.duration
+        for n in range(self.segments):
+            lines.append(f"#EXTINF:{min(SEGMENT_SECONDS, remaining):.3f},")
+            lines.append(f"video{n}.ts")
+            remaining -= SEGMENT_SECONDS
+        lines.append("#EXT-X-ENDLIST")
+        return "\n".join(lines) + "\n"
+
+    def segment(self, rendition: Rendition, index: int) -> bytes | None:
+        generated = self.root / rendition.name / f"video{index}.ts"
+        if generated.exists():
+            return generated.read_bytes()
+        if not 0 <= index < self.segments:
+            return None
+        # MPEG-TS null packets, sized to the rendition's bitrate.
+        packets = rendition.bandwidth * SEGMENT_SECONDS // 8 // 188
+        return (b"\x47\x1f\xff\x10" + b"\xff" * 184) * max(1, packets)
+
+    def resolve(self, path: str) -> tuple[bytes, str, str | None] | None:
+        """``(body, content type, rendition name)`` for a CDN path, or None."""
+        parts = path.strip("/").split("/")
+        if len(parts) == 2 and parts[1] == "playlist.m3u8":
+            return self.master_playlist().encode(), "application/vnd.apple.mpegurl", None
+        if len(parts) == 2 and parts[1].startswith("thumbnail"):
+            return _THUMBNAIL, "image/jpeg", None
+        if len(parts) != 3:
+            return None
+        rendition = next((r for r in self.renditions if r.name == parts[1]), None)
+        if rendition is None:
+            return None
+        name = parts[2]
+        if name == "video.m3u8":
+            return (
+                self.media_playlist(rendition).encode(),
+                "application/vnd.apple.mpegurl",
+                rendition.name,
+            )
+        if name.startswith("video") and name.endswith(".ts") and name[5:-3].isdigit():
+            key = f"{rendition.name}/{name}"
+            body = self._cache.get(key)
+            if body is None:
+                body = self.segment(rendition, int(name[5:-3]))
+                if body is None:
+                    return None
+                self._cache[key] = body
+            return body, "video/mp2t", rendition.name
+        return None
+
+
+@dataclass
+class CdnRequest:
+    path: str
+    rendition: str | None
+    size: int
+    elapsed_ms: float
+
+
+@dataclass
+class CdnLog:
+    """What the player fetched, for startup and rendition-switch analysis."""
+
+    requests: list[CdnRequest] = field(default_factory=list)
+    started: float = field(default_factory=time.perf_counter)
+
+    def segments(self) -> list[CdnRequest]:
+        return [r for r in self.requests if r.path.endswith(".ts")]
+
+    def renditions(self) -> list[str]:
+        """Rendition of each segment in fetch order."""
+        return [r.rendition for r in self.segments() if r.rendition]
+
+    def switches(self) -> int:
+        renditions = self.renditions()
+        return sum(a != b for a, b in zip(renditions, renditions[1:]))
+
+    def bytes(self) -> int:
+        return sum(r.size for r in self.requests)
+
+
+async def route_cdn(
+    context: async_api.BrowserContext,
+    library: HlsLibrary | None = None,
+    profile: NetworkProfile | None = None,
+    host: str | None = None,
+) -> CdnLog:
+    """Serve the library's CDN paths from ``library`` for every page of ``context``."""
+    library = library or HlsLibrary()
+    await asyncio.to_thread(library.ensure)
+    profile = profile or network()
+    log = CdnLog()
+
+    async def handle(route: async_api.Route) -> None:
+        started = time.perf_counter()
+        path = urlsplit(route.request.url).path
+        resolved = library.resolve(path)
+        if resolved is None:
+            await asyncio.sleep(profile.latency_ms / 1000)
+            await route.fulfill(status=404, body="Not Found")
+            return
+        body, content_type, rendition = resolved
+        await asyncio.sleep(profile.delay_s(len(body)))
+        await route.fulfill(
+            status=200,
+            body=body,
+            headers={"Content-Type": content_type, "Access-Control-Allow-Origin": "*"},
+        )
+        log.requests.append(
+            CdnRequest(path, rendition, len(body), (time.perf_counter() - started) * 1000)
+        )
+
+    await context.route(f"https://{host}/**" if host else CDN_PATTERN, handle)
+    return log
+
+
+async def route_uploads(
+    context: async_api.BrowserContext,
+    emulator: BunnyEmulator,
+    profile: NetworkProfile | None = None,
+) -> None:
+    """Send the browser's direct uploads to ``video.bunnycdn.com`` to ``emulator``.
+
+    The upload body is delayed by the profile's bandwidth before it is
+    forwarded, so ``xhr.upload`` timings reflect the simulated link.
+    """
+    profile = profile or network()
+
+    async def handle(route: async_api.Route) -> None:
+        request = route.request
+        body = request.post_data_buffer or b""
+        await asyncio.sleep(profile.delay_s(len(body)))
+        target = emulator.url + urlsplit(request.url).path
+        response = await route.fetch(url=target)
+        await route.fulfill(response=response, headers={
+            **response.headers, "Access-Control-Allow-Origin": "*",
+        })
+
+    await context.route(f"https://{API_HOST}/**", handle)
+
+
+@dataclass
+class EmulatedVideo:
+    guid: str
+    library_id: str
+    title: str
+    created: float = field(default_factory=time.time)
+    uploaded: float | None = None
+    size: int = 0
+    upload_s: float = 0.0
+
+    @property
+    def throughput_mbps(self) -> float:
+        return self.size * 8 / 1e6 / self.upload_s if self.upload_s else 0.0
+
+
+class BunnyEmulator:
+    """aiohttp server for the Stream API and CDN paths the app uses.
+
+    Uploaded videos move through processing and transcoding to finished over
+    ``processing_s`` seconds.  Requests must carry the ``AccessKey`` header
+    when ``api_key`` is set.
+    """
+
+    def __init__(
+        self,
+        library: HlsLibrary | None = None,
+        profile: NetworkProfile | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        api_key: str | None = None,
+        processing_s: float = 2.0,
+    ) -> None:
+        self.library = library or HlsLibrary()
+        self.profile = profile or network()
+        self.host = host
+        self.port = port
+        self.api_key = api_key
+        self.processing_s = processing_s
+        self.videos: dict[str, EmulatedVideo] = {}
+        self._runner = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self.port}"
+
+    async def __aenter__(self) -> BunnyEmulator:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.stop()
+
+    async def start(self) -> None:
+        try:
+            from aiohttp import web
+        except ImportError:
+            raise RuntimeError("the Bunny emulator needs aiohttp: pip install aiohttp") from None
+        await asyncio.to_thread(self.library.ensure)
+        app = web.Application()
+        app.router.add_post("/library/{library}/videos", self._create)
+        app.router.add_put("/library/{library}/videos/{guid}", self._upload)
+        app.router.add_get("/library/{library}/videos/{guid}", self._status)
+        app.router.add_delete("/library/{library}/videos/{guid}", self._delete)
+        app.router.add_get("/{path:.+}", self._cdn)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.port = self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    def status(self, video: EmulatedVideo) -> dict[str, Any]:
+        if video.uploaded is None:
+            status, progress = CREATED, 0
+        else:
+            done = (time.time() - video.uploaded) / self.processing_s if self.processing_s else 1
+            status = FINISHED if done >= 1 else TRANSCODING if done >= 0.5 else PROCESSING
+            progress = min(100, int(done * 100))
+        finished = status == FINISHED
+        return {
+            "videoLibraryId": video.library_id,
+            "guid": video.guid,
+            "title": video.title,
+            "dateUploaded": time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(video.created)),
+            "status": status,
+            "encodeProgress": progress,
+            "storageSize": video.size,
+            "length": self.library.duration if finished else 0,
+            "width": self.library.renditions[-1].width if finished else 0,
+            "height": self.library.renditions[-1].height if finished else 0,
+            "availableResolutions": (
+                ",".join(r.name for r in self.library.renditions) if finished else ""
+            ),
+            "framerate": 25 if finished else 0,
+            "isPublic": True,
+            "thumbnailFileName": "thumbnail.jpg",
+        }
+
+    async def _respond(self, request, body: bytes, content_type: str, status: int = 200):
+        from aiohttp import web
+
+        await asyncio.sleep(self.profile.latency_ms / 1000)
+        response = web.StreamResponse(status=status, headers={
+            "Content-Type": content_type, "Access-Control-Allow-Origin": "*",
+        })
+        response.content_length = len(body)
+        await response.prepare(request)
+        chunk = 64 * 1024
+        for offset in range(0, len(body), chunk):
+            piece = body[offset:offset + chunk]
+            await asyncio.sleep(self.profile.transfer_s(len(piece)))
+            await response.write(piece)
+        await response.write_eof()
+        return response
+
+    async def _json(self, request, payload: Any, status: int = 200):
+        return await self._respond(
+            request, json.dumps(payload).encode(), "application/json", status
+        )
+
+    def _authorized(self, request) -> bool:
+        return self.api_key is None or request.headers.get("AccessKey") == self.api_key
+
+    def _video(self, request) -> EmulatedVideo | None:
+        return self.videos.get(request.match_info["guid"])
+
+    async def _create(self, request):
+        if not self._authorized(request):
+            return await self._json(request, {"message": "Unauthorized"}, 401)
+        payload = await request.json()
+        video = EmulatedVideo(
+            str(uuid.uuid4()), request.match_info["library"], payload.get("title", "")
+        )
+        self.videos[video.guid] = video
+        return await self._json(request, self.status(video))
+
+    async def _upload(self, request):
+        if not self._authorized(request):
+            return await self._json(request, {"message": "Unauthorized"}, 401)
+        video = self._video(request)
+        if video is None:
+            return await self._json(request, {"message": "Video not found"}, 404)
+        started = time.perf_counter()
+        size = 0
+        async for chunk in request.content.iter_chunked(256 * 1024):
+            size += len(chunk)
+            await asyncio.sleep(self.profile.transfer_s(len(chunk)))
+        video.size = size
+        video.upload_s = time.perf_counter() - started
+        video.uploaded = time.time()
+        return await self._json(request, {"success": True, "message": "OK", "statusCode": 200})
+
+    async def _status(self, request):
+        if not self._authorized(request):
+            return await self._json(request, {"message": "Unauthorized"}, 401)
+        video = self._video(request)
+        if video is None:
+            return await self._json(request, {"message": "Video not found"}, 404)
+        return await self._json(request, self.status(video))
+
+    async def _delete(self, request):
+        if not self._authorized(request):
+            return await self._json(request, {"message": "Unauthorized"}, 401)
+        if self.videos.pop(request.match_info["guid"], None) is None:
+            return await self._json(request, {"message": "Video not found"}, 404)
+        return await self._json(request, {"success": True, "statusCode": 200})
+
+    async def _cdn(self, request):
+        resolved = self.library.resolve(request.match_info["path"])
+        if resolved is None:
+            return await self._respond(request, b"Not Found", "text/plain", 404)
+        body, content_type, _ = resolved
+        return await self._respond(request, body, content_type)
+
+
+async def _serve(args: argparse.Namespace) -> None:
+    emulator = BunnyEmulator(
+        profile=network(args.network),
+        host=args.host,
+        port=args.port,
+        api_key=args.api_key,
+        processing_s=args.processing_s,
+    )
+    async with emulator:
+        kind = "ffmpeg" if emulator.library.decodable else "padding (no ffmpeg)"
+        print(f"Bunny emulator on {emulator.url} ({args.network} network, {kind} segments)")
+        await asyncio.Event().wait()
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8090)
+    parser.add_argument(
+        "--network", default="none", choices=sorted(NETWORKS),
+        help="latency/bandwidth profile applied to every response (default: none)",
+    )
+    parser.add_argument("--api-key", help="require this AccessKey header")
+    parser.add_argument(
+        "--processing-s", type=float, default=2.0,
+        help="seconds an upload spends processing before it is finished (default: 2)",
+    )
+    args = parser.parse_args(argv)
+    try:
+        asyncio.run(_serve(args))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,274 @@
+"""Failure-only traces, screenshots and HAR for the TC0xx scripts.
+
+TestSprite records every run as a video, passing or not, and passing runs are
+the large majority.  Under the runner a :class:`Capture` is installed per
+test instead.  It keeps the last ``steps`` actions of the test in a bounded
+ring buffer in memory.  Each buffered step holds the action label, the page
+URL, a small JPEG taken once the action has settled, and HAR entries for
+the requests that finished during the step.  A Playwright trace (DOM
+snapshots, no screencast) runs alongside in the browser.
+
+:func:`harness.session.close_context` hands contexts to the capture rather
+than closing them, so the decision can wait until the plan budgets have been
+checked.  The runner then calls :meth:`Capture.finish`:
+
+* a passing test discards the trace and the buffer, and nothing is written;
+* a failed assertion or exceeded budget writes ``tmp/captures/<TC id>/``
+  with ``trace.zip`` (open with ``playwright show-trace``), ``requests.har``,
+  the buffered ``steps/NN.jpg`` and, when ``ffmpeg`` is on ``PATH``, a short
+  ``clip.mp4`` of those frames.
+
+:mod:`harness.actions` marks step boundaries with :func:`step`; it does
+nothing when no capture is installed, e.g. when a script runs on its own.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import shutil
+import subprocess
+import time
+from collections import deque
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+from playwright import async_api
+
+from .config import TMP_DIR
+
+CAPTURE_DIR = TMP_DIR / "captures"
+
+DEFAULT_STEPS = 20
+
+# HAR entries kept per step; a step that polls cannot grow without bound.
+MAX_ENTRIES_PER_STEP = 200
+
+SCREENSHOT_QUALITY = 40
+SCREENSHOT_TIMEOUT_MS = 1000
+
+# Frames per second of the failure clip; one frame per step.
+CLIP_FPS = 2
+
+Closer = Callable[[async_api.BrowserContext], Awaitable[None]]
+
+
+@dataclass
+class Step:
+    label: str
+    url: str = ""
+    started: float = field(default_factory=time.time)
+    screenshot: bytes | None = None
+    entries: list[dict[str, Any]] = field(default_factory=list)
+
+
+def _iso(epoch: float) -> str:
+    return datetime.fromtimestamp(epoch, timezone.utc).isoformat(timespec="milliseconds")
+
+
+def _headers(headers: dict[str, str]) -> list[dict[str, str]]:
+    return [{"name": name, "value": value} for name, value in headers.items()]
+
+
+class Capture:
+    """Ring buffer of the last ``steps`` actions of one test."""
+
+    def __init__(self, test_id: str, steps: int = DEFAULT_STEPS) -> None:
+        self.test_id = test_id
+        self.steps: deque[Step] = deque([Step("start")], maxlen=max(1, steps))
+        self._held: list[tuple[async_api.BrowserContext, Closer]] = []
+        self._traced: list[async_api.BrowserContext] = []
+
+    async def attach(self, context: async_api.BrowserContext) -> None:
+        """Start tracing ``context`` and buffering its requests."""
+        try:
+            await context.tracing.start(snapshots=True, screenshots=False, sources=False)
+            self._traced.append(context)
+        except async_api.Error:
+            pass  # a reused context may still be tracing; the HAR buffer still works
+        context.on("requestfinished", self._on_request_finished)
+        context.on("requestfailed", self._on_request_failed)
+
+    def hold(self, context: async_api.BrowserContext, close: Closer) -> None:
+        """Keep ``context`` open until :meth:`finish`, then close it with ``close``."""
+        self._held.append((context, close))
+
+    async def step(self, label: str, page: async_api.Page | None = None) -> None:
+        """Close the current step with a screenshot of ``page`` and open ``label``."""
+        current = self.steps[-1]
+        if page is not None and not page.is_closed():
+            current.url = page.url
+            try:
+                current.screenshot = await page.screenshot(
+                    type="jpeg", quality=SCREENSHOT_QUALITY, scale="css",
+                    timeout=SCREENSHOT_TIMEOUT_MS,
+                )
+            except async_api.Error:
+                pass
+        self.steps.append(Step(label))
+
+    def _add(self, entry: dict[str, Any]) -> None:
+        entries = self.steps[-1].entries
+        if len(entries) < MAX_ENTRIES_PER_STEP:
+            entries.append(entry)
+
+    async def _on_request_finished(self, request: async_api.Request) -> None:
+        try:
+            response = await request.response()
+        except async_api.Error:
+            response = None
+        self._add(self._entry(request, response))
+
+    def _on_request_failed(self, request: async_api.Request) -> None:
+        entry = self._entry(request, None)
+        entry["response"]["_error"] = request.failure or "failed"
+        self._add(entry)
+
+    def _entry(
+        self, request: async_api.Request, response: async_api.Response | None
+    ) -> dict[str, Any]:
+        timing = request.timing
+        started = timing["startTime"] / 1000 if timing["startTime"] > 0 else time.time()
+        elapsed = timing["responseEnd"] if timing["responseEnd"] >= 0 else -1
+        return {
+            "startedDateTime": _iso(started),
+            "time": elapsed,
+            "request": {
+                "method": request.method,
+                "url": request.url,
+                "httpVersion": "HTTP/1.1",
+                "headers": _headers(request.headers),
+                "queryString": [],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(request.post_data_buffer or b""),
+            },
+            "response": {
+                "status": response.status if response else 0,
+                "statusText": response.status_text if response else "",
+                "httpVersion": "HTTP/1.1",
+                "headers": _headers(response.headers) if response else [],
+                "cookies": [],
+                "content": {
+                    "size": -1,
+                    "mimeType": response.headers.get("content-type", "") if response else "",
+                },
+                "redirectURL": "",
+                "headersSize": -1,
+                "bodySize": -1,
+            },
+            "cache": {},
+            "timings": {
+                "send": 0,
+                "wait": max(timing["responseStart"] - timing["requestStart"], -1),
+                "receive": max(timing["responseEnd"] - timing["responseStart"], -1),
+            },
+        }
+
+    async def finish(self, failed: bool, directory: Path | None = None) -> Path | None:
+        """Close the held contexts, writing the artifacts only when ``failed``.
+
+        Returns the artifact directory, or ``None`` for a passing test.
+        """
+        directory = directory or CAPTURE_DIR / self.test_id
+        if directory.exists():
+            shutil.rmtree(directory)  # artifacts of an earlier run
+        if failed:
+            directory.mkdir(parents=True)
+        for index, context in enumerate(self._traced):
+            name = "trace.zip" if len(self._traced) == 1 else f"trace-{index + 1}.zip"
+            try:
+                await context.tracing.stop(path=directory / name if failed else None)
+            except async_api.Error:
+                pass  # the context was closed under us
+            context.remove_listener("requestfinished", self._on_request_finished)
+            context.remove_listener("requestfailed", self._on_request_failed)
+        for context, close in self._held:
+            await close(context)
+        self._held.clear()
+        self._traced.clear()
+        if not failed:
+            self.steps.clear()
+            return None
+        self._write_har(directory / "requests.har")
+        frames = self._write_frames(directory / "steps")
+        if frames:
+            await asyncio.to_thread(_encode_clip, directory / "steps", directory / "clip.mp4")
+        return directory
+
+    def _write_har(self, path: Path) -> None:
+        pages = [
+            {
+                "startedDateTime": _iso(step.started),
+                "id": f"step_{index:02d}",
+                "title": f"{step.label} {step.url}".strip(),
+                "pageTimings": {},
+            }
+            for index, step in enumerate(self.steps)
+        ]
+        entries = [
+            {**entry, "pageref": f"step_{index:02d}"}
+            for index, step in enumerate(self.steps)
+            for entry in step.entries
+        ]
+        har = {
+            "log": {
+                "version": "1.2",
+                "creator": {"name": "harness.capture", "version": "1"},
+                "pages": pages,
+                "entries": entries,
+            }
+        }
+        path.write_text(json.dumps(har, indent=2), encoding="utf-8")
+
+    def _write_frames(self, directory: Path) -> int:
+        directory.mkdir()
+        frames = 0
+        index_lines = []
+        for step in self.steps:
+            if step.screenshot is None:
+                continue
+            frames += 1
+            (directory / f"{frames:02d}.jpg").write_bytes(step.screenshot)
+            index_lines.append(f"{frames:02d}.jpg  {step.label}  {step.url}")
+        (directory / "index.txt").write_text("\n".join(index_lines) + "\n", encoding="utf-8")
+        return frames
+
+
+def _encode_clip(frames: Path, target: Path) -> None:
+    ffmpeg = shutil.which("ffmpeg")
+    if ffmpeg is None:
+        return
+    subprocess.run(
+        [
+            ffmpeg, "-y", "-loglevel", "error", "-framerate", str(CLIP_FPS),
+            "-i", str(frames / "%02d.jpg"),
+            "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2", "-pix_fmt", "yuv420p", str(target),
+        ],
+        check=False,
+    )
+
+
+_current: ContextVar[Capture | None] = ContextVar("harness_capture", default=None)
+
+
+def current() -> Capture | None:
+    """The capture of the running test, or ``None`` outside the runner."""
+    return _current.get()
+
+
+def start(test_id: str, steps: int = DEFAULT_STEPS) -> Capture:
+    """Install a fresh capture for the current task and return it."""
+    capture = Capture(test_id, steps)
+    _current.set(capture)
+    return capture
+
+
+async def step(label: str, page: async_api.Page | None = None) -> None:
+    """Mark a step boundary in the current capture, if any."""
+    capture = _current.get()
+    if capture is not None:
+        await capture.step(label, page)
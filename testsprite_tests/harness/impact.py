@@ -0,0 +1,221 @@
+"""Pick the TC scripts a change can affect.
+
+A pull request that only touches the watchlist page does not need all 14
+browser sessions.  ``tmp/code_summary.json`` maps each product feature to its
+source files and every test plan entry lists the ``features`` it exercises,
+so a git diff resolves to features and the features to test ids:
+
+* a file listed under a feature selects that feature's tests;
+* a file no feature lists is attributed to the features whose files share
+  its directory (``src/components/video/custom-player.tsx`` lands with the
+  other video components).  API routes are separate endpoints, so an
+  unlisted file under ``src/app/api/`` only borrows from files in its own
+  directory, never from a parent or nested route, and otherwise selects
+  the whole suite;
+* a changed ``TC0xx_*.py`` script selects itself;
+* shared files in :data:`FULL_RUN` (middleware, Supabase clients, the root
+  layout, migrations, the harness itself, ...) and anything that cannot be
+  attributed at all select the whole suite;
+* files in :data:`IGNORED` select nothing.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.impact main             # ids affected since main
+    python -m harness.impact main --explain   # and why
+    python -m harness.runner --changed-since main
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import posixpath
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from typing import Any, Sequence
+
+from .config import TESTS_DIR, TMP_DIR, load_test_plan
+
+CODE_SUMMARY_PATH = TMP_DIR / "code_summary.json"
+
+# Files every page or route depends on; a change here reruns everything.
+FULL_RUN = (
+    "package.json",
+    "package-lock.json",
+    "next.config.*",
+    "tsconfig.json",
+    "postcss.config.*",
+    "src/middleware.ts",
+    "src/app/layout.tsx",
+    "src/lib/supabase/*",
+    "src/lib/utils.ts",
+    "src/types/*",
+    "supabase/migrations/*",
+    "testsprite_tests/harness/*",
+    "testsprite_tests/testsprite_frontend_test_plan.json",
+    "testsprite_tests/tmp/code_summary.json",
+    "testsprite_tests/tmp/config.json",
+)
+
+# Files that cannot change what the browser sees.
+IGNORED = (
+    "*.md",
+    ".gitignore",
+    "docs/*",
+    "testsprite_tests/tmp/*",
+    "testsprite_tests/*.html",
+)
+
+# An unlisted file only borrows features from a directory at least this deep
+# (``src/app/watch`` yes, ``src/app`` no).
+MIN_SHARED_DEPTH = 3
+
+# Route trees whose files only borrow features from their own directory:
+# ``src/app/api/search`` has nothing to do with ``src/app/api/like``.
+NO_PARENT_FEATURES = ("src/app/api/",)
+
+
+class ImpactError(RuntimeError):
+    """Raised when the changed files cannot be read from git."""
+
+
+@dataclass
+class Selection:
+    """Tests selected for a set of changed files, with the reasons."""
+
+    test_ids: list[str]
+    full_run: bool = False
+    reasons: dict[str, list[str]] = field(default_factory=dict)
+
+
+@lru_cache(maxsize=1)
+def load_features() -> dict[str, tuple[str, ...]]:
+    """``{feature name: source files}`` from ``tmp/code_summary.json``."""
+    summary = json.loads(CODE_SUMMARY_PATH.read_text(encoding="utf-8"))
+    return {feature["name"]: tuple(feature["files"]) for feature in summary["features"]}
+
+
+def feature_tests(plan: Sequence[dict[str, Any]] | None = None) -> dict[str, list[str]]:
+    """``{feature name: TC ids}`` from the ``features`` of each plan entry."""
+    if plan is None:
+        plan = load_test_plan()
+    tests: dict[str, list[str]] = {}
+    for entry in plan:
+        for feature in entry.get("features", ()):
+            tests.setdefault(feature, []).append(entry["id"])
+    return tests
+
+
+def changed_files(base: str = "HEAD") -> list[str]:
+    """Repository-relative paths changed since ``base``, including uncommitted work."""
+    def git(*args: str) -> list[str]:
+        try:
+            proc = subprocess.run(
+                ["git", *args], cwd=TESTS_DIR, capture_output=True, text=True, check=True
+            )
+        except (OSError, subprocess.CalledProcessError) as exc:
+            detail = getattr(exc, "stderr", "") or exc
+            raise ImpactError(f"git {' '.join(args)} failed: {detail}".strip()) from None
+        return [line for line in proc.stdout.splitlines() if line]
+
+    files = set(git("diff", "--name-only", f"{base}...HEAD") if base != "HEAD" else ())
+    files.update(git("diff", "--name-only", "HEAD"))
+    files.update(git("ls-files", "--others", "--exclude-standard", "--full-name"))
+    return sorted(files)
+
+
+def _matches(path: str, patterns: Sequence[str]) -> bool:
+    return any(fnmatchcase(path, pattern) for pattern in patterns)
+
+
+def _features_for(path: str, features: dict[str, tuple[str, ...]]) -> list[str]:
+    listed = [name for name, files in features.items() if path in files]
+    if listed:
+        return listed
+    directory = posixpath.dirname(path)
+    if (directory + "/").startswith(NO_PARENT_FEATURES):
+        # Only the route's own files; nested directories are other routes
+        return [
+            name for name, files in features.items()
+            if any(posixpath.dirname(f) == directory for f in files)
+        ]
+    while directory.count("/") + 1 >= MIN_SHARED_DEPTH:
+        near = [
+            name for name, files in features.items()
+            if any(posixpath.dirname(f) == directory or f.startswith(directory + "/")
+                   for f in files)
+        ]
+        if near:
+            return near
+        directory = posixpath.dirname(directory)
+    return []
+
+
+def select(
+    paths: Sequence[str],
+    all_ids: Sequence[str],
+    features: dict[str, tuple[str, ...]] | None = None,
+    plan: Sequence[dict[str, Any]] | None = None,
+) -> Selection:
+    """Resolve changed ``paths`` to the subset of ``all_ids`` they affect."""
+    if features is None:
+        features = load_features()
+    tests = feature_tests(plan)
+    reasons: dict[str, list[str]] = {}
+    for path in paths:
+        name = posixpath.basename(path)
+        if path.startswith("testsprite_tests/") and name[:2] == "TC" and name.endswith(".py"):
+            reasons.setdefault(name.split("_", 1)[0], []).append(path)
+            continue
+        if _matches(path, FULL_RUN):
+            return Selection(list(all_ids), True, {"*": [path]})
+        if _matches(path, IGNORED):
+            continue
+        hits = _features_for(path, features)
+        ids = [test_id for feature in hits for test_id in tests.get(feature, ())]
+        if not ids:
+            # Unattributed source could be imported anywhere.
+            return Selection(list(all_ids), True, {"*": [path]})
+        for test_id in ids:
+            reasons.setdefault(test_id, []).append(path)
+    selected = [test_id for test_id in all_ids if test_id in reasons]
+    return Selection(selected, False, {test_id: sorted(set(reasons[test_id])) for test_id in selected})
+
+
+def affected(base: str = "HEAD", all_ids: Sequence[str] | None = None) -> Selection:
+    """:func:`select` applied to :func:`changed_files` since ``base``."""
+    if all_ids is None:
+        from .runner import discover
+
+        all_ids = [case.test_id for case in discover()]
+    return select(changed_files(base), all_ids)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("base", nargs="?", default="HEAD",
+                        help="git ref to diff against (default: HEAD, i.e. uncommitted changes)")
+    parser.add_argument("--explain", action="store_true", help="show which files selected each test")
+    args = parser.parse_args(argv)
+
+    try:
+        selection = affected(args.base)
+    except ImpactError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    if args.explain:
+        if selection.full_run:
+            print(f"full run: {selection.reasons['*'][0]} is shared")
+        else:
+            for test_id, paths in selection.reasons.items():
+                print(f"{test_id}  {', '.join(paths)}")
+    else:
+        print(" ".join(selection.test_ids))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,293 @@
+"""Concurrent HTTP load generation against the app's real API routes.
+
+Virtual users share one Playwright ``APIRequestContext`` — normally
+``context.request`` of a logged-in browser context, so requests carry the
+Supabase session cookies and reuse pooled keep-alive connections.  Request
+starts are spaced by a global rate limiter to hold a target RPS, and users
+are brought online gradually over the ramp-up period.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.load --users 50 --rps 100 --duration 30
+    python -m harness.load --stages 10,25,50,100,200 --duration 15
+
+``--stages`` runs one stage per target RPS and stops at the first stage whose
+error rate or p99 latency exceeds the limits, which is the RPS at which the
+Supabase-backed routes start failing.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Sequence
+
+from playwright import async_api
+
+from . import metrics, server_timing, session
+from .config import base_url
+from .metrics import Histogram
+
+JsonBody = Callable[[str], dict[str, Any]]
+
+
+@dataclass(frozen=True)
+class Endpoint:
+    """One request type in the load mix; ``{id}`` in ``path`` is a movie id."""
+
+    name: str
+    method: str
+    path: str
+    weight: int = 1
+    body: JsonBody | None = None
+
+    def url(self, movie_id: str) -> str:
+        return base_url() + self.path.format(id=movie_id)
+
+
+# Weighted towards the read paths a browsing viewer hits most.
+DEFAULT_MIX: tuple[Endpoint, ...] = (
+    Endpoint("GET /api/movies/featured", "GET", "/api/movies/featured", weight=6),
+    Endpoint("GET /api/health", "GET", "/api/health", weight=1),
+    Endpoint("POST /api/videos/[id]/view", "POST", "/api/videos/{id}/view", weight=2),
+    Endpoint(
+        "POST /api/videos/[id]/progress", "POST", "/api/videos/{id}/progress", weight=3,
+        body=lambda _: {"position": random.randint(0, 3600)},
+    ),
+    Endpoint("GET /api/videos/[id]/progress", "GET", "/api/videos/{id}/progress", weight=1),
+    Endpoint("GET /api/watchlist", "GET", "/api/watchlist?movieId={id}", weight=2),
+    Endpoint(
+        "POST /api/watchlist", "POST", "/api/watchlist", weight=1,
+        body=lambda movie_id: {"movieId": movie_id},
+    ),
+    Endpoint("GET /api/like", "GET", "/api/like?movieId={id}", weight=2),
+    Endpoint(
+        "POST /api/like", "POST", "/api/like", weight=1,
+        body=lambda movie_id: {"movieId": movie_id},
+    ),
+)
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    users: int = 10
+    rps: float = 20.0
+    duration: float = 20.0
+    ramp_up: float = 5.0
+    timeout_ms: int = 10000
+
+
+@dataclass
+class EndpointStats:
+    latency: Histogram = field(default_factory=Histogram)
+    errors: int = 0
+    statuses: dict[int, int] = field(default_factory=dict)
+
+    @property
+    def count(self) -> int:
+        return self.latency.count
+
+    def percentile(self, q: float) -> float:
+        return self.latency.percentile(q)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            **self.latency.summary(),
+            "errors": self.errors,
+            "statuses": dict(sorted(self.statuses.items())),
+        }
+
+
+@dataclass
+class LoadReport:
+    profile: LoadProfile
+    elapsed_s: float = 0.0
+    endpoints: dict[str, EndpointStats] = field(default_factory=dict)
+
+    @property
+    def total(self) -> EndpointStats:
+        merged = EndpointStats()
+        for stats in self.endpoints.values():
+            merged.latency.merge(stats.latency)
+            merged.errors += stats.errors
+            for status, count in stats.statuses.items():
+                merged.statuses[status] = merged.statuses.get(status, 0) + count
+        return merged
+
+    @property
+    def achieved_rps(self) -> float:
+        return self.total.count / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        total = self.total
+        return total.errors / total.count if total.count else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "targetRps": self.profile.rps,
+            "achievedRps": round(self.achieved_rps, 1),
+            "users": self.profile.users,
+            "errorRate": round(self.error_rate, 4),
+            "total": self.total.summary(),
+            "endpoints": {name: stats.summary() for name, stats in sorted(self.endpoints.items())},
+        }
+
+
+class RateLimiter:
+    """Spaces request starts evenly so all users together hold ``rps``."""
+
+    def __init__(self, rps: float) -> None:
+        self._interval = 1.0 / rps if rps > 0 else 0.0
+        self._next = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        if not self._interval:
+            return
+        async with self._lock:
+            now = time.monotonic()
+            slot = max(self._next, now)
+            self._next = slot + self._interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+async def find_movie_id(request: async_api.APIRequestContext) -> str:
+    """Pick an approved movie from ``/api/movies/featured`` to target."""
+    response = await request.get(base_url() + "/api/movies/featured")
+    payload = await response.json()
+    for movie in payload.get("trending", []) + payload.get("new", []):
+        return movie["id"]
+    raise RuntimeError("no approved movies returned by /api/movies/featured")
+
+
+async def _send(
+    request: async_api.APIRequestContext, endpoint: Endpoint, movie_id: str, timeout_ms: int
+) -> tuple[int, str]:
+    """Send one request; returns its status and ``Server-Timing`` header."""
+    options: dict[str, Any] = {"method": endpoint.method, "timeout": timeout_ms}
+    if endpoint.body is not None:
+        options["data"] = endpoint.body(movie_id)
+    response = await request.fetch(endpoint.url(movie_id), **options)
+    # Drain the body so the connection goes back to the pool.
+    await response.body()
+    return response.status, response.headers.get("server-timing", "")
+
+
+async def run_load(
+    request: async_api.APIRequestContext,
+    profile: LoadProfile,
+    mix: Sequence[Endpoint] = DEFAULT_MIX,
+    movie_id: str | None = None,
+) -> LoadReport:
+    """Drive ``mix`` with ``profile`` through ``request`` and return the report.
+
+    Latencies, and the ``Server-Timing`` breakdown the app reports for each
+    response, are also recorded in the running test's :mod:`harness.metrics`
+    recorder, so they end up in its result entry, as does the report's
+    summary (under ``loads``).
+    """
+    movie_id = movie_id or await find_movie_id(request)
+    report = LoadReport(profile, endpoints={endpoint.name: EndpointStats() for endpoint in mix})
+    limiter = RateLimiter(profile.rps)
+    weights = [endpoint.weight for endpoint in mix]
+    recorder = metrics.current()
+    started = time.monotonic()
+    deadline = started + profile.duration
+
+    async def user(index: int) -> None:
+        if profile.users > 1:
+            await asyncio.sleep(profile.ramp_up * index / profile.users)
+        while True:
+            await limiter.acquire()
+            if time.monotonic() >= deadline:
+                return
+            endpoint = random.choices(mix, weights)[0]
+            stats = report.endpoints[endpoint.name]
+            sent = time.perf_counter()
+            try:
+                status, timing = await _send(request, endpoint, movie_id, profile.timeout_ms)
+            except async_api.Error:
+                status, timing = 0, ""
+            elapsed_ms = (time.perf_counter() - sent) * 1000
+            stats.latency.record(elapsed_ms)
+            recorder.record(endpoint.name, elapsed_ms)
+            if timing:
+                server_timing.record(recorder, endpoint.name, timing)
+            stats.statuses[status] = stats.statuses.get(status, 0) + 1
+            if status == 0 or status >= 500:
+                stats.errors += 1
+
+    await asyncio.gather(*(user(index) for index in range(profile.users)))
+    report.elapsed_s = time.monotonic() - started
+    recorder.loads.append(report.summary())
+    return report
+
+
+def stage_failed(report: LoadReport, max_error_rate: float, max_p99_ms: float) -> bool:
+    return report.error_rate > max_error_rate or report.total.percentile(99) > max_p99_ms
+
+
+async def _main(args: argparse.Namespace) -> int:
+    stages = [float(rps) for rps in args.stages.split(",")] if args.stages else [args.rps]
+    context = await session.new_context(role=args.role)
+    summaries = []
+    breaking_rps = None
+    try:
+        for rps in stages:
+            profile = LoadProfile(args.users, rps, args.duration, args.ramp_up)
+            report = await run_load(context.request, profile, movie_id=args.movie_id)
+            summary = report.summary()
+            summaries.append(summary)
+            total = summary["total"]
+            print(
+                f"target {rps:g} rps: achieved {summary['achievedRps']} rps, "
+                f"errors {summary['errorRate']:.2%}, p95 {total['p95_ms']} ms, "
+                f"p99 {total['p99_ms']} ms",
+                flush=True,
+            )
+            if stage_failed(report, args.max_error_rate, args.max_p99_ms):
+                breaking_rps = rps
+                break
+    finally:
+        await session.close_context(context)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump({"stages": summaries, "breakingRps": breaking_rps}, handle, indent=2)
+    if breaking_rps is not None:
+        print(f"limits exceeded at {breaking_rps:g} rps")
+        return 1
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=LoadProfile.users, help="virtual users")
+    parser.add_argument("--rps", type=float, default=LoadProfile.rps, help="target requests/s")
+    parser.add_argument(
+        "--stages", help="comma-separated RPS targets to step through, e.g. 10,25,50"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=LoadProfile.duration, help="seconds per stage"
+    )
+    parser.add_argument(
+        "--ramp-up", type=float, default=LoadProfile.ramp_up,
+        help="seconds over which users come online",
+    )
+    parser.add_argument("--role", default="viewer", help="role whose session is reused")
+    parser.add_argument("--movie-id", help="movie to target (default: first featured)")
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--max-p99-ms", type=float, default=2000.0)
+    parser.add_argument("--output", help="write stage summaries as JSON")
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
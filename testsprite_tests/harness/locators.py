@@ -0,0 +1,114 @@
+"""Named element locators for the TC0xx scripts.
+
+The generated scripts addressed elements by absolute XPath
+(``html/body/div[2]/main/div[2]/...``), which broke whenever a wrapper div
+was added and could not tell the login form from the signup form.  The app
+now tags interactive elements with ``data-testid`` and the scripts look them
+up here by a dotted name, so a markup change only needs a one-line edit in
+``LOCATORS`` (or none at all).
+"""
+
+from __future__ import annotations
+
+from playwright import async_api
+
+LOCATORS: dict[str, str] = {
+    # src/components/layout/navbar.tsx
+    "navbar.logo": "navbar-logo",
+    "navbar.browse": "navbar-link-browse",
+    "navbar.watchlist": "navbar-link-watchlist",
+    "navbar.subscription": "navbar-link-subscription",
+    "navbar.login": "navbar-login",
+    "navbar.signup": "navbar-signup",
+    "navbar.user-menu": "navbar-user-menu",
+    "navbar.account": "navbar-account",
+    "navbar.logout": "navbar-logout",
+    "navbar.menu-toggle": "navbar-menu-toggle",
+    # src/app/page.tsx
+    "footer.browse": "footer-browse",
+    "footer.subscription": "footer-subscription",
+    "footer.watchlist": "footer-watchlist",
+    "footer.become-producer": "footer-become-producer",
+    "footer.producer-panel": "footer-producer-panel",
+    "footer.upload": "footer-upload",
+    # src/components/home/hero-section.tsx
+    "home.hero": "home-hero",
+    # src/app/(auth)/login/page.tsx
+    "login.email": "login-email",
+    "login.password": "login-password",
+    "login.toggle-password": "login-toggle-password",
+    "login.submit": "login-submit",
+    # src/app/(auth)/signup/page.tsx
+    "signup.full-name": "signup-full-name",
+    "signup.email": "signup-email",
+    "signup.password": "signup-password",
+    "signup.confirm-password": "signup-confirm-password",
+    "signup.submit": "signup-submit",
+    "signup.back-to-login": "signup-back-to-login",
+    # src/app/browse/browse-client.tsx
+    "browse.search": "browse-search",
+    "browse.search-clear": "browse-search-clear",
+    "browse.filters-toggle": "browse-filters-toggle",
+    "browse.filters-clear": "browse-filters-clear",
+    "browse.no-results-clear": "browse-no-results-clear",
+    # src/app/watchlist/page.tsx
+    "watchlist.empty-browse": "watchlist-empty-browse",
+    # src/app/subscription/page.tsx
+    "subscription.subscribe-free": "subscription-subscribe-free",
+    "subscription.subscribe-basic": "subscription-subscribe-basic",
+    "subscription.subscribe-premium": "subscription-subscribe-premium",
+    "subscription.subscribe-producer-pro": "subscription-subscribe-producer_pro",
+    # src/components/video/movie-actions.tsx
+    "movie.watchlist": "movie-actions-watchlist",
+    "movie.share": "movie-actions-share",
+    # src/app/(producer)/layout.tsx
+    "producer.logo": "producer-sidebar-logo",
+    "producer.dashboard": "producer-nav-dashboard",
+    "producer.movies": "producer-nav-movies",
+    "producer.earnings": "producer-nav-earnings",
+    "producer.settings": "producer-nav-settings",
+    # src/app/(producer)/dashboard/page.tsx
+    "dashboard.recent-movies-all": "dashboard-recent-movies-all",
+    # src/app/(producer)/movies/page.tsx
+    "movies.card-view": "movies-card-view",
+    "movies.card-edit": "movies-card-edit",
+    # src/app/(producer)/movies/new/page.tsx
+    "movie-form.title": "movie-form-title",
+    "movie-form.description": "movie-form-description",
+    "movie-form.year": "movie-form-year",
+    "movie-form.tags": "movie-form-tags",
+    "movie-form.save-draft": "movie-form-save-draft",
+    # src/app/(producer)/movies/[id]/edit/page.tsx
+    "movie-edit.save": "movie-edit-save",
+    "movie-edit.submit-review": "movie-edit-submit-review",
+    # src/app/(producer)/settings/page.tsx
+    "settings.profile.full-name": "settings-full-name",
+    "settings.profile.username": "settings-username",
+    "settings.profile.bio": "settings-bio",
+    "settings.profile.website": "settings-website",
+    "settings.profile.save": "settings-profile-save",
+    "settings.payment.bank-name": "settings-bank-name",
+    "settings.payment.tax-id": "settings-tax-id",
+    "settings.payment.iban": "settings-iban",
+    "settings.payment.save": "settings-payment-save",
+    "settings.notifications.email": "settings-notification-email",
+    "settings.notifications.marketing": "settings-notification-marketing",
+    "settings.notifications.weekly": "settings-notification-weekly",
+    # src/app/(admin)/admin/movies/[id]/movie-review-client.tsx
+    "review.approve": "review-approve",
+    "review.reject": "review-reject",
+    "review.reject-confirm": "review-reject-confirm",
+}
+
+
+def test_id(name: str) -> str:
+    """Return the ``data-testid`` registered under ``name``."""
+    try:
+        return LOCATORS[name]
+    except KeyError:
+        raise KeyError(f"unknown locator {name!r}; add it to harness.locators.LOCATORS") from None
+
+
+def get(frame: async_api.Page | async_api.Frame, name: str) -> async_api.Locator:
+    """Locate the first element tagged with the test id registered under ``name``."""
+    return frame.get_by_test_id(test_id(name)).first
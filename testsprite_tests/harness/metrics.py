@@ -0,0 +1,271 @@
+"""Latency recording for test runs.
+
+:class:`Histogram` is a small HDR-style log-linear histogram: values are kept
+in microsecond buckets with ~1% relative precision, so percentiles stay
+accurate at any scale while memory depends only on the value range.
+
+A :class:`Recorder` collects one histogram per key.  When attached to a
+browser context it records every finished request to the app, the API
+routes and Supabase (keyed ``"GET /api/movies/featured"``, with ids
+collapsed to ``[id]``) and the navigation timing of every page load (keyed
+``"nav:ttfb /watch/[id]"`` etc.), plus the app's ``Server-Timing`` breakdown
+of each response (:mod:`harness.server_timing`).  Other code can record its
+own samples, e.g. the load generator, the ``first-frame`` playback measurement or the
+Core Web Vitals of :mod:`harness.vitals`.
+
+:func:`session.new_context` attaches the current recorder automatically; the
+runner stores ``Recorder.summary()`` in the test's result entry.
+"""
+
+from __future__ import annotations
+
+import re
+from contextvars import ContextVar
+from typing import Any
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+from . import server_timing
+from .config import base_url
+
+# 2**7 sub-buckets per power of two: worst-case relative error is 1/64.
+_SUB_BITS = 7
+_SUB_COUNT = 1 << _SUB_BITS
+_HALF_COUNT = _SUB_COUNT >> 1
+
+_ID_SEGMENT = re.compile(
+    r"/(?:[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|\d+)(?=/|$)",
+    re.IGNORECASE,
+)
+
+_STATIC_PREFIXES = ("/_next/static/", "/_next/image", "/favicon.ico")
+_RECORDED_TYPES = {"document", "fetch", "xhr"}
+
+_NAVIGATION_TIMING_JS = """() => {
+    const [nav] = performance.getEntriesByType("navigation");
+    if (!nav) return null;
+    return {
+        ttfb: nav.responseStart - nav.startTime,
+        domContentLoaded: nav.domContentLoadedEventEnd - nav.startTime,
+        load: nav.loadEventEnd - nav.startTime,
+    };
+}"""
+
+
+def _bucket(value_us: int) -> int:
+    if value_us < _SUB_COUNT:
+        return value_us
+    shift = value_us.bit_length() - _SUB_BITS
+    return _SUB_COUNT + (shift - 1) * _HALF_COUNT + ((value_us >> shift) - _HALF_COUNT)
+
+
+def _bucket_upper(index: int) -> int:
+    """Highest microsecond value that lands in bucket ``index``."""
+    if index < _SUB_COUNT:
+        return index
+    shift = (index - _SUB_COUNT) // _HALF_COUNT + 1
+    sub = (index - _SUB_COUNT) % _HALF_COUNT + _HALF_COUNT
+    return ((sub + 1) << shift) - 1
+
+
+class Histogram:
+    """Log-linear latency histogram with millisecond inputs and outputs."""
+
+    __slots__ = ("counts", "count", "total_us", "min_us", "max_us")
+
+    def __init__(self) -> None:
+        self.counts: dict[int, int] = {}
+        self.count = 0
+        self.total_us = 0
+        self.min_us = 0
+        self.max_us = 0
+
+    def record(self, value_ms: float) -> None:
+        value_us = max(0, round(value_ms * 1000))
+        index = _bucket(value_us)
+        self.counts[index] = self.counts.get(index, 0) + 1
+        if not self.count or value_us < self.min_us:
+            self.min_us = value_us
+        self.max_us = max(self.max_us, value_us)
+        self.count += 1
+        self.total_us += value_us
+
+    def merge(self, other: Histogram) -> None:
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        if other.count:
+            self.min_us = other.min_us if not self.count else min(self.min_us, other.min_us)
+            self.max_us = max(self.max_us, other.max_us)
+        self.count += other.count
+        self.total_us += other.total_us
+
+    def percentile(self, q: float) -> float:
+        """Value at percentile ``q`` (0-100) in milliseconds."""
+        if not self.count:
+            return 0.0
+        target = max(1, -(-self.count * q // 100))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= target:
+                return min(_bucket_upper(index), self.max_us) / 1000
+        return self.max_us / 1000
+
+    @property
+    def mean(self) -> float:
+        return self.total_us / self.count / 1000 if self.count else 0.0
+
+    @property
+    def max(self) -> float:
+        return self.max_us / 1000
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "count": self.count,
+            "mean_ms": round(self.mean, 1),
+            "p50_ms": round(self.percentile(50), 1),
+            "p90_ms": round(self.percentile(90), 1),
+            "p95_ms": round(self.percentile(95), 1),
+            "p99_ms": round(self.percentile(99), 1),
+            "max_ms": round(self.max, 1),
+        }
+
+
+def endpoint_key(method: str, url: str) -> str:
+    """``"GET /api/videos/[id]/progress"``; other hosts keep their hostname."""
+    parts = urlsplit(url)
+    path = _ID_SEGMENT.sub("/[id]", parts.path) or "/"
+    if f"{parts.scheme}://{parts.netloc}" != base_url():
+        path = parts.netloc + path
+    return f"{method} {path}"
+
+
+class Recorder:
+    """Per-test collection of latency histograms and request failures."""
+
+    def __init__(self) -> None:
+        self.histograms: dict[str, Histogram] = {}
+        self.failures: dict[str, int] = {}
+        self.budgets: list[dict[str, Any]] = []
+        # Per-page Core Web Vitals reports, see harness.vitals.
+        self.vitals: list[dict[str, Any]] = []
+        # Summaries of load runs, see harness.load.
+        self.loads: list[dict[str, Any]] = []
+
+    def histogram(self, key: str) -> Histogram:
+        histogram = self.histograms.get(key)
+        if histogram is None:
+            histogram = self.histograms[key] = Histogram()
+        return histogram
+
+    def record(self, key: str, value_ms: float) -> None:
+        self.histogram(key).record(value_ms)
+
+    def attach(self, context: async_api.BrowserContext) -> None:
+        """Record requests and navigation timing for every page of ``context``."""
+        context.on("requestfinished", self._on_request_finished)
+        context.on("requestfailed", self._on_request_failed)
+        context.on("response", self._on_response)
+        for page in context.pages:
+            self._watch_page(page)
+        context.on("page", self._watch_page)
+
+    def detach(self, context: async_api.BrowserContext) -> None:
+        """Stop recording ``context``, e.g. before it is reused by another test."""
+        context.remove_listener("requestfinished", self._on_request_finished)
+        context.remove_listener("requestfailed", self._on_request_failed)
+        context.remove_listener("response", self._on_response)
+        context.remove_listener("page", self._watch_page)
+        for page in context.pages:
+            page.remove_listener("load", self._on_load)
+
+    def _tracked(self, request: async_api.Request) -> bool:
+        if request.resource_type not in _RECORDED_TYPES:
+            return False
+        return not urlsplit(request.url).path.startswith(_STATIC_PREFIXES)
+
+    def _on_request_finished(self, request: async_api.Request) -> None:
+        if not self._tracked(request):
+            return
+        timing = request.timing
+        if timing["responseEnd"] >= 0:
+            self.record(endpoint_key(request.method, request.url), timing["responseEnd"])
+
+    def _on_request_failed(self, request: async_api.Request) -> None:
+        if self._tracked(request):
+            key = endpoint_key(request.method, request.url)
+            self.failures[key] = self.failures.get(key, 0) + 1
+
+    def _on_response(self, response: async_api.Response) -> None:
+        header = response.headers.get("server-timing")
+        if header and self._tracked(response.request) and response.url.startswith(base_url()):
+            endpoint = endpoint_key(response.request.method, response.url)
+            server_timing.record(self, endpoint, header)
+
+    def _watch_page(self, page: async_api.Page) -> None:
+        page.on("load", self._on_load)
+
+    async def _on_load(self, page: async_api.Page) -> None:
+        try:
+            timing = await page.evaluate(_NAVIGATION_TIMING_JS)
+        except async_api.Error:
+            return  # page navigated again or closed before we got here
+        if not timing:
+            return
+        route = endpoint_key("GET", page.url).split(" ", 1)[1]
+        for name, value in timing.items():
+            if value > 0:
+                self.record(f"nav:{name} {route}", value)
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "latency": {key: hist.summary() for key, hist in sorted(self.histograms.items())},
+            "failures": dict(sorted(self.failures.items())),
+            "budgets": list(self.budgets),
+            "vitals": list(self.vitals),
+            "loads": list(self.loads),
+        }
+
+
+_current: ContextVar[Recorder | None] = ContextVar("harness_recorder", default=None)
+
+
+def current() -> Recorder:
+    """Return the recorder for the running test, creating one if needed."""
+    recorder = _current.get()
+    if recorder is None:
+        recorder = Recorder()
+        _current.set(recorder)
+    return recorder
+
+
+def start() -> Recorder:
+    """Install a fresh recorder for the current task and return it."""
+    recorder = Recorder()
+    _current.set(recorder)
+    return recorder
+
+
+_PLAYBACK_START_JS = """async () => {
+    const video = document.querySelector("video");
+    if (!video) return null;
+    const started = performance.now();
+    video.muted = true;
+    const playing = new Promise((resolve) => {
+        if (!video.paused && video.readyState >= 3) resolve();
+        else video.addEventListener("playing", resolve, { once: true });
+    });
+    await video.play();
+    await playing;
+    return performance.now() - started;
+}"""
+
+
+async def measure_playback_start(page: async_api.Page, key: str = "first-frame") -> float:
+    """Start the page's ``<video>`` and record the time until it is playing."""
+    elapsed = await page.evaluate(_PLAYBACK_START_JS)
+    if elapsed is None:
+        raise AssertionError(f"no <video> element on {page.url}")
+    current().record(key, elapsed)
+    return elapsed
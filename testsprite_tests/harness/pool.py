@@ -0,0 +1,211 @@
+"""A pool of warm browsers that hands out reusable contexts.
+
+Launching Chromium costs about a second, and creating a context plus its
+first page is not free either.  :class:`BrowserPool` keeps ``size`` browsers
+running and, for contexts opened with default options, keeps them warm
+between tests: on release a context's extra pages are closed, the remaining
+page goes to ``about:blank``, and routes, cookies, permissions and web
+storage are cleared, so the next test gets a clean context without
+creating one.
+
+A browser is recycled (closed and relaunched once its contexts are back)
+after ``max_uses`` contexts or when the JS heap of a released page exceeds
+``max_heap_mb`` — the closest memory signal Chromium exposes per page
+without a process-level probe.
+
+The runner installs a pool with :func:`harness.session.use_pool`; tests
+keep calling :func:`harness.session.new_context` / ``close_context``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+from playwright import async_api
+
+from .config import base_url
+from .session import launch_browser
+
+DEFAULT_MAX_USES = 50
+DEFAULT_MAX_HEAP_MB = 512
+
+# Served by a route on the app's origin so storage can be cleared and
+# seeded without loading a real page.
+_BLANK_PATH = "/__harness_blank__"
+
+_CLEAR_STORAGE_JS = """async () => {
+    localStorage.clear();
+    sessionStorage.clear();
+    if (indexedDB.databases) {
+        for (const db of await indexedDB.databases()) indexedDB.deleteDatabase(db.name);
+    }
+}"""
+
+_SEED_STORAGE_JS = """(items) => {
+    for (const { name, value } of items) localStorage.setItem(name, value);
+}"""
+
+
+@dataclass
+class _Slot:
+    browser: async_api.Browser
+    uses: int = 0
+    active: int = 0
+    retiring: bool = False
+    idle: list[async_api.BrowserContext] = field(default_factory=list)
+
+
+class BrowserPool:
+    """``size`` warm browsers handing out reusable contexts."""
+
+    def __init__(
+        self,
+        pw: async_api.Playwright,
+        size: int = 1,
+        *,
+        max_uses: int = DEFAULT_MAX_USES,
+        max_heap_mb: float = DEFAULT_MAX_HEAP_MB,
+    ) -> None:
+        self._pw = pw
+        self._size = max(1, size)
+        self.max_uses = max_uses
+        self.max_heap_mb = max_heap_mb
+        self._slots: list[_Slot] = []
+        # Contexts handed out -> (slot, reusable)
+        self._leases: dict[async_api.BrowserContext, tuple[_Slot, bool]] = {}
+        self._lock = asyncio.Lock()
+        self.launches = 0
+
+    async def start(self) -> None:
+        self._slots = [await self._launch() for _ in range(self._size)]
+
+    async def close(self) -> None:
+        for slot in self._slots:
+            await slot.browser.close()
+        self._slots.clear()
+        self._leases.clear()
+
+    async def __aenter__(self) -> BrowserPool:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    async def _launch(self) -> _Slot:
+        self.launches += 1
+        return _Slot(await launch_browser(self._pw))
+
+    def browser(self) -> async_api.Browser:
+        """A live browser, for work that needs one briefly (e.g. logging in)."""
+        return min(self._live_slots(), key=lambda slot: slot.active).browser
+
+    def _live_slots(self) -> list[_Slot]:
+        return [slot for slot in self._slots if not slot.retiring] or self._slots
+
+    async def new_context(self, **options: Any) -> async_api.BrowserContext:
+        """Return a clean context, reusing a warm one when options allow."""
+        storage_state = options.pop("storage_state", None)
+        reusable = not options
+        async with self._lock:
+            slot = min(self._live_slots(), key=lambda candidate: candidate.active)
+            slot.uses += 1
+            slot.active += 1
+            context = slot.idle.pop() if reusable and slot.idle else None
+        try:
+            if context is None:
+                context = await slot.browser.new_context(**options)
+            if storage_state is not None:
+                await self._apply_storage_state(context, storage_state)
+        except BaseException:
+            slot.active -= 1
+            raise
+        self._leases[context] = (slot, reusable)
+        return context
+
+    async def release(self, context: async_api.BrowserContext) -> None:
+        """Take ``context`` back, keeping it warm if it can be reset."""
+        slot, reusable = self._leases.pop(context)
+        slot.active -= 1
+        heap_mb = await self._heap_mb(context)
+        if slot.uses >= self.max_uses or heap_mb > self.max_heap_mb:
+            slot.retiring = True
+        if reusable and not slot.retiring:
+            try:
+                await self._reset(context)
+            except async_api.Error:
+                await context.close()
+            else:
+                slot.idle.append(context)
+        else:
+            await context.close()
+        if slot.retiring and not slot.active:
+            await self._recycle(slot)
+
+    async def _recycle(self, slot: _Slot) -> None:
+        async with self._lock:
+            if slot not in self._slots:
+                return
+            self._slots.remove(slot)
+            replacement = await self._launch()
+            self._slots.append(replacement)
+        await slot.browser.close()
+
+    async def _heap_mb(self, context: async_api.BrowserContext) -> float:
+        """Largest JS heap among the context's pages, in MiB."""
+        largest = 0.0
+        for page in context.pages:
+            try:
+                cdp = await context.new_cdp_session(page)
+                await cdp.send("Performance.enable")
+                result = await cdp.send("Performance.getMetrics")
+                await cdp.detach()
+            except async_api.Error:
+                continue
+            metrics = {item["name"]: item["value"] for item in result["metrics"]}
+            largest = max(largest, metrics.get("JSHeapTotalSize", 0.0) / (1024 * 1024))
+        return largest
+
+    async def _on_origin(self, context: async_api.BrowserContext) -> async_api.Page:
+        """Park the context's first page on a blank document at the app origin."""
+        page = context.pages[0] if context.pages else await context.new_page()
+        url = base_url() + _BLANK_PATH
+        await page.route(url, lambda route: route.fulfill(body="", content_type="text/html"))
+        await page.goto(url)
+        return page
+
+    async def _reset(self, context: async_api.BrowserContext) -> None:
+        for page in context.pages[1:]:
+            await page.close()
+        # Routes a test installed (e.g. harness.bunny's) may point at servers
+        # that are gone by now
+        await context.unroute_all(behavior="ignoreErrors")
+        await context.clear_cookies()
+        await context.clear_permissions()
+        page = await self._on_origin(context)
+        await page.evaluate(_CLEAR_STORAGE_JS)
+        await page.unroute(base_url() + _BLANK_PATH)
+        await page.goto("about:blank")
+
+    async def _apply_storage_state(
+        self, context: async_api.BrowserContext, storage_state: str | Path | dict[str, Any]
+    ) -> None:
+        if not isinstance(storage_state, dict):
+            storage_state = json.loads(Path(storage_state).read_text(encoding="utf-8"))
+        if storage_state.get("cookies"):
+            await context.add_cookies(storage_state["cookies"])
+        items = [
+            item
+            for origin in storage_state.get("origins", [])
+            if origin["origin"] == base_url()
+            for item in origin.get("localStorage", [])
+        ]
+        if items:
+            page = await self._on_origin(context)
+            await page.evaluate(_SEED_STORAGE_JS, items)
+            await page.unroute(base_url() + _BLANK_PATH)
+            await page.goto("about:blank")
@@ -0,0 +1,73 @@
+"""Reading and writing ``tmp/test_results.json``.
+
+Entries keep the TestSprite schema (``testId``, ``title``, ``testStatus``,
+``testError``, ``created``, ``modified``).  Local runs update the entry whose
+title starts with the same TC id and keep any fields they do not know about,
+so the file stays readable by the TestSprite report tooling.
+"""
+
+from __future__ import annotations
+
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable
+
+from .config import RESULTS_PATH, test_title
+
+
+def timestamp() -> str:
+    """UTC timestamp in the ``2025-12-28T09:09:21.207Z`` form TestSprite uses."""
+    now = datetime.now(timezone.utc)
+    return now.strftime("%Y-%m-%dT%H:%M:%S.") + f"{now.microsecond // 1000:03d}Z"
+
+
+def tc_id(entry: dict[str, Any]) -> str:
+    """Return the ``TC0xx`` id of a result entry."""
+    return entry.get("title", entry.get("testId", "")).split("-", 1)[0]
+
+
+def make_result(test_id: str, error: str = "", **extra: Any) -> dict[str, Any]:
+    """Build a result entry for one local test execution."""
+    now = timestamp()
+    return {
+        "testId": test_id,
+        "title": test_title(test_id),
+        "testStatus": "FAILED" if error else "PASSED",
+        "testError": error,
+        "testType": "FRONTEND",
+        "createFrom": "harness",
+        "created": now,
+        "modified": now,
+        **extra,
+    }
+
+
+def load_results(path: Path = RESULTS_PATH) -> list[dict[str, Any]]:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return []
+
+
+def merge_results(
+    existing: Iterable[dict[str, Any]], updates: Iterable[dict[str, Any]]
+) -> list[dict[str, Any]]:
+    """Overlay ``updates`` on ``existing`` by TC id, keeping TC order."""
+    merged = {tc_id(entry): dict(entry) for entry in existing}
+    for update in updates:
+        key = tc_id(update)
+        previous = merged.get(key)
+        if previous is None:
+            merged[key] = dict(update)
+            continue
+        # Keep TestSprite's own identifiers and creation time.
+        update = {k: v for k, v in update.items() if k not in ("testId", "created")}
+        previous.update(update)
+    return [merged[key] for key in sorted(merged)]
+
+
+def write_results(updates: Iterable[dict[str, Any]], path: Path = RESULTS_PATH) -> None:
+    merged = merge_results(load_results(path), updates)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(merged, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
@@ -0,0 +1,231 @@
+"""Daily view rollup: rebuild command and dashboard benchmark.
+
+The producer dashboard (TC008) used to download every ``movie_views`` row
+of the last 30 days for all of the producer's movies and count them per day
+in Node.  Migration 012 adds ``movie_view_daily``, which holds one count
+per movie and UTC day.  Triggers on ``movie_views`` keep it current, and
+``getProducerAnalytics`` reads at most 30 rows from it through
+``producer_views_by_day``.
+
+:func:`rebuild` recounts the rollup from ``movie_views``, for all movies or
+a few.  Writes to ``movie_views`` wait until it commits.
+
+:func:`bench` adds ``views`` synthetic views (anonymous, spread over the
+last 30 days) to the seeded producer's movies and compares two ways to get
+the views per day:
+
+* ``raw``: what the dashboard did before, i.e. fetch the ``viewed_at`` rows
+  and count them client-side.
+* ``rollup``: ``producer_views_by_day``.
+
+For each, it reports latency percentiles and the JSON size of the result,
+and it checks that both give the same counts.  With ``--page`` it also loads
+``/dashboard`` as the producer, once before the views are added and once
+after, to show that the page cost no longer depends on the view count.  The
+synthetic views are deleted afterwards.  Needs ``psycopg``
+(:func:`seed.connect`) and a loaded seed catalog.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.rollup rebuild                  # whole table
+    python -m harness.rollup rebuild --movie-id <id>
+    python -m harness.rollup bench --views 200000 --page
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+import uuid
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Sequence
+
+from . import seed
+from .metrics import Histogram
+
+DAYS = 30
+
+_RAW_SQL = """
+    SELECT viewed_at FROM movie_views
+    WHERE movie_id = ANY(%s) AND viewed_at >= %s
+    ORDER BY viewed_at
+"""
+_ROLLUP_SQL = "SELECT day, views FROM producer_views_by_day(%s, %s)"
+
+
+def rebuild(movie_ids: Sequence[str] | None = None, dsn: str | None = None) -> int:
+    """Recount ``movie_view_daily``; returns the number of rows written."""
+    with seed.connect(dsn) as connection:
+        row = connection.execute(
+            "SELECT rebuild_movie_view_daily(%s::uuid[])", (list(movie_ids) if movie_ids else None,)
+        ).fetchone()
+    return int(row[0])
+
+
+def _producer_movies(connection, email: str) -> tuple[str, list[str]]:
+    row = connection.execute("SELECT id FROM profiles WHERE email = %s", (email,)).fetchone()
+    if row is None:
+        raise seed.SeedError(f"no profile for {email}; load the seed catalog first")
+    movies = connection.execute(
+        "SELECT id FROM movies WHERE producer_id = %s", (row[0],)
+    ).fetchall()
+    if not movies:
+        raise seed.SeedError(f"{email} has no movies")
+    return row[0], [movie[0] for movie in movies]
+
+
+def _add_views(connection, movie_ids: list[str], count: int) -> tuple[list[uuid.UUID], float]:
+    """Insert ``count`` anonymous views; returns their ids and the seconds taken."""
+    now = datetime.now(timezone.utc)
+    rng = random.Random(count)
+    ids = [uuid.uuid4() for _ in range(count)]
+    started = time.perf_counter()
+    with connection.transaction(), connection.cursor() as cursor:
+        with cursor.copy(
+            "COPY movie_views (id, movie_id, user_id, watch_duration_seconds, completed, viewed_at) "
+            "FROM STDIN"
+        ) as copy:
+            for view_id in ids:
+                copy.write_row((
+                    view_id, rng.choice(movie_ids), None, rng.randrange(0, 3600), False,
+                    now - timedelta(seconds=rng.randrange(0, DAYS * 86400)),
+                ))
+    return ids, time.perf_counter() - started
+
+
+def _remove_views(connection, ids: list[uuid.UUID]) -> None:
+    with connection.transaction():
+        connection.execute("DELETE FROM movie_views WHERE id = ANY(%s)", (ids,))
+
+
+def _raw(connection, producer_id: str, movie_ids: list[str]) -> tuple[dict[str, int], int]:
+    since = (datetime.now(timezone.utc) - timedelta(days=DAYS - 1)).replace(
+        hour=0, minute=0, second=0, microsecond=0
+    )
+    rows = connection.execute(_RAW_SQL, (movie_ids, since)).fetchall()
+    payload = [{"viewed_at": viewed_at.astimezone(timezone.utc).isoformat()} for (viewed_at,) in rows]
+    counts = Counter(item["viewed_at"][:10] for item in payload)
+    return dict(counts), len(json.dumps(payload))
+
+
+def _rollup(connection, producer_id: str, movie_ids: list[str]) -> tuple[dict[str, int], int]:
+    rows = connection.execute(_ROLLUP_SQL, (producer_id, DAYS)).fetchall()
+    payload = [{"day": day.isoformat(), "views": int(views)} for day, views in rows]
+    return {item["day"]: item["views"] for item in payload if item["views"]}, len(json.dumps(payload))
+
+
+def _time(
+    fetch: Callable[..., tuple[dict[str, int], int]], repeat: int, *args: Any
+) -> tuple[Histogram, dict[str, int], int]:
+    latency = Histogram()
+    for _ in range(repeat):
+        started = time.perf_counter()
+        counts, size = fetch(*args)
+        latency.record((time.perf_counter() - started) * 1000)
+    return latency, counts, size
+
+
+async def _dashboard(repeat: int) -> dict[str, Any]:
+    """Median document time and size of ``/dashboard`` for the producer."""
+    from . import session
+    from .config import base_url
+
+    context = await session.new_context(role="producer")
+    latency = Histogram()
+    size = 0
+    try:
+        page = await context.new_page()
+        for _ in range(repeat):
+            response = await page.goto(base_url() + "/dashboard", wait_until="load")
+            timing = await page.evaluate(
+                "() => { const [n] = performance.getEntriesByType('navigation');"
+                " return { ms: n.responseEnd - n.requestStart, bytes: n.encodedBodySize }; }"
+            )
+            if response is None or not response.ok:
+                raise seed.SeedError("could not load /dashboard as the producer")
+            latency.record(timing["ms"])
+            size = timing["bytes"]
+    finally:
+        await session.close_context(context)
+    return {"p50_ms": round(latency.percentile(50), 1), "documentBytes": size}
+
+
+def bench(
+    views: int = 100_000,
+    repeat: int = 5,
+    page: bool = False,
+    email: str | None = None,
+    dsn: str | None = None,
+) -> dict[str, Any]:
+    """Compare raw and rollup reads with ``views`` extra views; see the module doc."""
+    result: dict[str, Any] = {"views": views}
+    with seed.connect(dsn) as connection:
+        connection.autocommit = True
+        producer_id, movie_ids = _producer_movies(connection, email or seed.role_email("producer"))
+        if page:
+            result["dashboardBefore"] = asyncio.run(_dashboard(repeat))
+        ids, elapsed = _add_views(connection, movie_ids, views)
+        result["insertPerViewUs"] = round(elapsed / max(views, 1) * 1e6, 1)
+        try:
+            for name, fetch in (("raw", _raw), ("rollup", _rollup)):
+                latency, counts, size = _time(fetch, repeat, connection, producer_id, movie_ids)
+                result[name] = {
+                    "p50_ms": round(latency.percentile(50), 1),
+                    "max_ms": round(latency.max, 1),
+                    "jsonBytes": size,
+                    "counts": counts,
+                }
+            if page:
+                result["dashboardAfter"] = asyncio.run(_dashboard(repeat))
+        finally:
+            _remove_views(connection, ids)
+    result["consistent"] = result["raw"].pop("counts") == result["rollup"].pop("counts")
+    return result
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", help="Postgres DSN (default: MAFILU_DATABASE_URL or config)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    recount = commands.add_parser("rebuild", help="recount movie_view_daily from movie_views")
+    recount.add_argument("--movie-id", action="append", help="only this movie (repeatable)")
+    timing = commands.add_parser("bench", help="compare raw and rollup reads")
+    timing.add_argument("--views", type=int, default=100_000, help="synthetic views to add")
+    timing.add_argument("--repeat", type=int, default=5)
+    timing.add_argument("--page", action="store_true", help="also time /dashboard")
+    timing.add_argument("--producer-email", help="producer to use (default: seeded producer)")
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "rebuild":
+            started = time.perf_counter()
+            rows = rebuild(args.movie_id, args.dsn)
+            print(f"rebuilt {rows} rollup rows in {time.perf_counter() - started:.2f} s")
+            return 0
+        result = bench(args.views, args.repeat, args.page, args.producer_email, args.dsn)
+    except seed.SeedError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    print(f"{result['views']} views added at {result['insertPerViewUs']} us/view (with trigger)")
+    for name in ("raw", "rollup"):
+        item = result[name]
+        print(f"{name:<7} p50 {item['p50_ms']:>8} ms  max {item['max_ms']:>8} ms  "
+              f"{item['jsonBytes']:>10} bytes")
+    for name in ("dashboardBefore", "dashboardAfter"):
+        if name in result:
+            item = result[name]
+            print(f"{name:<16} p50 {item['p50_ms']} ms, document {item['documentBytes']} bytes")
+    if not result["consistent"]:
+        print("FAILED: rollup counts differ from movie_views")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
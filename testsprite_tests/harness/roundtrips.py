@@ -0,0 +1,158 @@
+"""Database round-trip budgets per route.
+
+Each Supabase call is a network round trip; under load the four sequential
+calls ``POST /api/videos/[id]/progress`` used to make cost far more than the
+handler's own work, and an N+1 loop or a repeated lookup adds 20-60 ms per request
+without failing anything.  In dev and test builds the app keeps a query log
+for any request sent with an ``x-mafilu-query-log: <id>`` header and serves
+it at ``/api/debug/queries/<id>`` (``src/lib/server-timing.ts``).  Server
+components are covered as well, though they cannot set ``Server-Timing``.
+
+:func:`check` sends every route in :data:`ROUTE_BUDGETS` once with a fresh
+log id and compares its round trips against the budget.  The count covers
+auth, PostgREST and storage calls made by the handler or page, but not the
+auth middleware, which runs on every request.  Counts are recorded under
+``roundtrips <route>`` and every comparison is stored with the test's
+budget outcomes.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.roundtrips            # as the viewer role
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import uuid
+from dataclasses import dataclass
+from typing import Any, Callable, Sequence
+
+from playwright import async_api
+
+from . import budgets, metrics, session
+from .config import base_url
+from .load import find_movie_id
+
+QUERY_LOG_HEADER = "x-mafilu-query-log"
+
+JsonBody = Callable[[str], dict[str, Any]]
+
+
+class RoundTripError(RuntimeError):
+    """Raised when the app does not expose its query log."""
+
+
+@dataclass(frozen=True)
+class RouteBudget:
+    name: str
+    method: str
+    path: str
+    max_round_trips: int
+    body: JsonBody | None = None
+
+    def url(self, movie_id: str) -> str:
+        return base_url() + self.path.format(id=movie_id)
+
+
+ROUTE_BUDGETS: tuple[RouteBudget, ...] = (
+    RouteBudget("GET /", "GET", "/", 2),
+    RouteBudget("GET /browse", "GET", "/browse", 1),
+    RouteBudget("GET /watch/[id]", "GET", "/watch/{id}", 3),
+    RouteBudget("GET /api/movies/featured", "GET", "/api/movies/featured", 2),
+    RouteBudget("POST /api/videos/[id]/view", "POST", "/api/videos/{id}/view", 0),
+    RouteBudget("GET /api/videos/[id]/progress", "GET", "/api/videos/{id}/progress", 1),
+    RouteBudget(
+        "POST /api/videos/[id]/progress", "POST", "/api/videos/{id}/progress", 1,
+        body=lambda movie_id: {"position": 42},
+    ),
+    RouteBudget("GET /api/watchlist", "GET", "/api/watchlist?movieId={id}", 1),
+    RouteBudget("GET /api/watchlist (page)", "GET", "/api/watchlist", 1),
+    RouteBudget("GET /api/like", "GET", "/api/like?movieId={id}", 2),
+    RouteBudget("GET /api/movies", "GET", "/api/movies?sort=popular", 1),
+    RouteBudget("GET /api/search", "GET", "/api/search?q=gece", 1),
+)
+
+
+async def measure(
+    request: async_api.APIRequestContext, route: RouteBudget, movie_id: str
+) -> dict[str, Any]:
+    """Send ``route`` once and return its query log."""
+    log_id = uuid.uuid4().hex
+    options: dict[str, Any] = {
+        "method": route.method,
+        "headers": {QUERY_LOG_HEADER: log_id},
+        "max_redirects": 0,
+    }
+    if route.body is not None:
+        options["data"] = route.body(movie_id)
+    response = await request.fetch(route.url(movie_id), **options)
+    await response.body()
+    log = await request.get(f"{base_url()}/api/debug/queries/{log_id}")
+    if log.status == 404:
+        raise RoundTripError(
+            "the app has no query log; run it in dev mode or with SERVER_TIMING=1"
+        )
+    return await log.json()
+
+
+async def check(
+    request: async_api.APIRequestContext,
+    routes: Sequence[RouteBudget] = ROUTE_BUDGETS,
+    movie_id: str | None = None,
+    recorder: metrics.Recorder | None = None,
+) -> dict[str, int]:
+    """Assert the round-trip budget of every route; returns the counts."""
+    recorder = recorder or metrics.current()
+    movie_id = movie_id or await find_movie_id(request)
+    counts: dict[str, int] = {}
+    failures = []
+    for route in routes:
+        log = await measure(request, route, movie_id)
+        count = counts[route.name] = int(log["roundTrips"])
+        recorder.record(f"roundtrips {route.name}", count)
+        passed = count <= route.max_round_trips
+        recorder.budgets.append({
+            "key": f"roundtrips {route.name}", "stat": "count",
+            "limit": route.max_round_trips, "measured": count, "passed": passed,
+            "calls": log.get("calls", {}),
+        })
+        if not passed:
+            failures.append(
+                f"{route.name}: {count} round trips exceeds budget {route.max_round_trips} "
+                f"({', '.join(f'{k} {v}' for k, v in log.get('calls', {}).items())})"
+            )
+    if failures:
+        raise budgets.BudgetExceeded("; ".join(failures))
+    return counts
+
+
+async def _run(role: str) -> int:
+    context = await session.new_context(role=role)
+    try:
+        counts = await check(context.request)
+    except budgets.BudgetExceeded as exc:
+        print(f"FAILED: {exc}")
+        return 1
+    finally:
+        await session.close_context(context)
+    limits = {route.name: route.max_round_trips for route in ROUTE_BUDGETS}
+    for name, count in counts.items():
+        print(f"{count:>2} / {limits[name]:<2} {name}")
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--role", default="viewer", help="role to log in as (default: viewer)")
+    args = parser.parse_args(argv)
+    try:
+        return asyncio.run(_run(args.role))
+    except RoundTripError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
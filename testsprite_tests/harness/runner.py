@@ -0,0 +1,284 @@
+"""Run the TC0xx scripts concurrently on shared browsers.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.runner                      # whole suite
+    python -m harness.runner TC003 TC006 -j 6     # a subset, 6 at a time
+    python -m harness.runner --browsers 2         # spread over two Chromiums
+
+Each script's ``run_test`` coroutine is imported and awaited with a warm
+:class:`~harness.pool.BrowserPool` installed via
+:func:`harness.session.use_pool`, so every test still gets its own clean
+``BrowserContext`` but none of them pays for a browser launch.
+After a test body passes, the budgets declared for it in the test plan and
+the Core Web Vitals budgets of the routes it loaded (:mod:`harness.vitals`)
+are checked.  Results, including each test's latency histograms and budget
+outcomes, are merged into ``tmp/test_results.json``.
+
+With ``--seed-scale`` a deterministic catalog (:mod:`harness.seed`) is loaded
+before the suite and removed afterwards, and the role logins switch to the
+seeded accounts.  ``--reseed`` additionally restores it before every test.
+
+``--shard i/N`` runs only this process's share of the selected tests and
+writes them to ``tmp/shards/`` for :mod:`harness.shard` to merge.
+
+A failing test leaves a trace, HAR and screenshots of its last steps in
+``tmp/captures/<TC id>/`` (:mod:`harness.capture`); passing tests write
+nothing.
+
+``--changed-since REF`` runs only the tests the git diff against ``REF``
+can affect (see :mod:`harness.impact`).
+
+``--local-reset`` runs against a local stack (:mod:`harness.localstack`)
+and clones its database from the template before every test.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib.util
+import json
+import sys
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Awaitable, Callable, Sequence
+
+from playwright import async_api
+
+from . import budgets, capture, impact, localstack, metrics, seed, shard, vitals
+from .config import TESTS_DIR
+from .pool import DEFAULT_MAX_HEAP_MB, DEFAULT_MAX_USES, BrowserPool
+from .results import make_result, write_results
+from .session import use_pool
+
+DEFAULT_CONCURRENCY = 4
+
+
+@dataclass(frozen=True)
+class TestCase:
+    test_id: str
+    path: Path
+
+    def load(self) -> Callable[[], Awaitable[None]]:
+        """Import the script and return its ``run_test`` coroutine function."""
+        spec = importlib.util.spec_from_file_location(self.path.stem, self.path)
+        module: ModuleType = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.run_test
+
+
+def discover(test_ids: Sequence[str] = ()) -> list[TestCase]:
+    """Return the TC scripts in id order, optionally limited to ``test_ids``."""
+    wanted = {test_id.upper() for test_id in test_ids}
+    cases = []
+    for path in sorted(TESTS_DIR.glob("TC[0-9][0-9][0-9]_*.py")):
+        test_id = path.stem.split("_", 1)[0]
+        if not wanted or test_id in wanted:
+            cases.append(TestCase(test_id, path))
+    return cases
+
+
+async def _run_case(
+    case: TestCase,
+    pool: BrowserPool,
+    limit: asyncio.Semaphore,
+    reset: Callable[[], Any] | None = None,
+    capture_steps: int = capture.DEFAULT_STEPS,
+) -> dict[str, Any]:
+    async with limit:
+        if reset is not None:
+            await asyncio.to_thread(reset)
+        recorder = metrics.start()
+        buffer = capture.start(case.test_id, capture_steps) if capture_steps else None
+        started = time.perf_counter()
+        error = ""
+        artifacts = None
+        with use_pool(pool):
+            try:
+                await case.load()()
+                budgets.check_plan(case.test_id, recorder)
+                vitals.check_routes(recorder)
+            except Exception as exc:  # noqa: BLE001 - every failure is a result
+                error = str(exc) or type(exc).__name__
+            if buffer is not None:
+                artifacts = await buffer.finish(failed=bool(error))
+        duration_ms = round((time.perf_counter() - started) * 1000)
+        status = "FAILED" if error else "PASSED"
+        print(f"{case.test_id} {status} in {duration_ms} ms", flush=True)
+        return make_result(
+            case.test_id, error, durationMs=duration_ms, metrics=recorder.summary(),
+            # Cleared on a pass so the merged entry never points at stale artifacts.
+            capture=str(artifacts.relative_to(TESTS_DIR)) if artifacts else None,
+        )
+
+
+async def run_suite(
+    cases: Sequence[TestCase],
+    concurrency: int = DEFAULT_CONCURRENCY,
+    browsers: int = 1,
+    max_uses: int = DEFAULT_MAX_USES,
+    max_heap_mb: float = DEFAULT_MAX_HEAP_MB,
+    reset: Callable[[], Any] | None = None,
+    capture_steps: int = capture.DEFAULT_STEPS,
+) -> list[dict[str, Any]]:
+    """Run ``cases`` at most ``concurrency`` at a time over ``browsers`` Chromiums.
+
+    ``reset``, if given, is called in a worker thread before each test.
+    ``capture_steps`` sizes each test's failure capture; 0 turns it off.
+    """
+    limit = asyncio.Semaphore(max(1, concurrency))
+    async with async_api.async_playwright() as pw:
+        async with BrowserPool(
+            pw, browsers, max_uses=max_uses, max_heap_mb=max_heap_mb
+        ) as pool:
+            return list(
+                await asyncio.gather(
+                    *(_run_case(case, pool, limit, reset, capture_steps) for case in cases)
+                )
+            )
+
+
+def _write(results: list[dict[str, Any]], shard_file: Path | None) -> None:
+    """Merge into ``tmp/test_results.json``, or replace this shard's file."""
+    if shard_file is None:
+        write_results(results)
+        return
+    shard_file.parent.mkdir(parents=True, exist_ok=True)
+    shard_file.write_text(
+        json.dumps(results, indent=2, ensure_ascii=False) + "\n", encoding="utf-8"
+    )
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("test_ids", nargs="*", help="TC ids to run (default: all)")
+    parser.add_argument(
+        "-j", "--concurrency", type=int, default=DEFAULT_CONCURRENCY,
+        help=f"tests running at once (default: {DEFAULT_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--browsers", type=int, default=1, help="shared browsers to launch (default: 1)"
+    )
+    parser.add_argument(
+        "--max-uses", type=int, default=DEFAULT_MAX_USES,
+        help=f"recycle a browser after this many tests (default: {DEFAULT_MAX_USES})",
+    )
+    parser.add_argument(
+        "--max-heap-mb", type=float, default=DEFAULT_MAX_HEAP_MB,
+        help=f"recycle a browser when a page's JS heap exceeds this (default: {DEFAULT_MAX_HEAP_MB})",
+    )
+    parser.add_argument(
+        "--no-write", action="store_true", help="do not update tmp/test_results.json"
+    )
+    parser.add_argument(
+        "--capture-steps", type=int, default=capture.DEFAULT_STEPS,
+        help="steps kept for failure artifacts, 0 to disable "
+             f"(default: {capture.DEFAULT_STEPS}, see harness.capture)",
+    )
+    parser.add_argument(
+        "--changed-since", metavar="REF",
+        help="run only the tests affected by changes since git REF (see harness.impact)",
+    )
+    parser.add_argument(
+        "--shard", metavar="I/N", help="run shard I of N (duration-balanced, see harness.shard)"
+    )
+    parser.add_argument(
+        "--seed-scale", type=float,
+        help="load a seeded catalog of this scale for the run (see harness.seed)",
+    )
+    parser.add_argument(
+        "--seed", type=int, default=seed.DEFAULT_SEED, help="catalog seed for --seed-scale"
+    )
+    parser.add_argument(
+        "--reseed", action="store_true",
+        help="restore the seeded catalog before every test (needs -j 1)",
+    )
+    parser.add_argument(
+        "--keep-seed", action="store_true", help="leave the seeded catalog in place"
+    )
+    parser.add_argument(
+        "--local-reset", action="store_true",
+        help="clone the local stack's database before every test (needs -j 1, see harness.localstack)",
+    )
+    args = parser.parse_args(argv)
+
+    cases = discover(args.test_ids)
+    if not cases:
+        parser.error("no matching TC scripts found")
+    if args.changed_since:
+        try:
+            selection = impact.affected(args.changed_since, [case.test_id for case in cases])
+        except impact.ImpactError as exc:
+            parser.error(str(exc))
+        cases = [case for case in cases if case.test_id in selection.test_ids]
+        scope = "full run" if selection.full_run else f"{len(cases)} affected"
+        print(f"changes since {args.changed_since}: {scope}", flush=True)
+        if not cases:
+            return 0
+    shard_file = None
+    if args.shard:
+        try:
+            index, count = shard.parse(args.shard)
+        except ValueError as exc:
+            parser.error(str(exc))
+        cases = shard.select(cases, index, count, key=lambda case: case.test_id)
+        shard_file = shard.shard_path(index, count)
+        print(f"shard {index}/{count}: {' '.join(case.test_id for case in cases) or '(empty)'}",
+              flush=True)
+        if not cases:
+            if not args.no_write:
+                _write([], shard_file)
+            return 0
+    if args.reseed and args.seed_scale is None:
+        parser.error("--reseed needs --seed-scale")
+    if args.reseed and args.concurrency != 1:
+        parser.error("--reseed restores shared data and needs -j 1")
+    if args.local_reset and args.concurrency != 1:
+        parser.error("--local-reset replaces shared data and needs -j 1")
+    if args.local_reset and args.seed_scale is not None:
+        parser.error("--local-reset replaces the database; seed the template with "
+                     "harness.localstack up --seed-scale instead")
+
+    catalog = None
+    reset = None
+    if args.seed_scale is not None:
+        catalog = seed.build(args.seed_scale, args.seed)
+        elapsed = seed.load(catalog)
+        print(f"seeded {sum(catalog.counts().values())} rows in {elapsed:.2f} s", flush=True)
+        seed.use_role_accounts()
+        if args.reseed:
+            reset = lambda: seed.reset(catalog)  # noqa: E731
+    if args.local_reset:
+        try:
+            state = localstack.read_state()
+        except localstack.LocalStackError as exc:
+            parser.error(str(exc))
+        if state["seeded"]:
+            seed.use_role_accounts()
+        reset = lambda: localstack.reset(state)  # noqa: E731
+
+    started = time.perf_counter()
+    try:
+        results = asyncio.run(
+            run_suite(
+                cases, args.concurrency, args.browsers, args.max_uses, args.max_heap_mb,
+                reset, args.capture_steps,
+            )
+        )
+    finally:
+        if catalog is not None and not args.keep_seed:
+            seed.teardown(catalog)
+    elapsed = time.perf_counter() - started
+
+    if not args.no_write:
+        _write(results, shard_file)
+    failed = sum(result["testStatus"] == "FAILED" for result in results)
+    print(f"{len(results) - failed} passed, {failed} failed in {elapsed:.1f} s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
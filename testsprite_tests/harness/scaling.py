@@ -0,0 +1,211 @@
+"""Listing cost as the catalog grows: response bytes and TTFB per size.
+
+``/browse``, the watchlist and ``/admin/users`` used to load whole tables,
+so each page cost grew with its table.  They now read one keyset page at a
+time (``src/lib/pagination.ts``, migration 014).  This test checks that a
+page costs the same at 100 movies as at 100k.
+
+For each size in ``sizes``, :func:`run` pads the catalog with approved
+movies owned by the seeded producer (:func:`seed.pad_approved`), and puts
+every approved movie on the seeded viewer's watchlist.  It then loads every target
+in :data:`TARGETS` ``repeat`` times as the viewer and records, from the
+browser's navigation timing:
+
+* the time to first byte (``responseStart - requestStart``);
+* the decoded body size.
+
+``deep`` targets first follow ``nextCursor`` for :data:`DEEP_PAGES` pages,
+so they time a page far into the listing.  :func:`flat` compares the
+largest size with the smallest.  A target fails when its body grew by
+more than ``max_bytes_growth`` or its median TTFB by more than
+``max_ttfb_growth`` (plus ``slack_ms``, for noise on fast responses).  The
+padding is deleted afterwards.  Needs ``psycopg`` (:func:`seed.connect`)
+and a loaded seed catalog.  Sizes below the catalog's current size are
+measured at the current size.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.scaling                          # 100 .. 100k movies
+    python -m harness.scaling --size 100 --size 10000 --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from dataclasses import dataclass
+from typing import Any, Sequence
+
+from playwright import async_api
+
+from . import seed, session
+from .config import base_url
+from .metrics import Histogram
+
+SIZES = (100, 1_000, 10_000, 100_000)
+
+# Page 3 is still a full page at the smallest size (24 per page)
+DEEP_PAGES = 2
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    path: str
+    # Follow nextCursor for DEEP_PAGES pages first (JSON listings only)
+    deep: bool = False
+
+
+TARGETS: tuple[Target, ...] = (
+    Target("/browse", "/browse"),
+    Target("/api/movies newest", "/api/movies?sort=newest"),
+    Target("/api/movies popular", "/api/movies?sort=popular"),
+    Target("/api/movies newest, deep", "/api/movies?sort=newest", deep=True),
+    Target("/api/watchlist", "/api/watchlist"),
+    Target("/api/watchlist, deep", "/api/watchlist", deep=True),
+)
+
+_TIMING = (
+    "() => { const [n] = performance.getEntriesByType('navigation');"
+    " return { ttfb: n.responseStart - n.requestStart, bytes: n.decodedBodySize }; }"
+)
+
+
+def _fill_watchlist(connection, user_id: uuid.UUID) -> list[uuid.UUID]:
+    """Add every approved movie to ``user_id``'s watchlist; returns the new row ids."""
+    with connection.transaction():
+        rows = connection.execute(
+            "INSERT INTO watchlist (user_id, movie_id) "
+            "SELECT %s, id FROM movies WHERE status = 'approved' "
+            "ON CONFLICT (user_id, movie_id) DO NOTHING RETURNING id",
+            (user_id,),
+        ).fetchall()
+        connection.execute("ANALYZE watchlist")
+    return [row[0] for row in rows]
+
+
+async def _deep_url(request: async_api.APIRequestContext, path: str) -> str:
+    """URL of the page DEEP_PAGES pages into ``path`` (or its last page)."""
+    url = base_url() + path
+    separator = "&" if "?" in url else "?"
+    cursor = None
+    for _ in range(DEEP_PAGES):
+        response = await request.get(url + (f"{separator}cursor={cursor}" if cursor else ""))
+        payload = await response.json()
+        if not payload.get("nextCursor"):
+            break
+        cursor = payload["nextCursor"]
+    return url + (f"{separator}cursor={cursor}" if cursor else "")
+
+
+async def _measure(targets: Sequence[Target], repeat: int) -> dict[str, dict[str, Any]]:
+    context = await session.new_context(role="viewer")
+    results: dict[str, dict[str, Any]] = {}
+    try:
+        page = await context.new_page()
+        for target in targets:
+            url = await _deep_url(context.request, target.path) if target.deep else base_url() + target.path
+            ttfb = Histogram()
+            size = 0
+            # One untimed load, so route compilation does not count.
+            for attempt in range(repeat + 1):
+                response = await page.goto(url, wait_until="load")
+                if response is None or not response.ok:
+                    raise seed.SeedError(f"{target.name}: could not load {url}")
+                timing = await page.evaluate(_TIMING)
+                if attempt:
+                    ttfb.record(timing["ttfb"])
+                    size = timing["bytes"]
+            results[target.name] = {"ttfb_p50_ms": round(ttfb.percentile(50), 1), "bytes": size}
+    finally:
+        await session.close_context(context)
+    return results
+
+
+def run(
+    sizes: Sequence[int] = SIZES,
+    repeat: int = 5,
+    targets: Sequence[Target] = TARGETS,
+    dsn: str | None = None,
+) -> list[dict[str, Any]]:
+    """Measure every target at each catalog size; see the module doc."""
+    results: list[dict[str, Any]] = []
+    added: list[uuid.UUID] = []
+    watchlist: list[uuid.UUID] = []
+    with seed.connect(dsn) as connection:
+        connection.autocommit = True
+        producer_id = seed.profile_id(connection, seed.role_email("producer"))
+        viewer_id = seed.profile_id(connection, seed.role_email("viewer"))
+        try:
+            for size in sorted(sizes):
+                started = time.perf_counter()
+                added.extend(seed.pad_approved(connection, producer_id, size, len(added)))
+                elapsed = time.perf_counter() - started
+                watchlist.extend(_fill_watchlist(connection, viewer_id))
+                results.append({
+                    "movies": seed.approved_movies(connection),
+                    "padSeconds": round(elapsed, 1),
+                    "targets": asyncio.run(_measure(targets, repeat)),
+                })
+        finally:
+            with connection.transaction():
+                connection.execute("DELETE FROM watchlist WHERE id = ANY(%s)", (watchlist,))
+            if added:
+                seed.delete_movies(connection, added)
+    return results
+
+
+def flat(
+    results: Sequence[dict[str, Any]],
+    max_bytes_growth: float = 1.1,
+    max_ttfb_growth: float = 1.5,
+    slack_ms: float = 20.0,
+) -> list[str]:
+    """Targets whose cost grew from the smallest to the largest size."""
+    if len(results) < 2:
+        return []
+    smallest, largest = results[0]["targets"], results[-1]["targets"]
+    grown = []
+    for name, small in smallest.items():
+        large = largest[name]
+        if large["bytes"] > small["bytes"] * max_bytes_growth:
+            grown.append(f"{name}: {small['bytes']} -> {large['bytes']} bytes")
+        if large["ttfb_p50_ms"] > small["ttfb_p50_ms"] * max_ttfb_growth + slack_ms:
+            grown.append(f"{name}: TTFB {small['ttfb_p50_ms']} -> {large['ttfb_p50_ms']} ms")
+    return grown
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", help="Postgres DSN (default: MAFILU_DATABASE_URL or config)")
+    parser.add_argument(
+        "--size", type=int, action="append",
+        help="approved movies (repeatable; default: 100, 1000, 10000, 100000)",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="loads per target and size")
+    parser.add_argument("--max-bytes-growth", type=float, default=1.1)
+    parser.add_argument("--max-ttfb-growth", type=float, default=1.5)
+    parser.add_argument("--slack-ms", type=float, default=20.0)
+    args = parser.parse_args(argv)
+
+    try:
+        results = run(args.size or SIZES, args.repeat, dsn=args.dsn)
+    except seed.SeedError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    for result in results:
+        print(f"{result['movies']} movies (padded in {result['padSeconds']} s)")
+        for name, item in result["targets"].items():
+            print(f"  {name:<26} TTFB p50 {item['ttfb_p50_ms']:>7} ms  {item['bytes']:>9} bytes")
+    grown = flat(results, args.max_bytes_growth, args.max_ttfb_growth, args.slack_ms)
+    for line in grown:
+        print(f"FAILED: {line}")
+    return 1 if grown else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,158 @@
+"""Per-keystroke latency of ``/api/search`` at growing catalog sizes.
+
+``/browse`` used to load every movie and filter titles in the browser, so
+searching slowed down as the catalog grew.  Migration 013 adds generated
+full-text and trigram columns with GIN indexes and ``search_movies``.
+``/api/search`` serves that to the debounced hook in ``browse-client.tsx``.
+Keystroke latency is what viewers notice, so the benchmark measures it.
+
+For each size in ``sizes`` (default 1k, 10k and 100k approved movies),
+:func:`bench` pads the catalog with approved movies owned by the seeded
+producer (:func:`seed.pad_approved`).  It then types each of
+:data:`QUERIES` one letter at a time.  Every prefix the hook would send
+(two characters or more) becomes one ``GET /api/search``, sent one after
+another as a single viewer would.  The report gives latency percentiles
+per size and the prefixes that found nothing.  The synthetic movies are
+deleted afterwards.  Needs ``psycopg`` (:func:`seed.connect`) and a loaded
+seed catalog.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.search                           # 1k, 10k, 100k
+    python -m harness.search --size 1000 --size 5000 --repeat 5
+    python -m harness.search --max-p99-ms 150          # exit 1 above 150 ms
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from typing import Any, Sequence
+from urllib.parse import urlencode
+
+from playwright import async_api
+
+from . import seed, session
+from .config import base_url
+from .metrics import Histogram
+
+SIZES = (1_000, 10_000, 100_000)
+
+# Mixed case, Turkish letters typed as ASCII, and a typo, as viewers type them.
+QUERIES = ("gece yolculuk", "kirmizi", "ISIK", "sessz deniz", "Rüzgar")
+
+MIN_SEARCH_LENGTH = 2
+
+
+def keystrokes(query: str) -> list[str]:
+    """The prefixes of ``query`` the browse hook sends, shortest first."""
+    return [
+        query[:end] for end in range(1, len(query) + 1)
+        if len(query[:end].strip()) >= MIN_SEARCH_LENGTH and not query[:end].endswith(" ")
+    ]
+
+
+async def type_queries(
+    request: async_api.APIRequestContext,
+    queries: Sequence[str] = QUERIES,
+    repeat: int = 3,
+    timeout_ms: int = 10_000,
+) -> dict[str, Any]:
+    """Send every keystroke of ``queries`` ``repeat`` times; returns the summary."""
+    latency = Histogram()
+    errors = 0
+    empty: set[str] = set()
+    for _ in range(repeat):
+        for query in queries:
+            for prefix in keystrokes(query):
+                url = f"{base_url()}/api/search?{urlencode({'q': prefix})}"
+                sent = time.perf_counter()
+                try:
+                    response = await request.get(url, timeout=timeout_ms)
+                    payload = await response.json() if response.ok else {}
+                except async_api.Error:
+                    response, payload = None, {}
+                latency.record((time.perf_counter() - sent) * 1000)
+                if response is None or not response.ok:
+                    errors += 1
+                elif not payload.get("movies"):
+                    empty.add(prefix)
+    return {**latency.summary(), "errors": errors, "empty": sorted(empty)}
+
+
+async def _measure(repeat: int) -> dict[str, Any]:
+    context = await session.new_context()
+    try:
+        # One untimed pass, so route compilation and cold pools do not count.
+        await type_queries(context.request, QUERIES[:1], 1)
+        return await type_queries(context.request, QUERIES, repeat)
+    finally:
+        await session.close_context(context)
+
+
+def bench(
+    sizes: Sequence[int] = SIZES,
+    repeat: int = 3,
+    email: str | None = None,
+    dsn: str | None = None,
+) -> list[dict[str, Any]]:
+    """Measure keystroke latency at each catalog size; see the module doc."""
+    results: list[dict[str, Any]] = []
+    added: list[uuid.UUID] = []
+    with seed.connect(dsn) as connection:
+        connection.autocommit = True
+        producer_id = seed.profile_id(connection, email or seed.role_email("producer"))
+        try:
+            for size in sorted(sizes):
+                started = time.perf_counter()
+                added.extend(seed.pad_approved(connection, producer_id, size, len(added)))
+                elapsed = time.perf_counter() - started
+                result = {"movies": seed.approved_movies(connection), "padSeconds": round(elapsed, 1)}
+                result.update(asyncio.run(_measure(repeat)))
+                results.append(result)
+        finally:
+            if added:
+                seed.delete_movies(connection, added)
+    return results
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dsn", help="Postgres DSN (default: MAFILU_DATABASE_URL or config)")
+    parser.add_argument(
+        "--size", type=int, action="append",
+        help="approved movies to search (repeatable; default: 1000, 10000, 100000)",
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="times each query is typed")
+    parser.add_argument("--producer-email", help="owner of the padding (default: seeded producer)")
+    parser.add_argument("--max-p99-ms", type=float, help="fail when any size's p99 is above this")
+    args = parser.parse_args(argv)
+
+    try:
+        results = bench(args.size or SIZES, args.repeat, args.producer_email, args.dsn)
+    except seed.SeedError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+    failed = False
+    for result in results:
+        print(
+            f"{result['movies']:>7} movies  p50 {result['p50_ms']:>7} ms  "
+            f"p99 {result['p99_ms']:>7} ms  max {result['max_ms']:>7} ms  "
+            f"errors {result['errors']}  (padded in {result['padSeconds']} s)"
+        )
+        if result["empty"]:
+            print(f"        no hits for: {', '.join(result['empty'])}")
+        if result["errors"] or (args.max_p99_ms is not None and result["p99_ms"] > args.max_p99_ms):
+            failed = True
+    if failed:
+        print("FAILED: search errors or p99 above the limit")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,602 @@
+"""Deterministic test data for the Supabase database.
+
+TC005-TC007 failed with "no published movies available" because nothing put
+a catalog in the database except the hand-run scripts in ``scripts/``.
+:func:`build` generates one from a seed and a scale factor: users of every
+role (``auth.users`` + ``profiles``), approved and in-flight movies across
+all genres, subscriptions, views, likes (``movie_reviews`` with rating 5,
+as ``/api/like`` stores them), comments and watchlists.  At scale 1 that is
+about three thousand rows; scale 100 is about three hundred thousand.
+
+:func:`load` streams every table with ``COPY`` inside a single transaction,
+so a run either sees the whole catalog or none of it.  Row ids are UUIDv5s of
+``(seed, kind, index)`` and all timestamps lie before the day the catalog was
+built, which makes :func:`teardown` a single cascading delete of the seeded
+users and :func:`reset` (teardown + load, one transaction) a cheap way to
+roll back whatever a test changed.
+
+The seeded role accounts are ``seed-<role>-00000@mafilu.test`` with
+``SEED_PASSWORD``; :func:`use_role_accounts` points :mod:`harness.auth` at
+them.  Needs ``psycopg`` (3.x) and a DSN from :func:`config.database_url`.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.seed --scale 10          # load
+    python -m harness.seed --reset             # roll back to the seeded state
+    python -m harness.seed --teardown          # remove everything seeded
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import random
+import sys
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator, Sequence
+
+from .config import database_url
+
+DEFAULT_SEED = 20240101
+
+SEED_PASSWORD = "mafilu-seed-password"
+
+EMAIL_DOMAIN = "mafilu.test"
+
+_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "https://mafilu.test/seed")
+
+# Rows per kind at scale 1.  Admins do not scale.
+BASE_COUNTS = {
+    "producer": 4,
+    "viewer": 80,
+    "movie": 40,
+    "view": 2000,
+    "review": 400,
+    "comment": 300,
+    "watchlist": 200,
+}
+
+ADMINS = 1
+
+GENRES = (
+    "drama", "comedy", "thriller", "documentary", "horror",
+    "sci_fi", "romance", "animation", "experimental", "short_film",
+)
+
+FEATURED = 6
+
+_TITLE_WORDS = (
+    "Kayıp", "Şehir", "Gece", "Yolculuk", "Sessiz", "Deniz", "Işık", "Gölge",
+    "Son", "Bahar", "Rüzgar", "Ev", "Sınır", "Yıldız", "Kırmızı", "Zaman",
+)
+
+_COMMENTS = (
+    "Harika bir film, kesinlikle tavsiye ederim.",
+    "Görüntü yönetmenliği çok başarılı.",
+    "Sonu biraz aceleye gelmiş ama yine de güzeldi.",
+    "Oyunculuklar çok doğal.",
+    "Müzikleri hâlâ aklımda.",
+    "İkinci kez izledim, yine etkilendim.",
+)
+
+_TAGS = ("bağımsız", "ödüllü", "festival", "ilk film", "kısa", "yerli", "gerilim", "aile")
+
+
+class SeedError(RuntimeError):
+    """Raised when the catalog cannot be written to the database."""
+
+
+@dataclass
+class Table:
+    name: str
+    columns: tuple[str, ...]
+    rows: list[tuple[Any, ...]] = field(default_factory=list)
+
+
+@dataclass
+class Catalog:
+    seed: int
+    scale: float
+    anchor: datetime
+    users: Table
+    identities: Table
+    profiles: Table
+    movies: Table
+    subscriptions: Table
+    views: Table
+    reviews: Table
+    comments: Table
+    watchlist: Table
+
+    @property
+    def user_ids(self) -> list[uuid.UUID]:
+        return [row[1] for row in self.users.rows]
+
+    @property
+    def movie_ids(self) -> list[uuid.UUID]:
+        return [row[0] for row in self.movies.rows]
+
+    @property
+    def approved_movie_ids(self) -> list[uuid.UUID]:
+        status = self.movies.columns.index("status")
+        return [row[0] for row in self.movies.rows if row[status] == "approved"]
+
+    def tables(self) -> list[Table]:
+        """Tables in load order (parents before children)."""
+        return [
+            self.users, self.identities, self.profiles, self.movies,
+            self.subscriptions, self.views, self.reviews, self.comments,
+            self.watchlist,
+        ]
+
+    def counts(self) -> dict[str, int]:
+        return {table.name: len(table.rows) for table in self.tables()}
+
+
+def role_email(role: str, index: int = 0) -> str:
+    return f"seed-{role}-{index:05d}@{EMAIL_DOMAIN}"
+
+
+def _id(seed: int, kind: str, index: int) -> uuid.UUID:
+    return uuid.uuid5(_NAMESPACE, f"{seed}:{kind}:{index}")
+
+
+def _count(kind: str, scale: float) -> int:
+    return max(1, round(BASE_COUNTS[kind] * scale))
+
+
+def _pairs(rng: random.Random, k: int, users: int, movies: int) -> list[tuple[int, int]]:
+    """``k`` distinct (user, movie) index pairs."""
+    k = min(k, users * movies)
+    return [divmod(n, movies) for n in sorted(rng.sample(range(users * movies), k))]
+
+
+def _before(rng: random.Random, anchor: datetime, days: int) -> datetime:
+    return anchor - timedelta(seconds=rng.randrange(1, days * 86400))
+
+
+def build(
+    scale: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    anchor: datetime | None = None,
+    video_id: str | None = None,
+) -> Catalog:
+    """Generate the catalog for ``seed`` at ``scale``.
+
+    ``anchor`` (default: today's midnight UTC) is the upper bound of every
+    generated timestamp.  ``video_id`` is set as the Bunny video of the first
+    featured movie so playback tests have something to stream.
+    """
+    if scale <= 0:
+        raise ValueError("scale must be positive")
+    if anchor is None:
+        anchor = datetime.now(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def rng(kind: str) -> random.Random:
+        return random.Random(f"{seed}:{kind}")
+
+    # Users of every role; index 0 of each role is the login account.
+    accounts: list[tuple[uuid.UUID, str, str, str]] = []
+    for role, count in (
+        ("admin", ADMINS),
+        ("producer", _count("producer", scale)),
+        ("viewer", _count("viewer", scale)),
+    ):
+        for index in range(count):
+            name = "Seed Admin" if role == "admin" else f"Seed {role.title()} {index}"
+            accounts.append((_id(seed, role, index), role, role_email(role, index), name))
+    producers = [account[0] for account in accounts if account[1] == "producer"]
+    viewers = [account[0] for account in accounts if account[1] == "viewer"]
+    admin = accounts[0][0]
+
+    user_rng = rng("user")
+    users = Table("auth.users", (
+        "instance_id", "id", "aud", "role", "email", "encrypted_password",
+        "email_confirmed_at", "raw_app_meta_data", "raw_user_meta_data",
+        "created_at", "updated_at", "confirmation_token", "recovery_token",
+        "email_change_token_new", "email_change",
+    ))
+    identities = Table("auth.identities", (
+        "id", "user_id", "provider_id", "identity_data", "provider",
+        "last_sign_in_at", "created_at", "updated_at",
+    ))
+    profiles = Table("profiles", (
+        "id", "email", "full_name", "role", "producer_profile", "created_at", "updated_at",
+    ))
+    for user_id, role, email, name in accounts:
+        created = _before(user_rng, anchor, 730)
+        users.rows.append((
+            uuid.UUID(int=0), user_id, "authenticated", "authenticated", email,
+            None,  # filled in by load() with one bcrypt hash of SEED_PASSWORD
+            created, {"provider": "email", "providers": ["email"]},
+            {"full_name": name}, created, created, "", "", "", "",
+        ))
+        identities.rows.append((
+            user_id, user_id, str(user_id), {"sub": str(user_id), "email": email},
+            "email", created, created, created,
+        ))
+        producer_profile = (
+            {"bio": f"{name} bağımsız filmler üretir.", "website": f"https://{EMAIL_DOMAIN}"}
+            if role == "producer" else None
+        )
+        profiles.rows.append((user_id, email, name, role, producer_profile, created, created))
+
+    movie_rng = rng("movie")
+    movies = Table("movies", (
+        "id", "producer_id", "title", "description", "genre", "duration_seconds",
+        "release_year", "bunny_video_id", "status", "submitted_at", "reviewed_at",
+        "reviewed_by", "rejection_reason", "tags", "featured", "featured_order",
+        "created_at", "updated_at",
+    ))
+    approved: list[int] = []
+    for index in range(_count("movie", scale)):
+        slot = index % 20
+        status = (
+            "approved" if slot % 10 < 8
+            else "pending_review" if slot == 8 or slot == 18
+            else "rejected" if slot == 19
+            else "draft"
+        )
+        created = _before(movie_rng, anchor, 365)
+        title = " ".join(movie_rng.sample(_TITLE_WORDS, 2)) + f" {index + 1}"
+        reviewed = status in ("approved", "rejected")
+        featured = status == "approved" and len(approved) < FEATURED
+        movies.rows.append((
+            _id(seed, "movie", index),
+            producers[index % len(producers)],
+            title,
+            f"{title} için örnek açıklama.",
+            GENRES[index % len(GENRES)],
+            movie_rng.randrange(300, 7200),
+            movie_rng.randrange(1990, anchor.year + 1),
+            video_id if featured and not approved else None,
+            status,
+            created if status != "draft" else None,
+            created + timedelta(hours=6) if reviewed else None,
+            admin if reviewed else None,
+            "Ses kalitesi yetersiz." if status == "rejected" else None,
+            movie_rng.sample(_TAGS, 2),
+            featured,
+            len(approved) + 1 if featured else None,
+            created,
+            created,
+        ))
+        if status == "approved":
+            approved.append(index)
+    approved_ids = [movies.rows[index][0] for index in approved]
+
+    sub_rng = rng("subscription")
+    subscriptions = Table("subscriptions", (
+        "id", "user_id", "plan_type", "status", "current_period_start",
+        "current_period_end", "created_at", "updated_at",
+    ))
+    for index, user_id in enumerate(viewers):
+        if index == 0 or sub_rng.random() >= 0.3:
+            continue  # the viewer login account stays on the free plan
+        start = _before(sub_rng, anchor, 30)
+        subscriptions.rows.append((
+            _id(seed, "subscription", index), user_id,
+            sub_rng.choice(("basic", "premium")), "active",
+            start, start + timedelta(days=30), start, start,
+        ))
+
+    view_rng = rng("view")
+    views = Table("movie_views", (
+        "id", "movie_id", "user_id", "watch_duration_seconds", "completed", "viewed_at",
+    ))
+    duration = movies.columns.index("duration_seconds")
+    for n, (user, movie) in enumerate(
+        _pairs(view_rng, _count("view", scale), len(viewers), len(approved))
+    ):
+        length = movies.rows[approved[movie]][duration]
+        watched = view_rng.randrange(0, length)
+        views.rows.append((
+            _id(seed, "view", n), approved_ids[movie], viewers[user],
+            watched, watched >= length * 0.9, _before(view_rng, anchor, 90),
+        ))
+
+    review_rng = rng("review")
+    reviews = Table("movie_reviews", (
+        "id", "movie_id", "user_id", "rating", "review_text", "created_at", "updated_at",
+    ))
+    for n, (user, movie) in enumerate(
+        _pairs(review_rng, _count("review", scale), len(viewers), len(approved))
+    ):
+        rating = 5 if review_rng.random() < 0.6 else review_rng.randrange(1, 5)
+        created = _before(review_rng, anchor, 90)
+        reviews.rows.append((
+            _id(seed, "review", n), approved_ids[movie], viewers[user],
+            rating, None, created, created,
+        ))
+
+    comment_rng = rng("comment")
+    comments = Table("movie_comments", (
+        "id", "movie_id", "user_id", "content", "created_at", "updated_at",
+    ))
+    for n in range(_count("comment", scale)):
+        created = _before(comment_rng, anchor, 90)
+        comments.rows.append((
+            _id(seed, "comment", n), comment_rng.choice(approved_ids),
+            comment_rng.choice(viewers), comment_rng.choice(_COMMENTS), created, created,
+        ))
+
+    watch_rng = rng("watchlist")
+    watchlist = Table("watchlist", ("id", "user_id", "movie_id", "added_at"))
+    for n, (user, movie) in enumerate(
+        _pairs(watch_rng, _count("watchlist", scale), len(viewers), len(approved))
+    ):
+        watchlist.rows.append((
+            _id(seed, "watchlist", n), viewers[user], approved_ids[movie],
+            _before(watch_rng, anchor, 90),
+        ))
+
+    return Catalog(
+        seed, scale, anchor, users, identities, profiles, movies,
+        subscriptions, views, reviews, comments, watchlist,
+    )
+
+
+def connect(dsn: str | None = None):
+    """Open a psycopg connection to ``dsn`` (default: :func:`database_url`)."""
+    try:
+        import psycopg
+    except ImportError:
+        raise SeedError("seeding needs psycopg: pip install 'psycopg[binary]'") from None
+    return psycopg.connect(dsn or database_url())
+
+
+def _copy(cursor, table: Table, target: str | None = None) -> None:
+    from psycopg.types.json import Jsonb
+
+    columns = ", ".join(table.columns)
+    with cursor.copy(f"COPY {target or table.name} ({columns}) FROM STDIN") as copy:
+        for row in table.rows:
+            copy.write_row([Jsonb(value) if isinstance(value, dict) else value for value in row])
+
+
+def _delete(cursor, catalog: Catalog) -> None:
+    user_ids = catalog.user_ids
+    # movies.reviewed_by has no ON DELETE action; tests may have had the seeded
+    # admin review movies that are not part of the catalog.
+    cursor.execute(
+        "UPDATE movies SET reviewed_by = NULL WHERE reviewed_by = ANY(%s)", (user_ids,)
+    )
+    # profiles, movies, subscriptions, views, reviews, comments and watchlist
+    # rows all cascade from auth.users.  Seeded views only hit seeded movies,
+    # whose daily rollup rows cascade too, so the per-row rollup trigger is
+    # skipped.
+    cursor.execute("ALTER TABLE movie_views DISABLE TRIGGER USER")
+    cursor.execute("DELETE FROM auth.users WHERE id = ANY(%s)", (user_ids,))
+    cursor.execute("ALTER TABLE movie_views ENABLE TRIGGER USER")
+
+
+def _insert(cursor, catalog: Catalog) -> None:
+    cursor.execute("SELECT crypt(%s, gen_salt('bf'))", (SEED_PASSWORD,))
+    (password_hash,) = cursor.fetchone()
+    hashed = catalog.users.columns.index("encrypted_password")
+    users = Table(catalog.users.name, catalog.users.columns, [
+        row[:hashed] + (password_hash,) + row[hashed + 1:] for row in catalog.users.rows
+    ])
+    _copy(cursor, users)
+    _copy(cursor, catalog.identities)
+
+    # on_auth_user_created has already inserted bare viewer profiles.
+    cursor.execute(
+        "CREATE TEMP TABLE _seed_profiles (LIKE profiles INCLUDING DEFAULTS) ON COMMIT DROP"
+    )
+    _copy(cursor, catalog.profiles, "_seed_profiles")
+    columns = ", ".join(catalog.profiles.columns)
+    updates = ", ".join(
+        f"{column} = EXCLUDED.{column}" for column in catalog.profiles.columns[1:]
+    )
+    cursor.execute(
+        f"INSERT INTO profiles ({columns}) SELECT {columns} FROM _seed_profiles "
+        f"ON CONFLICT (id) DO UPDATE SET {updates}"
+    )
+
+    # Skip the per-row rating, daily rollup and updated_at triggers; the
+    # aggregates are computed once below.  Re-enabled before commit (or undone
+    # by rollback).
+    cursor.execute("ALTER TABLE movies DISABLE TRIGGER USER")
+    cursor.execute("ALTER TABLE movie_reviews DISABLE TRIGGER USER")
+    cursor.execute("ALTER TABLE movie_views DISABLE TRIGGER USER")
+    for table in (
+        catalog.movies, catalog.subscriptions, catalog.views,
+        catalog.reviews, catalog.comments, catalog.watchlist,
+    ):
+        _copy(cursor, table)
+
+    movie_ids = catalog.movie_ids
+    cursor.execute(
+        """
+        UPDATE movies m
+        SET average_rating = r.average, rating_count = r.count
+        FROM (
+            SELECT movie_id, AVG(rating)::DECIMAL(3, 2) AS average, COUNT(*) AS count
+            FROM movie_reviews WHERE movie_id = ANY(%s) GROUP BY movie_id
+        ) r
+        WHERE m.id = r.movie_id
+        """,
+        (movie_ids,),
+    )
+    # total_views and the daily rollup come with migrations 010 and 012, which
+    # older databases may not have run.
+    cursor.execute(
+        "SELECT 1 FROM information_schema.columns "
+        "WHERE table_schema = 'public' AND table_name = 'movies' AND column_name = 'total_views'"
+    )
+    if cursor.fetchone():
+        cursor.execute(
+            """
+            UPDATE movies m
+            SET total_views = v.count
+            FROM (
+                SELECT movie_id, COUNT(*) AS count
+                FROM movie_views WHERE movie_id = ANY(%s) GROUP BY movie_id
+            ) v
+            WHERE m.id = v.movie_id
+            """,
+            (movie_ids,),
+        )
+    cursor.execute("SELECT to_regproc('public.rebuild_movie_view_daily')")
+    if cursor.fetchone()[0] is not None:
+        cursor.execute("SELECT rebuild_movie_view_daily(%s)", (movie_ids,))
+    cursor.execute("ALTER TABLE movie_views ENABLE TRIGGER USER")
+    cursor.execute("ALTER TABLE movie_reviews ENABLE TRIGGER USER")
+    cursor.execute("ALTER TABLE movies ENABLE TRIGGER USER")
+
+
+def _run(catalog: Catalog, dsn: str | None, *steps) -> float:
+    started = time.perf_counter()
+    try:
+        with connect(dsn) as conn, conn.transaction(), conn.cursor() as cursor:
+            for step in steps:
+                step(cursor, catalog)
+    except SeedError:
+        raise
+    except Exception as exc:
+        raise SeedError(f"seeding failed: {exc}") from exc
+    return time.perf_counter() - started
+
+
+def load(catalog: Catalog, dsn: str | None = None) -> float:
+    """Write ``catalog`` in one transaction; returns the elapsed seconds.
+
+    Rows left over from an earlier load of the same seed are replaced.
+    """
+    return _run(catalog, dsn, _delete, _insert)
+
+
+def teardown(catalog: Catalog, dsn: str | None = None) -> float:
+    """Delete everything seeded by ``catalog`` (and whatever hangs off it)."""
+    return _run(catalog, dsn, _delete)
+
+
+# Loading already starts by deleting the previous copy, so a reset is a load.
+reset = load
+
+
+_MOVIE_WORDS = _TITLE_WORDS + ("Ayna", "Köprü", "Sokak", "Ateş", "Hayal", "Kış", "Orman", "Çocuk")
+
+
+def profile_id(connection, email: str) -> uuid.UUID:
+    """The id of the profile with ``email``, e.g. a seeded role account."""
+    row = connection.execute("SELECT id FROM profiles WHERE email = %s", (email,)).fetchone()
+    if row is None:
+        raise SeedError(f"no profile for {email}; load the seed catalog first")
+    return row[0]
+
+
+def add_movies(connection, producer_id: uuid.UUID, count: int, start: int = 0) -> list[uuid.UUID]:
+    """Insert ``count`` approved movies owned by ``producer_id``; returns their ids.
+
+    For benchmarks that need a larger catalog without the users and views a
+    larger ``scale`` brings.  Titles and descriptions are drawn from Turkish
+    words so search has something to find, and ``created_at`` is spread over
+    the past year.  ``start`` numbers the titles and seeds the generator, so
+    successive calls do not repeat each other.  ``movies`` is analyzed
+    afterwards so the planner sees the new size.
+    """
+    now = datetime.now(timezone.utc)
+    rng = random.Random(start)
+    ids = [uuid.uuid4() for _ in range(count)]
+    with connection.transaction(), connection.cursor() as cursor:
+        with cursor.copy(
+            "COPY movies (id, producer_id, title, description, genre, duration_seconds, "
+            "release_year, status, submitted_at, reviewed_at, created_at, updated_at) FROM STDIN"
+        ) as copy:
+            for index, movie_id in enumerate(ids, start):
+                title = " ".join(rng.sample(_MOVIE_WORDS, 3)) + f" {index + 1}"
+                created = now - timedelta(seconds=rng.randrange(0, 365 * 86400))
+                copy.write_row((
+                    movie_id, producer_id, title,
+                    f"{' '.join(rng.sample(_MOVIE_WORDS, 8))} üzerine bir film.",
+                    GENRES[index % len(GENRES)],
+                    rng.randrange(300, 7200), rng.randrange(1990, now.year + 1),
+                    "approved", created, created, created, created,
+                ))
+        cursor.execute("ANALYZE movies")
+    return ids
+
+
+def approved_movies(connection) -> int:
+    """Number of approved movies in the catalog."""
+    row = connection.execute("SELECT COUNT(*) FROM movies WHERE status = 'approved'").fetchone()
+    return int(row[0])
+
+
+def pad_approved(connection, producer_id: uuid.UUID, size: int, start: int = 0) -> list[uuid.UUID]:
+    """Add approved movies (:func:`add_movies`) until there are ``size``; returns the new ids.
+
+    ``start`` is passed on to :func:`add_movies`: the number of movies
+    earlier calls added.
+    """
+    missing = size - approved_movies(connection)
+    return add_movies(connection, producer_id, missing, start) if missing > 0 else []
+
+
+def delete_movies(connection, ids: Sequence[uuid.UUID]) -> None:
+    """Delete movies added by :func:`add_movies`."""
+    with connection.transaction():
+        connection.execute("DELETE FROM movies WHERE id = ANY(%s)", (list(ids),))
+
+
+def use_role_accounts() -> None:
+    """Log the harness roles in as the seeded accounts unless set explicitly."""
+    for role in ("viewer", "producer", "admin"):
+        os.environ.setdefault(f"MAFILU_{role.upper()}_EMAIL", role_email(role))
+        os.environ.setdefault(f"MAFILU_{role.upper()}_PASSWORD", SEED_PASSWORD)
+
+
+@contextmanager
+def seeded(
+    scale: float = 1.0,
+    seed: int = DEFAULT_SEED,
+    dsn: str | None = None,
+    keep: bool = False,
+    video_id: str | None = None,
+) -> Iterator[Catalog]:
+    """Load a catalog for the duration of the block, then tear it down."""
+    catalog = build(scale, seed, video_id=video_id)
+    load(catalog, dsn)
+    try:
+        yield catalog
+    finally:
+        if not keep:
+            teardown(catalog, dsn)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, default=1.0, help="size multiplier (default: 1)")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="catalog seed")
+    parser.add_argument("--dsn", help="Postgres DSN (default: MAFILU_DATABASE_URL or config)")
+    parser.add_argument("--video-id", help="Bunny video id for the first featured movie")
+    action = parser.add_mutually_exclusive_group()
+    action.add_argument("--reset", action="store_true", help="restore the seeded state")
+    action.add_argument("--teardown", action="store_true", help="delete the seeded rows")
+    args = parser.parse_args(argv)
+
+    catalog = build(args.scale, args.seed, video_id=args.video_id)
+    try:
+        if args.teardown:
+            elapsed = teardown(catalog, args.dsn)
+            print(f"removed seed {args.seed} in {elapsed:.2f} s")
+            return 0
+        elapsed = (reset if args.reset else load)(catalog, args.dsn)
+    except SeedError as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    counts = catalog.counts()
+    for name, count in counts.items():
+        print(f"{name:<16} {count:>8}")
+    print(f"loaded {sum(counts.values())} rows in {elapsed:.2f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,67 @@
+"""``Server-Timing`` headers from the app, parsed into recorder samples.
+
+In dev and test builds every API route handler (``withServerTiming`` in
+``src/lib/server-timing.ts``) and the auth middleware report where a
+request's server time went::
+
+    Server-Timing: mw-auth;dur=41.2;desc="1 call", auth;dur=38.0;desc="1 call",
+                   db;dur=52.7;desc="3 round trips", render;dur=6.1, total;dur=96.8
+
+:meth:`metrics.Recorder.attach` feeds every app response through
+:func:`record`.  Each metric becomes a sample under ``server:<metric>
+<endpoint>``, for example ``server:db POST /api/videos/[id]/progress``.  A
+metric whose ``desc`` starts with a count also records it under
+``server:<metric>.calls <endpoint>``.  The latency summary of a slow
+endpoint then shows whether the time went to middleware auth, handler
+auth, PostgREST or the handler itself.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .metrics import Recorder
+
+_METRIC = re.compile(r'\s*([^,;=\s]+)((?:\s*;\s*[^,;=\s]+\s*=\s*(?:"[^"]*"|[^,;]*))*)\s*(?:,|$)')
+_PARAM = re.compile(r';\s*([^,;=\s]+)\s*=\s*("[^"]*"|[^,;]*)')
+_COUNT = re.compile(r"^\s*(\d+)\b")
+
+
+@dataclass(frozen=True)
+class Metric:
+    name: str
+    duration_ms: float | None = None
+    description: str = ""
+
+    @property
+    def count(self) -> int | None:
+        """The leading number of ``desc`` (``"3 round trips"`` -> 3), if any."""
+        match = _COUNT.match(self.description)
+        return int(match.group(1)) if match else None
+
+
+def parse(header: str) -> list[Metric]:
+    """Parse a ``Server-Timing`` value; malformed parameters are ignored."""
+    metrics = []
+    for match in _METRIC.finditer(header):
+        if not match.group(1):
+            continue
+        params = {key.lower(): value.strip().strip('"') for key, value in _PARAM.findall(match.group(2))}
+        try:
+            duration = float(params["dur"]) if "dur" in params else None
+        except ValueError:
+            duration = None
+        metrics.append(Metric(match.group(1), duration, params.get("desc", "")))
+    return metrics
+
+
+def record(recorder: Recorder, endpoint: str, header: str) -> None:
+    """Record the metrics of one response to ``endpoint`` on ``recorder``."""
+    for metric in parse(header):
+        if metric.duration_ms is not None:
+            recorder.record(f"server:{metric.name} {endpoint}", metric.duration_ms)
+        if metric.count is not None:
+            recorder.record(f"server:{metric.name}.calls {endpoint}", metric.count)
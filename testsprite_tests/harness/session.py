@@ -0,0 +1,112 @@
+"""Browser-context provisioning for the TC0xx scripts.
+
+A test asks for a context with :func:`new_context` and hands it back with
+:func:`close_context`.  Under the runner a :class:`~harness.pool.BrowserPool`
+is installed for the current task with :func:`use_pool`, so every test gets
+an isolated, often pre-warmed ``BrowserContext`` on an already-running
+Chromium.  Run directly, a test falls back to launching its own Playwright +
+browser exactly like the generated scripts used to.
+
+While a :class:`~harness.capture.Capture` is installed, new contexts are
+traced and :func:`close_context` leaves the closing to the capture, which
+decides after the test whether the trace is worth keeping.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import TYPE_CHECKING, Any, Iterator
+
+from playwright import async_api
+
+from . import auth, capture, metrics, vitals
+from .config import BROWSER_ARGS, DEFAULT_TIMEOUT_MS
+
+if TYPE_CHECKING:
+    from .pool import BrowserPool
+
+_pool: ContextVar[BrowserPool | None] = ContextVar("harness_pool", default=None)
+
+# Contexts created without a shared browser own their Playwright driver and
+# browser; both are torn down together with the context.
+_standalone: dict[async_api.BrowserContext, tuple[async_api.Playwright, async_api.Browser]] = {}
+
+
+@contextmanager
+def use_pool(pool: BrowserPool) -> Iterator[None]:
+    """Route :func:`new_context` calls in the current task to ``pool``."""
+    token = _pool.set(pool)
+    try:
+        yield
+    finally:
+        _pool.reset(token)
+
+
+def current_pool() -> BrowserPool | None:
+    """The pool installed for the current task, if any."""
+    return _pool.get()
+
+
+async def launch_browser(pw: async_api.Playwright) -> async_api.Browser:
+    """Launch Chromium with the flags every generated test uses."""
+    return await pw.chromium.launch(headless=True, args=BROWSER_ARGS)
+
+
+async def new_context(role: str | None = None, **options: Any) -> async_api.BrowserContext:
+    """Return a fresh isolated context with the suite's default timeout.
+
+    With ``role`` the context starts out logged in as that role, using the
+    cached storage state from :mod:`harness.auth`.  Request and navigation
+    timings and Core Web Vitals are recorded by the current
+    :mod:`harness.metrics` recorder.
+    """
+    pool = _pool.get()
+    if pool is None:
+        pw = await async_api.async_playwright().start()
+        browser = await launch_browser(pw)
+        try:
+            if role is not None:
+                options.setdefault("storage_state", str(await auth.storage_state(browser, role)))
+            context = await browser.new_context(**options)
+        except BaseException:
+            await browser.close()
+            await pw.stop()
+            raise
+        _standalone[context] = (pw, browser)
+    else:
+        if role is not None:
+            options.setdefault(
+                "storage_state", str(await auth.storage_state(pool.browser(), role))
+            )
+        context = await pool.new_context(**options)
+    context.set_default_timeout(DEFAULT_TIMEOUT_MS)
+    recorder = metrics.current()
+    recorder.attach(context)
+    await vitals.install(context, recorder)
+    active = capture.current()
+    if active is not None:
+        await active.attach(context)
+    return context
+
+
+async def close_context(context: async_api.BrowserContext) -> None:
+    """Return ``context`` to the pool, or close it with its standalone browser."""
+    await vitals.uninstall(context)
+    metrics.current().detach(context)
+    active = capture.current()
+    if active is not None:
+        active.hold(context, _close)
+        return
+    await _close(context)
+
+
+async def _close(context: async_api.BrowserContext) -> None:
+    owned = _standalone.pop(context, None)
+    if owned is None:
+        await _pool.get().release(context)
+        return
+    await context.close()
+    pw, browser = owned
+    await browser.close()
+    await pw.stop()
@@ -0,0 +1,173 @@
+"""Split the suite across processes or CI nodes and merge the results.
+
+``python -m harness.runner --shard 2/4`` runs the second of four shards.
+Tests are assigned longest-first to the shard with the least total
+expected time (LPT), using each test's ``durationMs`` from the last run in
+``tmp/test_results.json``; tests that have never run count as the median of
+the known durations.  The assignment only depends on that file and the set
+of TC scripts, so every node computes the same split on its own.
+
+A shard writes its entries to ``tmp/shards/shard-<i>-of-<N>.json`` in the
+``test_results.json`` schema instead of touching the shared file, and
+``merge`` folds the shard files into ``tmp/test_results.json``.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.shard plan -n 4                 # show the split
+    python -m harness.shard run -n 4 -- -j 2          # 4 local processes, then merge
+    python -m harness.shard merge tmp/shards/*.json   # after CI nodes finish
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Mapping, Sequence, TypeVar
+
+from .config import RESULTS_PATH, TESTS_DIR, TMP_DIR
+from .results import load_results, tc_id, write_results
+
+SHARD_DIR = TMP_DIR / "shards"
+
+# Expected duration of a test when no run has recorded one yet.
+DEFAULT_DURATION_MS = 30_000
+
+T = TypeVar("T")
+
+
+def parse(spec: str) -> tuple[int, int]:
+    """Parse ``"i/N"`` (1-based) into ``(i, N)``."""
+    try:
+        index, count = (int(part) for part in spec.split("/"))
+    except ValueError:
+        raise ValueError(f"shard must look like 2/4, got {spec!r}") from None
+    if count < 1 or not 1 <= index <= count:
+        raise ValueError(f"shard {spec!r} is out of range")
+    return index, count
+
+
+def shard_path(index: int, count: int, directory: Path = SHARD_DIR) -> Path:
+    return directory / f"shard-{index}-of-{count}.json"
+
+
+def durations(results: Sequence[Mapping[str, Any]] | None = None) -> dict[str, float]:
+    """``{TC id: durationMs}`` from the previous run."""
+    if results is None:
+        results = load_results()
+    return {
+        tc_id(entry): float(entry["durationMs"])
+        for entry in results
+        if isinstance(entry.get("durationMs"), (int, float))
+    }
+
+
+def assign(
+    test_ids: Sequence[str], count: int, known: Mapping[str, float] | None = None
+) -> list[list[str]]:
+    """Split ``test_ids`` into ``count`` shards with balanced expected time."""
+    if known is None:
+        known = durations()
+    default = statistics.median(known.values()) if known else DEFAULT_DURATION_MS
+    expected = {test_id: known.get(test_id, default) for test_id in test_ids}
+    shards: list[list[str]] = [[] for _ in range(count)]
+    totals = [0.0] * count
+    for test_id in sorted(test_ids, key=lambda t: (-expected[t], t)):
+        target = min(range(count), key=lambda i: (totals[i], i))
+        shards[target].append(test_id)
+        totals[target] += expected[test_id]
+    return [sorted(shard) for shard in shards]
+
+
+def select(items: Sequence[T], index: int, count: int, key=lambda item: item) -> list[T]:
+    """The members of ``items`` that belong to shard ``index`` of ``count``."""
+    by_id = {key(item): item for item in items}
+    wanted = assign(list(by_id), count)[index - 1]
+    return [by_id[test_id] for test_id in wanted]
+
+
+def merge(paths: Sequence[Path], target: Path = RESULTS_PATH) -> list[dict[str, Any]]:
+    """Fold shard result files into ``target``; returns the merged entries."""
+    entries: dict[str, dict[str, Any]] = {}
+    for path in paths:
+        for entry in json.loads(Path(path).read_text(encoding="utf-8")):
+            key = tc_id(entry)
+            if key in entries:
+                print(f"warning: {key} appears in more than one shard; keeping {path}",
+                      file=sys.stderr)
+            entries[key] = entry
+    updates = [entries[key] for key in sorted(entries)]
+    write_results(updates, target)
+    return updates
+
+
+def _run(count: int, runner_args: Sequence[str]) -> int:
+    if "--seed-scale" in runner_args:
+        # Every shard would load and delete the same seeded rows.
+        print("seed once with python -m harness.seed before a sharded run", file=sys.stderr)
+        return 2
+    for stale in SHARD_DIR.glob(f"shard-*-of-{count}.json"):
+        stale.unlink()
+    workers = [
+        subprocess.Popen(
+            [sys.executable, "-m", "harness.runner", "--shard", f"{i}/{count}", *runner_args],
+            cwd=TESTS_DIR,
+        )
+        for i in range(1, count + 1)
+    ]
+    codes = [worker.wait() for worker in workers]
+    paths = [shard_path(i, count) for i in range(1, count + 1)]
+    present = [path for path in paths if path.exists()]
+    if present:
+        updates = merge(present)
+        failed = sum(entry["testStatus"] == "FAILED" for entry in updates)
+        print(f"merged {len(present)} shards: {len(updates) - failed} passed, {failed} failed")
+    return max(codes, default=0)
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    from .runner import discover
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    plan = commands.add_parser("plan", help="print the shard assignment")
+    plan.add_argument("-n", "--shards", type=int, required=True)
+    run = commands.add_parser("run", help="run every shard as a local process and merge")
+    run.add_argument("-n", "--shards", type=int, required=True)
+    run.add_argument("runner_args", nargs=argparse.REMAINDER,
+                     help="arguments for harness.runner (after --)")
+    combine = commands.add_parser("merge", help="merge shard files into test_results.json")
+    combine.add_argument("paths", nargs="*", type=Path,
+                         help=f"shard files (default: {SHARD_DIR.relative_to(TESTS_DIR)}/*.json)")
+    args = parser.parse_args(argv)
+
+    if args.command == "merge":
+        paths = args.paths or sorted(SHARD_DIR.glob("shard-*.json"))
+        if not paths:
+            parser.error("no shard files to merge")
+        updates = merge(paths)
+        print(f"merged {len(updates)} results from {len(paths)} files into {RESULTS_PATH}")
+        return 0
+
+    if args.shards < 1:
+        parser.error("--shards must be at least 1")
+    if args.command == "run":
+        runner_args = args.runner_args
+        if runner_args[:1] == ["--"]:
+            runner_args = runner_args[1:]
+        return _run(args.shards, runner_args)
+
+    known = durations()
+    test_ids = [case.test_id for case in discover()]
+    default = statistics.median(known.values()) if known else DEFAULT_DURATION_MS
+    for i, shard in enumerate(assign(test_ids, args.shards, known), start=1):
+        total = sum(known.get(test_id, default) for test_id in shard) / 1000
+        print(f"{i}/{args.shards}  ~{total:.0f} s  {' '.join(shard)}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,221 @@
+"""Soak test for the watch-progress write path.
+
+``POST /api/videos/[id]/progress`` is the busiest write endpoint: every
+viewer who is watching sends one.  The player coalesces its updates
+(``custom-player.tsx``): a save every 30 seconds while playing, one on
+pause, and a ``sendBeacon`` when the page is hidden.  Each save is a
+single ``save_watch_progress`` upsert on ``(user_id, movie_id)``.
+
+:func:`run_soak` simulates that traffic for ``players`` concurrent viewers.
+Each player starts at a random offset inside the sync interval, sends its
+advancing position once per interval and sometimes pauses, which sends one
+extra save.  The players spread over the featured movies and share one
+session, so many of them upsert the same rows at the same time.  The soak
+reports the achieved writes per second, the latency percentiles and the
+error rate.  Afterwards it reads each movie's progress back and checks it
+is a position that some player wrote.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.soak --players 500 --duration 120
+    python -m harness.soak --players 200 --interval 5 --max-p99-ms 500
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from playwright import async_api
+
+from . import metrics, server_timing, session
+from .config import base_url
+from .load import EndpointStats
+
+ENDPOINT = "POST /api/videos/[id]/progress"
+
+
+@dataclass(frozen=True)
+class SoakProfile:
+    players: int = 100
+    duration: float = 60.0
+    interval: float = 30.0
+    pause_rate: float = 0.05
+    timeout_ms: int = 10000
+
+
+@dataclass
+class SoakReport:
+    profile: SoakProfile
+    elapsed_s: float = 0.0
+    stats: EndpointStats = field(default_factory=EndpointStats)
+    written: dict[str, set[int]] = field(default_factory=dict)
+    mismatched: list[str] = field(default_factory=list)
+
+    @property
+    def writes_per_second(self) -> float:
+        ok = self.stats.statuses.get(200, 0)
+        return ok / self.elapsed_s if self.elapsed_s else 0.0
+
+    @property
+    def error_rate(self) -> float:
+        return self.stats.errors / self.stats.count if self.stats.count else 0.0
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "players": self.profile.players,
+            "intervalS": self.profile.interval,
+            "expectedWritesPerSecond": round(
+                self.profile.players * (1 + self.profile.pause_rate) / self.profile.interval, 1
+            ),
+            "writesPerSecond": round(self.writes_per_second, 1),
+            "errorRate": round(self.error_rate, 4),
+            "latency": self.stats.summary(),
+            "mismatchedMovies": self.mismatched,
+        }
+
+
+async def find_movie_ids(request: async_api.APIRequestContext) -> list[str]:
+    """The approved movies ``/api/movies/featured`` returns, deduplicated."""
+    response = await request.get(base_url() + "/api/movies/featured")
+    payload = await response.json()
+    ids = list(dict.fromkeys(
+        movie["id"] for movie in payload.get("trending", []) + payload.get("new", [])
+    ))
+    if not ids:
+        raise RuntimeError("no approved movies returned by /api/movies/featured")
+    return ids
+
+
+async def _save(
+    request: async_api.APIRequestContext, movie_id: str, position: int, timeout_ms: int
+) -> tuple[int, str]:
+    response = await request.post(
+        f"{base_url()}/api/videos/{movie_id}/progress",
+        data={"position": position},
+        timeout=timeout_ms,
+    )
+    await response.body()
+    return response.status, response.headers.get("server-timing", "")
+
+
+async def run_soak(
+    request: async_api.APIRequestContext,
+    profile: SoakProfile,
+    movie_ids: Sequence[str] | None = None,
+) -> SoakReport:
+    """Run ``profile.players`` simulated players and return the report.
+
+    Latencies and the server timing breakdown also go to the running test's
+    :mod:`harness.metrics` recorder, under :data:`ENDPOINT`.
+    """
+    movie_ids = list(movie_ids or await find_movie_ids(request))
+    report = SoakReport(profile, written={movie_id: set() for movie_id in movie_ids})
+    recorder = metrics.current()
+    started = time.monotonic()
+    deadline = started + profile.duration
+
+    async def save(movie_id: str, position: int) -> None:
+        sent = time.perf_counter()
+        try:
+            status, timing = await _save(request, movie_id, position, profile.timeout_ms)
+        except async_api.Error:
+            status, timing = 0, ""
+        elapsed_ms = (time.perf_counter() - sent) * 1000
+        report.stats.latency.record(elapsed_ms)
+        recorder.record(ENDPOINT, elapsed_ms)
+        if timing:
+            server_timing.record(recorder, ENDPOINT, timing)
+        report.stats.statuses[status] = report.stats.statuses.get(status, 0) + 1
+        if status == 200:
+            report.written[movie_id].add(position)
+        else:
+            report.stats.errors += 1
+
+    async def player(index: int) -> None:
+        movie_id = movie_ids[index % len(movie_ids)]
+        position = random.randint(0, 3600)
+        await asyncio.sleep(random.uniform(0, profile.interval))
+        while time.monotonic() < deadline:
+            position += int(profile.interval)
+            await save(movie_id, position)
+            if random.random() < profile.pause_rate:
+                position += random.randint(1, int(profile.interval))
+                await save(movie_id, position)
+            await asyncio.sleep(profile.interval)
+
+    await asyncio.gather(*(player(index) for index in range(profile.players)))
+    report.elapsed_s = time.monotonic() - started
+
+    # Concurrent upserts of one row may land in any order, but the row must
+    # hold one of the positions written to it, not a mix or a duplicate.
+    for movie_id, positions in report.written.items():
+        if not positions:
+            continue
+        response = await request.get(f"{base_url()}/api/videos/{movie_id}/progress")
+        stored = (await response.json()).get("position")
+        if stored not in positions:
+            report.mismatched.append(movie_id)
+    return report
+
+
+def soak_failed(report: SoakReport, max_error_rate: float, max_p99_ms: float) -> bool:
+    return (
+        report.error_rate > max_error_rate
+        or report.stats.percentile(99) > max_p99_ms
+        or bool(report.mismatched)
+    )
+
+
+async def _main(args: argparse.Namespace) -> int:
+    profile = SoakProfile(args.players, args.duration, args.interval, args.pause_rate)
+    context = await session.new_context(role=args.role)
+    try:
+        report = await run_soak(context.request, profile)
+    finally:
+        await session.close_context(context)
+
+    summary = report.summary()
+    latency = summary["latency"]
+    print(
+        f"{profile.players} players: {summary['writesPerSecond']} writes/s "
+        f"(expected {summary['expectedWritesPerSecond']}), errors {summary['errorRate']:.2%}, "
+        f"p50 {latency['p50_ms']} ms, p99 {latency['p99_ms']} ms"
+    )
+    if report.mismatched:
+        print(f"stored position not written by any player: {', '.join(report.mismatched)}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(summary, handle, indent=2)
+    return 1 if soak_failed(report, args.max_error_rate, args.max_p99_ms) else 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--players", type=int, default=SoakProfile.players, help="concurrent players")
+    parser.add_argument(
+        "--duration", type=float, default=SoakProfile.duration, help="seconds to run"
+    )
+    parser.add_argument(
+        "--interval", type=float, default=SoakProfile.interval,
+        help="seconds between a player's saves (the player's sync interval)",
+    )
+    parser.add_argument(
+        "--pause-rate", type=float, default=SoakProfile.pause_rate,
+        help="chance per interval that a player pauses and saves again",
+    )
+    parser.add_argument("--role", default="viewer", help="role whose session is reused")
+    parser.add_argument("--max-error-rate", type=float, default=0.001)
+    parser.add_argument("--max-p99-ms", type=float, default=1000.0)
+    parser.add_argument("--output", help="write the summary as JSON")
+    return asyncio.run(_main(parser.parse_args(argv)))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
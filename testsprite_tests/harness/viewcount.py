@@ -0,0 +1,195 @@
+"""Concurrency test for the buffered view counter.
+
+``POST /api/videos/[id]/view`` counts a view once per viewer (the
+``mafilu_viewer`` cookie) and movie within a 30 minute window.  It buffers
+the counts in memory and adds them to ``movies.total_views`` in batches
+(``src/lib/view-buffer.ts``).  The old read-modify-write fallback lost
+increments as soon as two requests overlapped.  This test checks that the
+new path counts exactly.
+
+:func:`run` picks ``viewers`` fresh viewer ids and sends ``repeats`` view
+POSTs for each, all concurrently.  It then flushes the buffer through
+``POST /api/debug/views`` (dev and test builds) and reads ``total_views``
+from Postgres.  The count must have grown by exactly ``viewers``.  With
+``wait_for_timer`` the test waits for the periodic flush instead of forcing
+one.  The test needs ``psycopg`` and the database the app uses
+(:func:`seed.connect`).  Nothing else should be viewing the target movie
+while it runs.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.viewcount --viewers 2000 --repeats 3
+    python -m harness.viewcount --viewers 500 --wait-for-timer
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Sequence
+
+from playwright import async_api
+
+from . import seed, session
+from .config import base_url
+from .load import find_movie_id
+from .metrics import Histogram
+
+VIEWER_COOKIE = "mafilu_viewer"
+
+
+class ViewCountError(RuntimeError):
+    """Raised when the app cannot be flushed on demand."""
+
+
+@dataclass
+class ViewCountReport:
+    viewers: int
+    requests: int = 0
+    counted: int = 0
+    errors: int = 0
+    before: int = 0
+    after: int = 0
+    elapsed_s: float = 0.0
+    latency: Histogram = field(default_factory=Histogram)
+
+    @property
+    def delta(self) -> int:
+        return self.after - self.before
+
+    @property
+    def exact(self) -> bool:
+        return self.errors == 0 and self.counted == self.viewers and self.delta == self.viewers
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            "viewers": self.viewers,
+            "requests": self.requests,
+            "requestsPerSecond": round(self.requests / self.elapsed_s, 1) if self.elapsed_s else 0.0,
+            "counted": self.counted,
+            "errors": self.errors,
+            "totalViewsDelta": self.delta,
+            "exact": self.exact,
+            "latency": self.latency.summary(),
+        }
+
+
+def total_views(movie_id: str) -> int:
+    with seed.connect() as connection:
+        row = connection.execute(
+            "SELECT COALESCE(total_views, 0) FROM movies WHERE id = %s", (movie_id,)
+        ).fetchone()
+    if row is None:
+        raise ViewCountError(f"movie {movie_id} does not exist")
+    return int(row[0])
+
+
+async def flush(request: async_api.APIRequestContext) -> dict[str, Any]:
+    response = await request.post(f"{base_url()}/api/debug/views")
+    if response.status == 404:
+        raise ViewCountError(
+            "the app cannot flush views on demand; run it in dev mode or with SERVER_TIMING=1"
+        )
+    return await response.json()
+
+
+async def run(
+    request: async_api.APIRequestContext,
+    viewers: int,
+    repeats: int = 3,
+    concurrency: int = 200,
+    movie_id: str | None = None,
+    wait_for_timer: bool = False,
+    timeout_s: float = 30.0,
+) -> ViewCountReport:
+    """Send ``viewers * repeats`` view POSTs and compare the stored count."""
+    movie_id = movie_id or await find_movie_id(request)
+    url = f"{base_url()}/api/videos/{movie_id}/view"
+    report = ViewCountReport(viewers)
+
+    # Start from an empty buffer, so earlier views do not land in the delta.
+    await flush(request)
+    report.before = await asyncio.to_thread(total_views, movie_id)
+
+    ids = [uuid.uuid4().hex for _ in range(viewers)]
+    limit = asyncio.Semaphore(concurrency)
+
+    async def view(viewer: str) -> None:
+        async with limit:
+            sent = time.perf_counter()
+            try:
+                response = await request.post(url, headers={"cookie": f"{VIEWER_COOKIE}={viewer}"})
+                payload = await response.json() if response.ok else {}
+            except async_api.Error:
+                response, payload = None, {}
+            report.latency.record((time.perf_counter() - sent) * 1000)
+            report.requests += 1
+            if response is None or not response.ok:
+                report.errors += 1
+            elif payload.get("counted"):
+                report.counted += 1
+
+    started = time.monotonic()
+    # Interleave the repeats so duplicates race the first view of a viewer.
+    await asyncio.gather(*(view(viewer) for _ in range(repeats) for viewer in ids))
+    report.elapsed_s = time.monotonic() - started
+
+    if not wait_for_timer:
+        await flush(request)
+        report.after = await asyncio.to_thread(total_views, movie_id)
+        return report
+
+    deadline = time.monotonic() + timeout_s
+    while True:
+        report.after = await asyncio.to_thread(total_views, movie_id)
+        if report.delta >= viewers or time.monotonic() >= deadline:
+            return report
+        await asyncio.sleep(0.5)
+
+
+async def _main(args: argparse.Namespace) -> int:
+    context = await session.new_context()
+    try:
+        report = await run(
+            context.request, args.viewers, args.repeats, args.concurrency,
+            movie_id=args.movie_id, wait_for_timer=args.wait_for_timer,
+        )
+    finally:
+        await session.close_context(context)
+
+    summary = report.summary()
+    print(
+        f"{summary['requests']} requests from {report.viewers} viewers at "
+        f"{summary['requestsPerSecond']} req/s, p99 {summary['latency']['p99_ms']} ms: "
+        f"counted {report.counted}, total_views +{report.delta}, errors {report.errors}"
+    )
+    if not report.exact:
+        print(f"FAILED: expected exactly {report.viewers} views")
+        return 1
+    return 0
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--viewers", type=int, default=1000, help="distinct viewer ids")
+    parser.add_argument("--repeats", type=int, default=3, help="views sent per viewer")
+    parser.add_argument("--concurrency", type=int, default=200, help="requests in flight")
+    parser.add_argument("--movie-id", help="movie to view (default: first featured)")
+    parser.add_argument(
+        "--wait-for-timer", action="store_true",
+        help="wait for the periodic flush instead of forcing one",
+    )
+    args = parser.parse_args(argv)
+    try:
+        return asyncio.run(_main(args))
+    except (ViewCountError, seed.SeedError) as exc:
+        print(exc, file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
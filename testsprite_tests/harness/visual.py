@@ -0,0 +1,459 @@
+"""Responsive screenshot matrix with a vectorized baseline diff.
+
+TC011 used to scroll one 1280x720 page up and down and look for a string
+the app never renders.  :func:`run_matrix` instead loads each route in
+:data:`ROUTES` at each device profile in :data:`DEVICES`.  Every pair gets
+its own context, and they run concurrently on the runner's shared browser
+(or on one pool browser started for the matrix).  Each full-page screenshot is compared
+with ``visual_baselines/<route>@<device>.png``.
+
+:func:`diff` does the comparison in NumPy, without Python loops over
+pixels:
+
+1. Identical arrays return at once.
+2. Both images are reduced to luma.  Masked rectangles are blanked; these
+   are dynamic regions such as the hero carousel, taken from the bounding
+   boxes of the route's ``masks`` locators.
+3. The images are cut into ``tile`` x ``tile`` tiles.  Each tile gets a
+   perceptual hash: an 8x8 average hash plus the tile's mean brightness, so
+   that flat tiles which change colour are not missed.  Tiles whose hashes
+   match are skipped.
+4. Only the tiles whose hashes differ are compared pixel by pixel, against
+   ``pixel_threshold``.
+
+A 1920x1080 pair takes a few tens of milliseconds (``python -m
+harness.visual bench``).  A mismatch writes the new screenshot and a diff
+image with the changed tiles tinted to ``tmp/visual/``.
+
+NumPy and Pillow are only needed here: ``pip install numpy pillow``.
+Baselines depend on the fonts of the machine that renders them, so record
+them where the matrix runs (``--update``).  Without ``--update`` a missing
+baseline fails its shot, so a checkout without baselines cannot pass.
+
+Usage (from ``testsprite_tests/``)::
+
+    python -m harness.visual run                   # compare every route x device
+    python -m harness.visual run --update          # (re)record baselines
+    python -m harness.visual run --devices mobile --routes / /browse
+    python -m harness.visual bench                 # diff timing on 1080p pairs
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import sys
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Iterable, Sequence
+
+from playwright import async_api
+
+from . import actions, locators, session
+from .config import TESTS_DIR, TMP_DIR
+
+BASELINE_DIR = TESTS_DIR / "visual_baselines"
+OUTPUT_DIR = TMP_DIR / "visual"
+
+TILE = 32
+# Luma difference (0-255) below which a pixel counts as unchanged; absorbs
+# anti-aliasing and JPEG-like noise from GPU rasterization.
+PIXEL_THRESHOLD = 24
+# Share of changed pixels tolerated before a screenshot fails.
+MAX_RATIO = 0.001
+
+DEFAULT_CONCURRENCY = 6
+
+_HASH_SIDE = 8
+
+
+class VisualError(RuntimeError):
+    """Raised when the screenshot diff cannot run."""
+
+
+@dataclass(frozen=True)
+class Device:
+    name: str
+    width: int
+    height: int
+    scale: float = 1.0
+    mobile: bool = False
+
+    def options(self) -> dict[str, Any]:
+        """``browser.new_context`` options emulating this device."""
+        return {
+            "viewport": {"width": self.width, "height": self.height},
+            "device_scale_factor": self.scale,
+            "is_mobile": self.mobile,
+            "has_touch": self.mobile,
+        }
+
+
+DEVICES: dict[str, Device] = {
+    "mobile": Device("mobile", 390, 844, 2.0, True),
+    "tablet": Device("tablet", 768, 1024, 2.0, True),
+    "desktop": Device("desktop", 1280, 720),
+    "wide": Device("wide", 1920, 1080),
+}
+
+
+@dataclass(frozen=True)
+class Route:
+    path: str
+    # Locator names (harness.locators) of regions excluded from the diff.
+    masks: tuple[str, ...] = ()
+
+    @property
+    def slug(self) -> str:
+        return self.path.strip("/").replace("/", "-") or "home"
+
+
+ROUTES: tuple[Route, ...] = (
+    Route("/", masks=("home.hero",)),
+    Route("/browse"),
+    Route("/login"),
+    Route("/signup"),
+    Route("/subscription"),
+)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        raise VisualError("the screenshot diff needs numpy: pip install numpy pillow") from None
+    return numpy
+
+
+def _pillow():
+    try:
+        from PIL import Image
+    except ImportError:
+        raise VisualError("the screenshot diff needs Pillow: pip install numpy pillow") from None
+    return Image
+
+
+def decode(png: bytes):
+    """RGB ``uint8`` array of shape ``(height, width, 3)`` from PNG bytes."""
+    np = _numpy()
+    with _pillow().open(io.BytesIO(png)) as image:
+        return np.asarray(image.convert("RGB"))
+
+
+def save(array, path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    _pillow().fromarray(array).save(path)
+
+
+@dataclass
+class Diff:
+    width: int
+    height: int
+    tile: int = TILE
+    # Top-left pixel of every tile with changed pixels.
+    changed_tiles: list[tuple[int, int]] = field(default_factory=list)
+    changed_pixels: int = 0
+    size_mismatch: bool = False
+    elapsed_ms: float = 0.0
+
+    @property
+    def ratio(self) -> float:
+        if self.size_mismatch:
+            return 1.0
+        return self.changed_pixels / max(1, self.width * self.height)
+
+    def passed(self, max_ratio: float = MAX_RATIO) -> bool:
+        return not self.size_mismatch and self.ratio <= max_ratio
+
+
+def _luma(np, rgb):
+    # ITU-R BT.601 weights in 8.8 fixed point; the sum fits in uint16.  In-place
+    # arithmetic keeps this to three temporaries for a full-page image.
+    luma = rgb[..., 0].astype(np.uint16)
+    luma *= 77
+    for channel, weight in ((1, 150), (2, 29)):
+        term = rgb[..., channel].astype(np.uint16)
+        term *= weight
+        luma += term
+    luma >>= 8
+    return luma.astype(np.uint8)
+
+
+def _block_sums(np, luma, step: int):
+    """Sum of each ``step`` x ``step`` block.
+
+    Strided adds are several times faster than ``reshape(...).sum(axis=...)``,
+    which reduces over a non-contiguous axis.
+    """
+    cols = luma[:, 0::step].astype(np.uint16)
+    for offset in range(1, step):
+        cols += luma[:, offset::step]
+    blocks = cols[0::step].copy()
+    for offset in range(1, step):
+        blocks += cols[offset::step]
+    return blocks
+
+
+def _tile_hashes(np, luma, tile: int):
+    """Per-tile ``(bits, mean)``: an 8x8 average hash and the mean brightness."""
+    rows, cols = luma.shape[0] // tile, luma.shape[1] // tile
+    step = tile // _HASH_SIDE
+    blocks = _block_sums(np, luma, step).reshape(rows, _HASH_SIDE, cols, _HASH_SIDE)
+    blocks = blocks.transpose(0, 2, 1, 3)
+    means = blocks.mean(axis=(2, 3), keepdims=True)
+    bits = (blocks > means).reshape(rows, cols, _HASH_SIDE * _HASH_SIDE)
+    return bits, means.reshape(rows, cols) / (step * step)
+
+
+def diff(
+    baseline,
+    actual,
+    masks: Iterable[tuple[int, int, int, int]] = (),
+    *,
+    tile: int = TILE,
+    pixel_threshold: int = PIXEL_THRESHOLD,
+) -> Diff:
+    """Compare two RGB arrays, ignoring the ``(x, y, width, height)`` ``masks``."""
+    if tile % _HASH_SIDE or tile > 128:
+        # Past 128 the uint16 block sums of a hash cell could overflow.
+        raise ValueError(f"tile must be a multiple of {_HASH_SIDE} up to 128")
+    np = _numpy()
+    started = time.perf_counter()
+    height, width = actual.shape[:2]
+    result = Diff(width, height, tile)
+    if baseline.shape != actual.shape:
+        result.size_mismatch = True
+    elif not np.array_equal(baseline, actual):
+        a, b = _luma(np, baseline), _luma(np, actual)
+        for x, y, w, h in masks:
+            a[y:y + h, x:x + w] = 0
+            b[y:y + h, x:x + w] = 0
+        pad = ((0, -height % tile), (0, -width % tile))
+        if any(after for _, after in pad):
+            # Constant padding is equal in both, so it never counts as changed
+            a, b = np.pad(a, pad, mode="constant"), np.pad(b, pad, mode="constant")
+        bits_a, mean_a = _tile_hashes(np, a, tile)
+        bits_b, mean_b = _tile_hashes(np, b, tile)
+        suspect = (bits_a != bits_b).any(axis=2) | (np.abs(mean_a - mean_b) > pixel_threshold)
+        if suspect.any():
+            rows, cols = suspect.shape
+            ty, tx = np.nonzero(suspect)
+            tiles_a = a.reshape(rows, tile, cols, tile).transpose(0, 2, 1, 3)[ty, tx]
+            tiles_b = b.reshape(rows, tile, cols, tile).transpose(0, 2, 1, 3)[ty, tx]
+            changed = np.abs(tiles_a.astype(np.int16) - tiles_b) > pixel_threshold
+            per_tile = changed.sum(axis=(1, 2))
+            hit = per_tile > 0
+            result.changed_pixels = int(per_tile.sum())
+            result.changed_tiles = [
+                (int(x) * tile, int(y) * tile) for y, x in zip(ty[hit], tx[hit])
+            ]
+    result.elapsed_ms = (time.perf_counter() - started) * 1000
+    return result
+
+
+def highlight(actual, result: Diff):
+    """Copy of ``actual`` with the changed tiles tinted red."""
+    np = _numpy()
+    marked = actual.copy()
+    for x, y in result.changed_tiles:
+        region = marked[y:y + result.tile, x:x + result.tile]
+        region[..., 0] = np.maximum(region[..., 0], 200)
+        region[..., 1:] //= 2
+    return marked
+
+
+@dataclass
+class Shot:
+    route: Route
+    device: Device
+    # "match", "changed", "missing" (no baseline), or with --update
+    # "new" (recorded) or "updated"
+    status: str
+    diff: Diff | None = None
+
+    @property
+    def name(self) -> str:
+        return f"{self.route.slug}@{self.device.name}"
+
+    @property
+    def passed(self) -> bool:
+        return self.status not in ("changed", "missing")
+
+    def describe(self) -> str:
+        if self.diff is None:
+            return f"{self.name}: {self.status}"
+        if self.diff.size_mismatch:
+            return f"{self.name}: {self.status}, page size changed"
+        return (
+            f"{self.name}: {self.status}, {self.diff.ratio:.3%} of pixels in "
+            f"{len(self.diff.changed_tiles)} tiles ({self.diff.elapsed_ms:.0f} ms)"
+        )
+
+
+async def _mask_rects(
+    page: async_api.Page, names: Sequence[str], scale: float
+) -> list[tuple[int, int, int, int]]:
+    rects = []
+    for name in names:
+        box = await locators.get(page, name).bounding_box()
+        if box is None:
+            continue
+        rects.append(tuple(
+            max(0, round(value * scale))
+            for value in (box["x"], box["y"], box["width"], box["height"])
+        ))
+    return rects
+
+
+async def screenshot(route: Route, device: Device) -> tuple[bytes, list[tuple[int, int, int, int]]]:
+    """Full-page PNG of ``route`` at ``device`` and the pixel rects to mask."""
+    context = await session.new_context(**device.options())
+    try:
+        page = await context.new_page()
+        await actions.goto(page, route.path)
+        await page.evaluate("() => document.fonts.ready.then(() => null)")
+        rects = await _mask_rects(page, route.masks, device.scale)
+        png = await page.screenshot(
+            full_page=True, animations="disabled", caret="hide", type="png"
+        )
+    finally:
+        await session.close_context(context)
+    return png, rects
+
+
+def compare(
+    route: Route,
+    device: Device,
+    png: bytes,
+    rects: Sequence[tuple[int, int, int, int]],
+    *,
+    update: bool = False,
+    max_ratio: float = MAX_RATIO,
+) -> Shot:
+    """Check ``png`` against its baseline, or record it with ``update``."""
+    shot = Shot(route, device, "match")
+    baseline_path = BASELINE_DIR / f"{shot.name}.png"
+    if update:
+        shot.status = "updated" if baseline_path.exists() else "new"
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_bytes(png)
+        return shot
+    if not baseline_path.exists():
+        # Nothing to compare with is a failure, not a pass
+        shot.status = "missing"
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        (OUTPUT_DIR / f"{shot.name}.actual.png").write_bytes(png)
+        return shot
+    actual = decode(png)
+    shot.diff = diff(decode(baseline_path.read_bytes()), actual, rects)
+    if not shot.diff.passed(max_ratio):
+        shot.status = "changed"
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
+        (OUTPUT_DIR / f"{shot.name}.actual.png").write_bytes(png)
+        if not shot.diff.size_mismatch:
+            save(highlight(actual, shot.diff), OUTPUT_DIR / f"{shot.name}.diff.png")
+    return shot
+
+
+async def run_matrix(
+    routes: Sequence[Route] = ROUTES,
+    devices: Iterable[Device] = DEVICES.values(),
+    *,
+    update: bool = False,
+    concurrency: int = DEFAULT_CONCURRENCY,
+    max_ratio: float = MAX_RATIO,
+) -> list[Shot]:
+    """Screenshot every route at every device, ``concurrency`` at a time.
+
+    Without a pool installed (a script run on its own) one is started for the
+    matrix, so the contexts still share a single browser.
+    """
+    if session.current_pool() is None:
+        from .pool import BrowserPool
+
+        async with async_api.async_playwright() as pw:
+            async with BrowserPool(pw, 1) as pool:
+                with session.use_pool(pool):
+                    return await run_matrix(
+                        routes, devices, update=update, concurrency=concurrency,
+                        max_ratio=max_ratio,
+                    )
+    limit = asyncio.Semaphore(max(1, concurrency))
+
+    async def one(route: Route, device: Device) -> Shot:
+        async with limit:
+            png, rects = await screenshot(route, device)
+        # Decoding and diffing are CPU-bound; keep the event loop free.
+        return await asyncio.to_thread(
+            compare, route, device, png, rects, update=update, max_ratio=max_ratio
+        )
+
+    return list(await asyncio.gather(
+        *(one(route, device) for device in devices for route in routes)
+    ))
+
+
+def bench(width: int = 1920, height: int = 1080, repeat: int = 20) -> dict[str, float]:
+    """Mean :func:`diff` time in ms for identical, one-change and noisy pairs."""
+    np = _numpy()
+    rng = np.random.default_rng(0)
+    # Flat panels with some texture, roughly like a dark UI.
+    base = np.repeat(
+        np.repeat(rng.integers(0, 64, (height // 40 + 1, width // 40 + 1, 3), dtype=np.uint8),
+                  40, axis=0), 40, axis=1,
+    )[:height, :width].copy()
+    changed = base.copy()
+    changed[300:340, 500:900] = 255
+    noisy = base.copy()
+    noisy[::7, ::5] ^= 8
+    cases = {"identical": base.copy(), "one change": changed, "noise only": noisy}
+    timings = {}
+    for label, other in cases.items():
+        started = time.perf_counter()
+        for _ in range(repeat):
+            diff(base, other)
+        timings[label] = (time.perf_counter() - started) * 1000 / repeat
+    return timings
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser("run", help="screenshot the matrix and diff it against baselines")
+    run.add_argument("--devices", nargs="+", choices=list(DEVICES), default=list(DEVICES))
+    run.add_argument("--routes", nargs="+", metavar="PATH",
+                     help=f"routes to check (default: {' '.join(r.path for r in ROUTES)})")
+    run.add_argument("--update", action="store_true", help="record new baselines")
+    run.add_argument("-j", "--concurrency", type=int, default=DEFAULT_CONCURRENCY)
+    timing = commands.add_parser("bench", help="time the diff on synthetic image pairs")
+    timing.add_argument("--width", type=int, default=1920)
+    timing.add_argument("--height", type=int, default=1080)
+    timing.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "bench":
+            for label, ms in bench(args.width, args.height, args.repeat).items():
+                print(f"{label:<12} {ms:6.1f} ms")
+            return 0
+        unknown = sorted(set(args.routes or ()) - {route.path for route in ROUTES})
+        if unknown:
+            parser.error(f"unknown routes: {' '.join(unknown)} (choose from "
+                         f"{' '.join(route.path for route in ROUTES)})")
+        routes = [route for route in ROUTES if not args.routes or route.path in args.routes]
+        devices = [DEVICES[name] for name in args.devices]
+        shots = asyncio.run(
+            run_matrix(routes, devices, update=args.update, concurrency=args.concurrency)
+        )
+    except VisualError as exc:
+        print(exc, file=sys.stderr)
+        return 2
+    for shot in shots:
+        print(shot.describe())
+    return 0 if all(shot.passed for shot in shots) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,190 @@
+"""Core Web Vitals for every page load in a test.
+
+The TC scripts assert on visible text, which says nothing about how long
+``/`` (``getMovieCategories``), ``/browse`` (the full ``select("*")``) or
+``/watch/[id]`` (three movie queries) take to render and hydrate.
+:func:`install` adds an init script to a context that runs
+``PerformanceObserver``\\ s in every document for FCP, LCP, CLS (largest
+session window), INP (the longest interaction, or the 98th percentile once
+there are 50 or more), long tasks with their total blocking time, and
+resource timing grouped by initiator type.  The report for a document is
+collected when the page hides (through an exposed binding) or when the test
+closes the context, whichever comes first.
+
+Each report is kept in the recorder's ``vitals`` list, which ends up in the
+test result, and its numbers are recorded under ``vital:<name> <route>``
+(``vital:lcp /watch/[id]``); TTFB is already recorded as ``nav:ttfb``.
+:func:`check_routes` applies :data:`DEFAULT_ROUTE_BUDGETS` (override them
+with ``vitalsBudgets`` in ``tmp/config.json``) at the 75th percentile to
+every route the test loaded.  Budgets declared in the test plan can use the
+same keys.  Only full document loads are measured, not client-side
+transitions.
+"""
+
+from __future__ import annotations
+
+import weakref
+from typing import Any
+
+from playwright import async_api
+
+from . import budgets, metrics
+from .config import base_url, load_config
+
+# Upper bounds of web.dev's "needs improvement" band: a page over these is
+# poor, which is a regression worth failing a test for.
+_POOR = {"ttfb": 1800, "fcp": 3000, "lcp": 4000, "cls": 0.25, "inp": 500, "tbt": 600}
+DEFAULT_ROUTE_BUDGETS: dict[str, dict[str, float]] = {
+    "/": dict(_POOR),
+    "/browse": dict(_POOR),
+    "/watch/[id]": dict(_POOR),
+}
+
+BUDGET_STAT = "p75_ms"
+
+_RECORDED = ("fcp", "lcp", "cls", "inp", "tbt")
+
+_BINDING = "__mafiluVitals"
+
+_COLLECTOR_JS = """(() => {
+    if (window.__mafiluVitalsFlush) return;
+    const data = { fcp: null, lcp: null, cls: 0, longTasks: 0, tbt: 0 };
+    const observe = (type, onEntry, options = {}) => {
+        try {
+            new PerformanceObserver((list) => list.getEntries().forEach(onEntry))
+                .observe({ type, buffered: true, ...options });
+        } catch (e) {}
+    };
+    observe("paint", (e) => { if (e.name === "first-contentful-paint") data.fcp = e.startTime; });
+    observe("largest-contentful-paint", (e) => { data.lcp = e.startTime; });
+    let session = 0, sessionStart = 0, lastShift = 0;
+    observe("layout-shift", (e) => {
+        if (e.hadRecentInput) return;
+        if (e.startTime - lastShift > 1000 || e.startTime - sessionStart > 5000) {
+            session = 0;
+            sessionStart = e.startTime;
+        }
+        session += e.value;
+        lastShift = e.startTime;
+        data.cls = Math.max(data.cls, session);
+    });
+    const interactions = new Map();
+    observe("event", (e) => {
+        if (!e.interactionId) return;
+        interactions.set(e.interactionId, Math.max(interactions.get(e.interactionId) || 0, e.duration));
+    }, { durationThreshold: 16 });
+    observe("longtask", (e) => {
+        data.longTasks += 1;
+        data.tbt += Math.max(0, e.duration - 50);
+    });
+    let sent = false;
+    window.__mafiluVitalsFlush = (viaBinding) => {
+        if (sent) return null;
+        sent = true;
+        const nav = performance.getEntriesByType("navigation")[0];
+        const resources = {};
+        for (const r of performance.getEntriesByType("resource")) {
+            const group = resources[r.initiatorType] ||= { count: 0, transferKB: 0, maxMs: 0 };
+            group.count += 1;
+            group.transferKB += r.transferSize / 1024;
+            group.maxMs = Math.max(group.maxMs, r.duration);
+        }
+        const durations = [...interactions.values()].sort((a, b) => b - a);
+        const report = {
+            url: location.href,
+            ttfb: nav ? nav.responseStart - nav.startTime : null,
+            ...data,
+            inp: durations.length ? durations[Math.floor(durations.length / 50)] : null,
+            interactions: durations.length,
+            resources,
+        };
+        if (viaBinding && window.__mafiluVitals) window.__mafiluVitals(report);
+        return report;
+    };
+    addEventListener("pagehide", () => window.__mafiluVitalsFlush(true));
+})()"""
+
+_FLUSH_JS = "() => window.__mafiluVitalsFlush ? window.__mafiluVitalsFlush(false) : null"
+
+# Contexts outlive tests in the pool and init scripts cannot be removed, so
+# the collector is installed once per context and pointed at the current
+# test's recorder.
+_installed: weakref.WeakSet[async_api.BrowserContext] = weakref.WeakSet()
+_targets: dict[async_api.BrowserContext, metrics.Recorder] = {}
+
+
+def _route(url: str) -> str | None:
+    """``/watch/[id]`` for a page of the app, ``None`` for anything else."""
+    if not url.startswith(base_url()):
+        return None
+    route = metrics.endpoint_key("GET", url).split(" ", 1)[1]
+    return None if route.startswith("/__harness") else route
+
+
+def record(recorder: metrics.Recorder, report: dict[str, Any]) -> None:
+    """Store a page's report on ``recorder`` and record its numbers by route."""
+    route = _route(report.get("url", ""))
+    if route is None:
+        return
+    for group in report.get("resources", {}).values():
+        group["transferKB"] = round(group["transferKB"], 1)
+    recorder.vitals.append({"route": route, **report})
+    for name in _RECORDED:
+        value = report.get(name)
+        if value is not None:
+            recorder.record(f"vital:{name} {route}", value)
+
+
+def _on_report(source: dict[str, Any], report: dict[str, Any]) -> None:
+    recorder = _targets.get(source["context"])
+    if recorder is not None:
+        record(recorder, report)
+
+
+async def install(context: async_api.BrowserContext, recorder: metrics.Recorder) -> None:
+    """Collect vitals for every document ``context`` loads into ``recorder``."""
+    if context not in _installed:
+        await context.expose_binding(_BINDING, _on_report)
+        await context.add_init_script(_COLLECTOR_JS)
+        _installed.add(context)
+    _targets[context] = recorder
+
+
+async def uninstall(context: async_api.BrowserContext) -> None:
+    """Collect the reports of the open pages and stop recording ``context``."""
+    recorder = _targets.pop(context, None)
+    if recorder is None:
+        return
+    for page in context.pages:
+        try:
+            report = await page.evaluate(_FLUSH_JS)
+        except async_api.Error:
+            continue
+        if report:
+            record(recorder, report)
+
+
+def route_budgets() -> dict[str, dict[str, float]]:
+    """Per-route limits: ``vitalsBudgets`` from config over the defaults."""
+    merged = {route: dict(limits) for route, limits in DEFAULT_ROUTE_BUDGETS.items()}
+    for route, limits in load_config().get("vitalsBudgets", {}).items():
+        merged.setdefault(route, {}).update(limits)
+    return merged
+
+
+def _key(name: str, route: str) -> str:
+    return f"nav:{name} {route}" if name == "ttfb" else f"vital:{name} {route}"
+
+
+def check_routes(recorder: metrics.Recorder | None = None) -> None:
+    """Assert the route budgets for every route the test measured."""
+    recorder = recorder or metrics.current()
+    declared = [
+        budgets.Budget(_key(name, route), BUDGET_STAT, float(limit))
+        for route, limits in route_budgets().items()
+        for name, limit in limits.items()
+    ]
+    measured = [item for item in declared if item.key in recorder.histograms]
+    failures = budgets.evaluate(measured, recorder)
+    if failures:
+        raise budgets.BudgetExceeded("; ".join(failures))